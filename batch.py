@@ -0,0 +1,348 @@
+"""
+Phase 2 – Headless batch GZ computation.
+
+Reads loading conditions from a CSV file and writes KN / GZ for every
+condition as soon as it is computed, so a batch of any size runs in
+constant memory. No prompts; matplotlib is imported only when a plot
+is requested.
+
+Conditions file (CSV with a header row):
+    KG, draft                 required
+    heel_min, heel_max        heel range in degrees (default 0, 30)
+    n_heel                    number of heel angles (default 31)
+    NX, NZ                    mesh resolution (default 61, 61)
+
+Every row is checked before anything is written: at least one heel
+angle (three with --criteria), heel_max > heel_min and NX, NZ >= 2.
+
+Usage:
+    python batch.py conditions.csv -o results.csv
+    python batch.py conditions.csv -o results.npz --plot gz.png
+    python batch.py conditions.csv -o results.csv --backend numba
+    python batch.py conditions.csv -o results.csv --criteria criteria.csv
+    python batch.py conditions.csv -o results.csv --hull box
+    python batch.py conditions.csv -o results.csv --offsets table.csv
+
+--hull picks a hull form of geometry.registry (default wigley, sized by
+--L --B --T); --offsets lofts the hull from an offset table file (see
+geometry.offsets).
+
+--backend overrides $GZ_BACKEND (see hydrostatics.backends).
+
+--criteria writes one row per condition: condition, KG, draft, the
+stability metrics and pass flags of hydrostatics.criteria (IS Code
+2008, Part A, 2.2). The 40 deg criteria need heel_max >= 40.
+
+CSV output has one row per (condition, heel): condition, KG, draft,
+heel, KN, GZ. NPZ output has one member per condition ("000000", ...),
+a structured array with hydrostatics.parallel.RESULT_DTYPE fields.
+"""
+
+import argparse
+import csv
+import sys
+import zipfile
+
+import numpy as np
+
+from geometry.offsets import read_offset_table
+from geometry.registry import available_hulls, hull_mesh, hull_parameters
+from hydrostatics.backends import available_backends, set_backend
+from hydrostatics.criteria import criteria_dtype, evaluate_criteria
+from hydrostatics.parallel import RESULT_DTYPE
+from hydrostatics.sweep import compute_KN_GZ
+
+DEFAULTS = {
+    "heel_min": 0.0,
+    "heel_max": 30.0,
+    "n_heel": 31,
+    "NX": 61,
+    "NZ": 61,
+}
+
+
+def _check_condition(cond, min_heels):
+    """
+    Reason a condition cannot be computed, or None.
+    """
+
+    if cond["n_heel"] < min_heels:
+        return f"n_heel must be at least {min_heels}, got {cond['n_heel']}"
+    if cond["heel_max"] <= cond["heel_min"]:
+        return (f"heel_max ({cond['heel_max']:g}) must be greater than "
+                f"heel_min ({cond['heel_min']:g})")
+    if min(cond["NX"], cond["NZ"]) < 2:
+        return f"NX and NZ must be at least 2, got {cond['NX']}, {cond['NZ']}"
+    return None
+
+
+def read_conditions(path, min_heels=1):
+    """
+    Yield loading conditions from a CSV file, one dict per row.
+
+    Rows that cannot be computed (fewer than min_heels heel angles, an
+    empty or descending heel range, NX or NZ below 2) raise ValueError
+    with their line number.
+    """
+
+    with open(path, newline="") as fh:
+        reader = csv.DictReader(fh)
+
+        missing = {"KG", "draft"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(
+                f"{path}: missing column(s) {', '.join(sorted(missing))}."
+            )
+
+        for line, row in enumerate(reader, start=2):
+            try:
+                cond = {
+                    key: type(default)(row.get(key) or default)
+                    for key, default in DEFAULTS.items()
+                }
+                cond["KG"] = float(row["KG"])
+                cond["draft"] = float(row["draft"])
+            except ValueError as err:
+                raise ValueError(f"{path}, line {line}: {err}") from None
+
+            err = _check_condition(cond, min_heels)
+            if err is not None:
+                raise ValueError(f"{path}, line {line}: {err}.")
+
+            yield cond
+
+
+def run_condition(cond, L, B, T, hull="wigley", table=None):
+    """
+    Heel angles, KN and GZ of one loading condition.
+
+    The hull comes from geometry.registry: L, B, T, the condition's
+    NX, NZ and the offset table, as far as the generator takes them.
+    """
+
+    params = {"L": L, "B": B, "T": T, "NX": cond["NX"], "NZ": cond["NZ"]}
+    params.update(table or {})
+
+    names = hull_parameters(hull)
+    mesh = hull_mesh(hull, **{k: v for k, v in params.items() if k in names})
+    angles = np.linspace(cond["heel_min"], cond["heel_max"], cond["n_heel"])
+
+    KN, GZ = compute_KN_GZ(mesh, None, cond["KG"], cond["draft"], angles)
+
+    return angles, KN, GZ
+
+
+def _records(cond, angles, KN, GZ):
+    rec = np.empty(len(angles), dtype=RESULT_DTYPE)
+    rec["KG"] = cond["KG"]
+    rec["draft"] = cond["draft"]
+    rec["heel"] = angles
+    rec["KN"] = KN
+    rec["GZ"] = GZ
+    return rec
+
+
+class _CsvSink:
+    """
+    Rows of every condition, flushed as each condition finishes.
+    """
+
+    def __init__(self, path):
+        self.fh = open(path, "w", newline="")
+        self.writer = csv.writer(self.fh)
+        self.writer.writerow(("condition",) + RESULT_DTYPE.names)
+
+    def write(self, index, rec):
+        self.writer.writerows(
+            (index,) + tuple(float(x) for x in row) for row in rec
+        )
+        self.fh.flush()
+
+    def close(self):
+        self.fh.close()
+
+
+class _NpzSink:
+    """
+    One .npy member per condition, appended to the archive as it
+    finishes (readable with np.load).
+    """
+
+    def __init__(self, path):
+        self.zf = zipfile.ZipFile(path, "w", allowZip64=True)
+
+    def write(self, index, rec):
+        with self.zf.open(f"{index:06d}.npy", "w", force_zip64=True) as fh:
+            np.lib.format.write_array(fh, rec)
+
+    def close(self):
+        self.zf.close()
+
+
+class _CriteriaSink:
+    """
+    Criteria table, one row per condition, flushed as each condition
+    finishes.
+    """
+
+    def __init__(self, path):
+        self.fh = open(path, "w", newline="")
+        self.writer = csv.writer(self.fh)
+        self.writer.writerow(
+            ("condition", "KG", "draft") + criteria_dtype().names
+        )
+
+    def write(self, index, cond, angles, GZ):
+        row = evaluate_criteria(angles, GZ)[0]
+        self.writer.writerow(
+            (index, cond["KG"], cond["draft"])
+            + tuple(row.tolist())
+        )
+        self.fh.flush()
+
+    def close(self):
+        self.fh.close()
+
+
+def run_batch(conditions_path, output_path, L=100.0, B=20.0, T=10.0,
+              plot=None, plot_max=50, log=None, criteria=None,
+              hull="wigley", offsets=None):
+    """
+    Compute every condition of a conditions file and stream the results.
+
+    Parameters
+    ----------
+    conditions_path : str
+    output_path : str
+        .csv or .npz
+    L, B, T : float
+        Hull dimensions (box and Wigley)
+    plot : str, optional
+        Save GZ curves of the first plot_max conditions to this image
+    plot_max : int
+    log : file, optional
+        Progress output (one line per condition)
+    criteria : str, optional
+        Write the stability criteria of every condition to this .csv
+    hull : str
+        Hull form of geometry.registry
+    offsets : str, optional
+        Offset table file for the "offsets" hull
+
+    Returns
+    -------
+    n : int
+        Number of conditions computed
+    """
+
+    if not output_path.endswith((".csv", ".npz")):
+        raise ValueError("Output file must end in .csv or .npz.")
+
+    # The criteria need 3 heel angles (hydrostatics.criteria)
+    min_heels = 3 if criteria else 1
+
+    # Validate every row before any output is written (one streaming
+    # pass, constant memory)
+    for _ in read_conditions(conditions_path, min_heels):
+        pass
+
+    table = read_offset_table(offsets) if offsets else None
+
+    if output_path.endswith(".npz"):
+        sink = _NpzSink(output_path)
+    else:
+        sink = _CsvSink(output_path)
+
+    crit = _CriteriaSink(criteria) if criteria else None
+
+    ax = None
+    if plot:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots()
+
+    n = 0
+    try:
+        conditions = read_conditions(conditions_path, min_heels)
+        for n, cond in enumerate(conditions, start=1):
+            angles, KN, GZ = run_condition(cond, L, B, T, hull, table)
+            sink.write(n - 1, _records(cond, angles, KN, GZ))
+            if crit is not None:
+                crit.write(n - 1, cond, angles, GZ)
+
+            if ax is not None and n <= plot_max:
+                ax.plot(angles, GZ,
+                        label=f"KG={cond['KG']:g}, T={cond['draft']:g}")
+
+            if log is not None:
+                print(f"{n:6d}  KG={cond['KG']:g}  draft={cond['draft']:g}  "
+                      f"max GZ={GZ.max():.4f}", file=log)
+    finally:
+        sink.close()
+        if crit is not None:
+            crit.close()
+
+    if ax is not None:
+        ax.axhline(0, color="k", linestyle="--")
+        ax.set_xlabel("Heel angle (deg)")
+        ax.set_ylabel("GZ (m)")
+        ax.set_title("GZ curves – Phase 2 (3D Hull Method)")
+        ax.grid(True)
+        if min(n, plot_max) <= 10:
+            ax.legend()
+        fig.savefig(plot, dpi=150)
+        plt.close(fig)
+
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Headless batch GZ computation."
+    )
+    parser.add_argument("conditions", help="loading conditions CSV file")
+    parser.add_argument("-o", "--output", required=True,
+                        help="results file (.csv or .npz)")
+    parser.add_argument("--L", type=float, default=100.0)
+    parser.add_argument("--B", type=float, default=20.0)
+    parser.add_argument("--T", type=float, default=10.0)
+    parser.add_argument("--hull", choices=available_hulls(),
+                        help="hull form (default: wigley, or offsets "
+                             "with --offsets)")
+    parser.add_argument("--offsets", metavar="CSV",
+                        help="offset table of the offsets hull")
+    parser.add_argument("--plot", metavar="IMAGE",
+                        help="save GZ curves to an image file")
+    parser.add_argument("--plot-max", type=int, default=50,
+                        help="conditions drawn in the plot")
+    parser.add_argument("--backend", choices=["auto"] + available_backends(),
+                        help="compute backend (default: $GZ_BACKEND or auto)")
+    parser.add_argument("--criteria", metavar="CSV",
+                        help="write the stability criteria per condition")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        set_backend(args.backend)
+
+    hull = args.hull or ("offsets" if args.offsets else "wigley")
+    if hull == "offsets" and not args.offsets:
+        parser.error("the offsets hull needs --offsets")
+
+    n = run_batch(
+        args.conditions, args.output, args.L, args.B, args.T,
+        plot=args.plot, plot_max=args.plot_max,
+        log=None if args.quiet else sys.stdout, criteria=args.criteria,
+        hull=hull, offsets=args.offsets
+    )
+
+    if not args.quiet:
+        print(f"{n} conditions written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Scaling benchmark for parallel loading-condition sweeps.
+
+Times hydrostatics.parallel.run_loading_sweep over a KG x draft x heel
+grid at 1, 2, 4 and 8 workers on a 61x61 Wigley hull.
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel
+"""
+
+import time
+
+import numpy as np
+
+from geometry.hull import wigley_hull
+from hydrostatics.parallel import run_loading_sweep
+
+
+def main():
+    # ----------------------------
+    # Hull (built once)
+    # ----------------------------
+    L, B, T = 100.0, 20.0, 10.0
+    NX, NZ = 61, 61
+
+    v, f = wigley_hull(L, B, T, NX, NZ)
+
+    # ----------------------------
+    # Loading grid
+    # ----------------------------
+    KG_values = np.linspace(1.0, 5.0, 9)
+    drafts = np.linspace(3.0, 8.0, 64)
+    angles = np.linspace(0, 30, 31)
+
+    print(f"Faces: {len(f)}   conditions: "
+          f"{len(KG_values)} KG x {len(drafts)} drafts x {len(angles)} heel")
+    print("\nWorkers   Time (s)   Speedup")
+
+    reference = None
+    t_serial = None
+
+    for workers in (1, 2, 4, 8):
+        t0 = time.perf_counter()
+        res = run_loading_sweep(v, f, KG_values, drafts, angles,
+                                workers=workers)
+        dt = time.perf_counter() - t0
+
+        if reference is None:
+            reference = res
+            t_serial = dt
+        else:
+            assert np.allclose(res["GZ"], reference["GZ"])
+
+        print(f"{workers:7d}   {dt:8.3f}   {t_serial / dt:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
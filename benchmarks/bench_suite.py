@@ -0,0 +1,311 @@
+"""
+Benchmark suite: mesh build, clip, integration and GZ sweep.
+
+Times every stage of the pipeline on Wigley meshes from 31x31 to
+501x501 and the GZ sweep over several heel ranges, records time,
+throughput (faces per second) and peak traced memory, and compares
+them with a JSON baseline. Every run also checks KN of a subdivided
+box hull against its exact value, so a speedup cannot quietly cost
+accuracy.
+
+Stages:
+    surface      sample_wigley_surface
+    triangulate  triangulate_surface
+    close        mirror_mesh + close_deck + close_end (bow and stern)
+    loft         loft_sections (the watertight hull of the builders)
+    clip         clip_mesh_at_draft at one heel
+    integrate    volume_and_centroid of the clipped mesh
+    fused        submerged_volume_and_centroid at the same heel (clip
+                 and integrate in one pass, no submerged mesh)
+    gz           compute_KN_GZ over a heel range (the sweep behind
+                 main.compute_GZ_curve)
+
+Run from the repository root:
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --sizes 31 61 --save base.json
+    python -m benchmarks.bench_suite --baseline base.json
+
+Exits with status 1 on a regression or a failed accuracy check.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from geometry.mesh import (
+    triangulate_surface, mirror_mesh, close_deck, close_end, loft_sections
+)
+from geometry.registry import hull_mesh
+from geometry.surface import sample_wigley_surface
+from geometry.transform import rotate_about_x
+from hydrostatics.clip import clip_mesh_at_draft
+from hydrostatics.fused import submerged_volume_and_centroid
+from hydrostatics.sweep import compute_KN_GZ
+from hydrostatics.volume_centroid import volume_and_centroid
+
+L, B, T = 100.0, 20.0, 10.0
+DRAFT = 6.0
+CLIP_HEEL = 20.0
+
+SIZES = (31, 61, 121, 251, 501)
+
+# name: (first, last, count) in degrees
+HEEL_RANGES = {
+    "0-30x31": (0.0, 30.0, 31),
+    "0-90x91": (0.0, 90.0, 91),
+}
+
+# Relative slack before a slower / larger result counts as a regression
+TIME_TOLERANCE = 0.25
+MEMORY_TOLERANCE = 0.10
+
+# Box hull accuracy check
+BOX_N = 17                          # stations and waterlines
+BOX_DRAFT = 6.0
+BOX_ANGLES = np.linspace(0.0, 60.0, 13)
+BOX_TOLERANCE = 1e-9
+
+
+# ----------------------------
+# Measurement
+# ----------------------------
+
+def _measure(fn, repeat):
+    """
+    Best wall time over `repeat` calls, then one traced call for peak
+    memory (tracing slows numpy down, so it is kept out of the timing).
+    """
+
+    best = np.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak
+
+
+def _record(results, key, fn, n_faces, repeat):
+    seconds, peak = _measure(fn, repeat)
+
+    results[key] = {
+        "seconds": seconds,
+        "faces_per_second": n_faces / seconds,
+        "peak_bytes": peak,
+    }
+
+    print(f"{key:28s} {seconds * 1e3:10.2f} ms "
+          f"{n_faces / seconds / 1e6:9.2f} Mfaces/s "
+          f"{peak / 2**20:9.1f} MiB")
+
+
+def run_benchmarks(sizes=SIZES, heel_ranges=HEEL_RANGES, repeat=3):
+    """
+    Time every stage for every mesh size.
+
+    Returns
+    -------
+    results : dict
+        "<stage>/<n>" (and "gz/<n>/<range>") ->
+        seconds, faces_per_second, peak_bytes
+    """
+
+    results = {}
+
+    for n in sizes:
+        X, Y, Z = sample_wigley_surface(L, B, T, n, n)
+        v_half, f_half = triangulate_surface(X, Y, Z)
+
+        def close():
+            v, f = mirror_mesh(v_half, f_half)
+            v, f = close_deck(v, f)
+            v, f = close_end(v, f, -L / 2)
+            return close_end(v, f, L / 2)
+
+        v, f = close()
+        v_heel = rotate_about_x(v, np.deg2rad(CLIP_HEEL))
+        v_sub, f_sub = clip_mesh_at_draft(v_heel, f, DRAFT)
+
+        m = len(f)
+
+        _record(results, f"surface/{n}",
+                lambda: sample_wigley_surface(L, B, T, n, n), m, repeat)
+        _record(results, f"triangulate/{n}",
+                lambda: triangulate_surface(X, Y, Z), m, repeat)
+        _record(results, f"close/{n}", close, m, repeat)
+        _record(results, f"loft/{n}",
+                lambda: loft_sections(X[0], Z[:, 0], Y), m, repeat)
+        _record(results, f"clip/{n}",
+                lambda: clip_mesh_at_draft(v_heel, f, DRAFT), m, repeat)
+        _record(results, f"integrate/{n}",
+                lambda: volume_and_centroid(v_sub, f_sub), len(f_sub), repeat)
+        _record(results, f"fused/{n}",
+                lambda: submerged_volume_and_centroid(
+                    v, f, DRAFT, np.deg2rad(CLIP_HEEL)), m, repeat)
+
+        for name, (a0, a1, count) in heel_ranges.items():
+            angles = np.linspace(a0, a1, count)
+            _record(results, f"gz/{n}/{name}",
+                    lambda: compute_KN_GZ(v, f, 0.0, DRAFT, angles),
+                    m * count, repeat)
+
+    return results
+
+
+# ----------------------------
+# Accuracy: box hull
+# ----------------------------
+
+def box_KN_exact(B, T, draft, angles_deg):
+    """
+    Exact KN of a box: its section clipped by the inclined waterline.
+    """
+
+    KN = []
+    for theta in np.deg2rad(angles_deg):
+        c, s = np.cos(theta), np.sin(theta)
+
+        # Section corners (y, z), cyclic; submerged where s y + c z >= draft
+        poly = [(-B / 2, 0.0), (B / 2, 0.0), (B / 2, T), (-B / 2, T)]
+        dist = [s * y + c * z - draft for y, z in poly]
+
+        clipped = []
+        for i in range(4):
+            p, q = poly[i], poly[(i + 1) % 4]
+            dp, dq = dist[i], dist[(i + 1) % 4]
+            if dp >= 0.0:
+                clipped.append(p)
+            if (dp >= 0.0) != (dq >= 0.0):
+                t = dp / (dp - dq)
+                clipped.append((p[0] + t * (q[0] - p[0]),
+                                p[1] + t * (q[1] - p[1])))
+
+        y = np.array([p[0] for p in clipped])
+        z = np.array([p[1] for p in clipped])
+        cross = y * np.roll(z, -1) - np.roll(y, -1) * z
+        area = cross.sum() / 2.0
+        y_c = ((y + np.roll(y, -1)) * cross).sum() / (6.0 * area)
+        z_c = ((z + np.roll(z, -1)) * cross).sum() / (6.0 * area)
+
+        KN.append(abs(c * y_c - s * z_c))
+
+    return np.array(KN)
+
+
+def check_accuracy():
+    """
+    Max KN error of the sweep on a subdivided box hull.
+    """
+
+    v, f = hull_mesh("box", cache=False, L=L, B=B, T=T, NX=BOX_N, NZ=BOX_N)
+    KN, _ = compute_KN_GZ(v, f, 0.0, BOX_DRAFT, BOX_ANGLES)
+    err = float(np.max(np.abs(KN - box_KN_exact(B, T, BOX_DRAFT, BOX_ANGLES))))
+
+    ok = err <= BOX_TOLERANCE
+    print(f"\nBox hull KN max error: {err:.3e} "
+          f"({'ok' if ok else 'FAILED'}, tolerance {BOX_TOLERANCE:g})")
+
+    return {"box_KN_max_error": err, "ok": ok}
+
+
+# ----------------------------
+# Baseline comparison
+# ----------------------------
+
+def compare(results, baseline, time_tol=TIME_TOLERANCE,
+            memory_tol=MEMORY_TOLERANCE):
+    """
+    Entries slower or larger than the baseline beyond the tolerances.
+
+    Returns
+    -------
+    regressions : list of str
+    """
+
+    regressions = []
+
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+
+        if new["seconds"] > old["seconds"] * (1.0 + time_tol):
+            regressions.append(
+                f"{key}: time {old['seconds'] * 1e3:.2f} -> "
+                f"{new['seconds'] * 1e3:.2f} ms"
+            )
+        if new["peak_bytes"] > old["peak_bytes"] * (1.0 + memory_tol):
+            regressions.append(
+                f"{key}: peak memory {old['peak_bytes'] / 2**20:.1f} -> "
+                f"{new['peak_bytes'] / 2**20:.1f} MiB"
+            )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES),
+                        help="NX = NZ of the Wigley meshes")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per entry (best is kept)")
+    parser.add_argument("--save", metavar="JSON",
+                        help="write the results as a new baseline")
+    parser.add_argument("--baseline", metavar="JSON",
+                        help="compare against a saved baseline")
+    parser.add_argument("--time-tolerance", type=float,
+                        default=TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float,
+                        default=MEMORY_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    print(f"{'entry':28s} {'time':>13s} {'throughput':>18s} {'peak':>13s}")
+    results = run_benchmarks(args.sizes, repeat=args.repeat)
+    accuracy = check_accuracy()
+
+    status = 0 if accuracy["ok"] else 1
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+
+        regressions = compare(
+            results, baseline["results"],
+            args.time_tolerance, args.memory_tolerance
+        )
+        if regressions:
+            print("\nRegressions against", args.baseline)
+            for line in regressions:
+                print("  " + line)
+            status = 1
+        else:
+            print("\nNo regressions against", args.baseline)
+
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "results": results,
+                "accuracy": accuracy,
+            }, fh, indent=1, sort_keys=True)
+        print("Baseline written to", args.save)
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Backend parity checks.
+
+Runs every available compute backend (hydrostatics.backends) against
+the python reference on a subdivided box hull and a coarse Wigley
+hull: signed volume, volume and centroid of the closed hull, and
+buoyancy over a grid of drafts, heel and trim angles.
+
+Also checks that the vectorized clip_mesh_at_draft reproduces the
+vertices and faces of clip_mesh_at_draft_reference exactly (same
+order, same values) over the same grid.
+
+The heels run to 90 deg, past deck-edge immersion of both hulls (the
+box deck edge goes under at about 22 deg at draft 4 and 31 deg at
+draft 6), where the waterplane is no longer convex; the reference
+closes every waterline segment with its own cap triangle, so it stays
+exact there.
+
+Run from the repository root:
+    python -m benchmarks.parity
+    python -m benchmarks.parity --backends numpy numba
+
+Exits with status 1 when a backend differs from the reference beyond
+the tolerance.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from geometry.hull import build_wigley_hull
+from geometry.registry import hull_mesh
+from hydrostatics.backends import available_backends, get_backend
+from hydrostatics.clip import clip_mesh_at_draft, clip_mesh_at_draft_reference
+from hydrostatics.plane import heel_trim_frame
+
+L, B, T = 100.0, 20.0, 10.0
+
+DRAFTS = (4.0, 6.0, 8.0)
+HEELS = (0.0, 10.0, 20.0, 30.0, 45.0, 60.0, 75.0, 90.0)   # degrees
+TRIMS = (0.0, 2.0)                  # degrees
+
+# Relative to the hull size (lengths) or volume
+TOLERANCE = 1e-9
+
+
+def parity_hulls():
+    """
+    name -> (vertices, faces) of the parity hulls.
+    """
+
+    return {
+        "box": hull_mesh("box", cache=False, L=L, B=B, T=T, NX=5, NZ=5),
+        "wigley": build_wigley_hull(L, B, T, 21, 11),
+    }
+
+
+def _cases():
+    """
+    Drafts (K,) and rotations (K, 3, 3) of every draft x heel x trim.
+    """
+
+    d, h, t = np.meshgrid(DRAFTS, HEELS, TRIMS, indexing="ij")
+    R = np.array([
+        heel_trim_frame(np.deg2rad(a), np.deg2rad(b))
+        for a, b in zip(h.ravel(), t.ravel())
+    ])
+
+    return d.ravel(), R
+
+
+def backend_errors(backend, reference, vertices, faces):
+    """
+    Largest relative differences of one backend from the reference.
+
+    Returns
+    -------
+    errors : dict
+        signed_volume, volume, centroid, buoyancy_volume,
+        buoyancy_centroid
+    """
+
+    size = np.ptp(vertices, axis=0).max()
+    drafts, R = _cases()
+
+    vol_ref = reference.signed_volume(vertices, faces)
+    V_ref, c_ref = reference.volume_and_centroid(vertices, faces)
+    BV_ref, Bc_ref = reference.buoyancy(vertices, faces, drafts, R)
+
+    vol = backend.signed_volume(vertices, faces)
+    V, c = backend.volume_and_centroid(vertices, faces)
+    BV, Bc = backend.buoyancy(vertices, faces, drafts, R)
+
+    return {
+        "signed_volume": abs(vol - vol_ref) / vol_ref,
+        "volume": abs(V - V_ref) / V_ref,
+        "centroid": np.abs(c - c_ref).max() / size,
+        "buoyancy_volume": np.max(np.abs(BV - BV_ref) / BV_ref),
+        "buoyancy_centroid": np.abs(Bc - Bc_ref).max() / size,
+    }
+
+
+def clip_mismatches(vertices, faces):
+    """
+    Cases where the vectorized clip differs from the reference clip.
+
+    Returns
+    -------
+    mismatches : list of (draft, heel, trim, what)
+        what is "shape", "vertices" or "faces"; empty when every case
+        is identical
+    """
+
+    drafts, R = _cases()
+    d, h, t = np.meshgrid(DRAFTS, HEELS, TRIMS, indexing="ij")
+
+    mismatches = []
+
+    for k, (draft, Rk) in enumerate(zip(drafts, R)):
+        rotated = vertices @ Rk.T
+        v_ref, f_ref = clip_mesh_at_draft_reference(rotated, faces, draft)
+        v, f = clip_mesh_at_draft(rotated, faces, draft)
+
+        case = (draft, h.ravel()[k], t.ravel()[k])
+
+        if v.shape != v_ref.shape or f.shape != f_ref.shape:
+            mismatches.append(case + ("shape",))
+        elif not np.array_equal(v, v_ref):
+            mismatches.append(case + ("vertices",))
+        elif not np.array_equal(f, f_ref):
+            mismatches.append(case + ("faces",))
+
+    return mismatches
+
+
+def check_clip_parity():
+    """
+    Check the vectorized clip against the reference clip on every
+    parity hull; prints one line per hull.
+
+    Returns
+    -------
+    ok : bool
+    """
+
+    ok = True
+
+    for hull, (vertices, faces) in parity_hulls().items():
+        t0 = time.perf_counter()
+        mismatches = clip_mismatches(vertices, faces)
+        seconds = time.perf_counter() - t0
+
+        ok &= not mismatches
+
+        print(f"{hull:8s} {'clip':8s} {len(mismatches)} of "
+              f"{len(DRAFTS) * len(HEELS) * len(TRIMS)} cases differ "
+              f"{'FAILED' if mismatches else 'ok'} [{seconds:.2f} s]")
+
+        for draft, heel, trim, what in mismatches:
+            print(f"    draft {draft:g} heel {heel:g} trim {trim:g}: {what}")
+
+    return ok
+
+
+def check_parity(backends=None, tol=TOLERANCE):
+    """
+    Check every backend (default: all available) against the python
+    reference on every parity hull; prints one line per pair.
+
+    Returns
+    -------
+    ok : bool
+    """
+
+    reference = get_backend("python")
+    names = backends or [n for n in available_backends() if n != "python"]
+
+    ok = True
+
+    for hull, (vertices, faces) in parity_hulls().items():
+        for name in names:
+            backend = get_backend(name)
+
+            t0 = time.perf_counter()
+            errors = backend_errors(backend, reference, vertices, faces)
+            seconds = time.perf_counter() - t0
+
+            worst = max(errors, key=errors.get)
+            passed = errors[worst] <= tol
+            ok &= passed
+
+            print(f"{hull:8s} {name:8s} max error {errors[worst]:.2e} "
+                  f"({worst}) {'ok' if passed else 'FAILED'} "
+                  f"[{seconds:.2f} s]")
+
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+",
+                        help="backends to check (default: all available)")
+    parser.add_argument("--tol", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    ok = check_clip_parity()
+    ok &= check_parity(args.backends, args.tol)
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
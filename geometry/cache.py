@@ -0,0 +1,201 @@
+"""
+Content-addressed on-disk cache for built hull meshes.
+
+Entries are keyed by a hash of the generator name, its parameters and
+the source of the hull-construction code, so editing a generator
+invalidates its old entries automatically. Each entry stores vertices
+and faces as uncompressed .npy files that are opened with
+np.load(mmap_mode="r"), so a cache hit costs a file open instead of a
+rebuild. Meshes are returned as HullMesh, so tables derived from a
+memoized mesh (edges, sweep tables) are shared by every caller. The
+cache directory is bounded in size with least-recently-used
+eviction, and an in-process memo sits on top of it.
+
+Cache location: $GZ_MESH_CACHE, else ~/.cache/gz3d/meshes.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from geometry.hull_mesh import HullMesh
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT = 2
+
+DEFAULT_MAX_BYTES = 1 * 2**30
+MEMO_SIZE = 32
+
+# Hull-construction code whose source is part of every key
+_SOURCE_MODULES = (
+    "geometry.mesh", "geometry.spline", "geometry.surface", "geometry.wigley",
+    "geometry.hull_mesh"
+)
+
+_memo = OrderedDict()
+_code_hashes = {}
+
+
+def cache_dir():
+    """
+    Directory holding the mesh cache.
+    """
+
+    default = os.path.join(os.path.expanduser("~"), ".cache", "gz3d", "meshes")
+    return os.environ.get("GZ_MESH_CACHE", default)
+
+
+def _code_version(build):
+    """
+    Hash of the builder's module source and the shared geometry code.
+    """
+
+    module = build.__module__
+
+    if module not in _code_hashes:
+        h = hashlib.sha256()
+        h.update(str(CACHE_FORMAT).encode())
+        for name in (module,) + _SOURCE_MODULES:
+            __import__(name)
+            h.update(inspect.getsource(sys.modules[name]).encode())
+        _code_hashes[module] = h.hexdigest()
+
+    return _code_hashes[module]
+
+
+def mesh_key(name, params, build):
+    """
+    Content hash identifying a built mesh.
+
+    Parameters
+    ----------
+    name : str
+        Generator name
+    params : dict
+        JSON-serializable generator parameters
+    build : callable
+        Generator function (its source is part of the key)
+    """
+
+    payload = json.dumps(
+        {"name": name, "params": params, "code": _code_version(build)},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _entry_size(path):
+    return sum(
+        os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)
+    )
+
+
+def _evict(root, max_bytes, keep):
+    """
+    Remove least recently used entries until the cache fits max_bytes.
+    """
+
+    entries = []
+    for key in os.listdir(root):
+        path = os.path.join(root, key)
+        if key == keep or key.startswith(".") or not os.path.isdir(path):
+            continue
+        entries.append((os.path.getmtime(path), _entry_size(path), path))
+
+    total = sum(size for _, size, _ in entries)
+    total += _entry_size(os.path.join(root, keep))
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+def _load(path):
+    v = np.load(os.path.join(path, "vertices.npy"), mmap_mode="r")
+    f = np.load(os.path.join(path, "faces.npy"), mmap_mode="r")
+    return HullMesh(v, f)
+
+
+def cached_mesh(name, build, params, root=None, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Return build(**params), from the in-process memo or the disk cache
+    when available.
+
+    Parameters
+    ----------
+    name : str
+        Generator name
+    build : callable
+        Returns (vertices, faces) or a HullMesh for **params
+    params : dict
+        JSON-serializable generator parameters
+    root : str, optional
+        Cache directory (default: cache_dir())
+    max_bytes : int
+        Size bound of the disk cache
+
+    Returns
+    -------
+    mesh : HullMesh
+        Read-only (memory-mapped when loaded from disk); unpacks as
+        vertices, faces
+    """
+
+    key = mesh_key(name, params, build)
+    root = root or cache_dir()
+
+    # Per directory: the same key in another root is another entry
+    memo_key = (os.path.abspath(root), key)
+
+    if memo_key in _memo:
+        _memo.move_to_end(memo_key)
+        return _memo[memo_key]
+
+    path = os.path.join(root, key)
+
+    if os.path.isdir(path):
+        os.utime(path)
+        mesh = _load(path)
+    else:
+        built = build(**params)
+        if not isinstance(built, HullMesh):
+            built = HullMesh(*built)
+
+        os.makedirs(root, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=root)
+        np.save(os.path.join(tmp, "vertices.npy"), built.vertices)
+        np.save(os.path.join(tmp, "faces.npy"), built.faces)
+        with open(os.path.join(tmp, "meta.json"), "w") as fh:
+            json.dump({"name": name, "params": params}, fh, sort_keys=True)
+
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        _evict(root, max_bytes, keep=key)
+        mesh = _load(path)
+
+    _memo[memo_key] = mesh
+    if len(_memo) > MEMO_SIZE:
+        _memo.popitem(last=False)
+
+    return mesh
+
+
+def clear_memo():
+    """
+    Drop the in-process memo (disk entries are kept).
+    """
+
+    _memo.clear()
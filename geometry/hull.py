@@ -0,0 +1,109 @@
+"""
+Closed hull mesh builders.
+"""
+
+from geometry.surface import sample_wigley_surface
+from geometry.mesh import loft_sections
+from geometry.cache import cached_mesh
+from geometry.hull_mesh import HullMesh, ScaledHull
+
+
+def build_wigley_hull(L, B, T, NX=61, NZ=61):
+    """
+    Build the closed Wigley hull mesh (watertight, normals outward).
+
+    Parameters
+    ----------
+    L, B, T : float
+        Length, breadth and depth
+    NX, NZ : int
+        Surface points along length and depth
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    X, Y, Z = sample_wigley_surface(L, B, T, NX, NZ)
+
+    return loft_sections(X[0], Z[:, 0], Y)
+
+
+def wigley_hull(L, B, T, NX, NZ, cache=True):
+    """
+    Closed Wigley hull mesh, served from the mesh cache when possible.
+
+    Parameters
+    ----------
+    L, B, T : float
+    NX, NZ : int
+    cache : bool
+        Use geometry.cache (default); False always rebuilds
+
+    Returns
+    -------
+    mesh : HullMesh
+        Unpacks as vertices, faces
+    """
+
+    params = {
+        "L": float(L), "B": float(B), "T": float(T),
+        "NX": int(NX), "NZ": int(NZ),
+    }
+
+    if not cache:
+        return HullMesh(*build_wigley_hull(**params))
+
+    return cached_mesh("wigley", build_wigley_hull, params)
+
+
+# ----------------------------
+# Hull families
+# ----------------------------
+
+def unit_wigley_hull(NX, NZ, cache=True):
+    """
+    Wigley hull with L = B = T = 1, the base of wigley_variant.
+
+    Parameters
+    ----------
+    NX, NZ : int
+    cache : bool
+        See wigley_hull
+
+    Returns
+    -------
+    mesh : HullMesh
+    """
+
+    return wigley_hull(1.0, 1.0, 1.0, NX, NZ, cache)
+
+
+def wigley_variant(L, B, T, NX, NZ, unit=None):
+    """
+    Wigley hull of dimensions L, B, T as a scaled view of the unit hull.
+
+    The half-breadth is separable in L, B and T, and the lofted faces
+    depend only on where it is zero, so the hull built for (L, B, T)
+    is the unit hull scaled by (L, B, T) with the same faces. Every
+    variant shares the unit hull's face array and sweep tables; only
+    three factors are stored per variant.
+
+    Parameters
+    ----------
+    L, B, T : float
+    NX, NZ : int
+    unit : HullMesh, optional
+        Unit hull of the same resolution (default: unit_wigley_hull,
+        served from the mesh cache)
+
+    Returns
+    -------
+    mesh : ScaledHull
+    """
+
+    if unit is None:
+        unit = unit_wigley_hull(NX, NZ)
+
+    return ScaledHull(unit, (L, B, T))
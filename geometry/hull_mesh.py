@@ -0,0 +1,305 @@
+"""
+Compact indexed hull mesh.
+
+HullMesh keeps the vertex and face arrays contiguous and read-only,
+with faces stored as int32 (int64 only beyond 2**31 vertices), and
+derives the edge table, face normals and face areas on first use.
+Algorithms that need their own per-mesh tables (e.g. the tetrahedron
+moments of the heel sweep) store them with cached(), so repeated
+sweeps over the same mesh do not rebuild them.
+
+A HullMesh unpacks like the (vertices, faces) pair used elsewhere:
+
+    v, f = mesh
+
+and the clipping, integration, sweep and validation functions accept
+it in place of vertices, with faces=None.
+
+ScaledHull is a HullMesh scaled along its axes that shares the face
+array and edge tables of its base mesh, so a family of hulls that
+differ only in L, B and T holds one topology. The heel sweep, the
+fused clip and the compute backends apply the scale inside the clip
+(see mesh_scale); other functions use the scaled vertices, built on
+first use.
+"""
+
+import numpy as np
+
+
+class HullMesh:
+    """
+    Closed triangular hull surface.
+
+    Parameters
+    ----------
+    vertices : array_like (N, 3)
+    faces : array_like (M, 3)
+        Vertex indices
+
+    Attributes
+    ----------
+    vertices : ndarray (N, 3)
+        float64, read-only
+    faces : ndarray (M, 3)
+        int32 (int64 for very large meshes), read-only
+    """
+
+    __slots__ = (
+        "vertices", "faces",
+        "_edges", "_face_edges", "_normals", "_areas", "_derived"
+    )
+
+    def __init__(self, vertices, faces):
+        vertices = np.ascontiguousarray(vertices, dtype=float)
+        faces = np.asarray(faces)
+
+        if vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise ValueError("vertices must have shape (N, 3).")
+        if faces.ndim != 2 or faces.shape[1] != 3:
+            raise ValueError("faces must have shape (M, 3).")
+        if len(faces) and (faces.min() < 0 or faces.max() >= len(vertices)):
+            raise ValueError("Face index out of range.")
+
+        index = np.int32 if len(vertices) <= np.iinfo(np.int32).max else np.int64
+        faces = np.ascontiguousarray(faces, dtype=index)
+
+        # Read-only views (the caller's arrays stay writeable)
+        self.vertices = vertices.view()
+        self.vertices.flags.writeable = False
+        self.faces = faces.view()
+        self.faces.flags.writeable = False
+
+        self._edges = None
+        self._face_edges = None
+        self._normals = None
+        self._areas = None
+        self._derived = {}
+
+    def __iter__(self):
+        return iter((self.vertices, self.faces))
+
+    def __repr__(self):
+        return (f"HullMesh({self.n_vertices} vertices, {self.n_faces} faces, "
+                f"{self.nbytes / 2**20:.1f} MiB)")
+
+    @property
+    def n_vertices(self):
+        return len(self.vertices)
+
+    @property
+    def n_faces(self):
+        return len(self.faces)
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by the vertex and face arrays.
+        """
+
+        return self.vertices.nbytes + self.faces.nbytes
+
+    # ----------------------------
+    # Topology
+    # ----------------------------
+
+    def _build_edges(self):
+        f = self.faces
+        n = np.int64(self.n_vertices)
+
+        # Edge k of a face runs from corner k to corner k + 1
+        a = f.astype(np.int64)
+        b = np.roll(a, -1, axis=1)
+        key = np.minimum(a, b) * n + np.maximum(a, b)
+
+        uniq, inverse = np.unique(key.ravel(), return_inverse=True)
+
+        self._edges = np.column_stack([uniq // n, uniq % n]).astype(f.dtype)
+        self._face_edges = inverse.reshape(-1, 3).astype(f.dtype)
+
+    @property
+    def edges(self):
+        """
+        Unique undirected edges (E, 2), smaller vertex index first.
+        """
+
+        if self._edges is None:
+            self._build_edges()
+        return self._edges
+
+    @property
+    def face_edges(self):
+        """
+        Edge indices (M, 3) of every face; edge k joins corners k, k + 1.
+        """
+
+        if self._face_edges is None:
+            self._build_edges()
+        return self._face_edges
+
+    # ----------------------------
+    # Face geometry
+    # ----------------------------
+
+    def _build_normals(self):
+        tri = self.vertices[self.faces]
+        N = 0.5 * np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+
+        areas = np.linalg.norm(N, axis=1)
+        self._normals = np.divide(
+            N, areas[:, None], out=np.zeros_like(N), where=areas[:, None] > 0.0
+        )
+        self._areas = areas
+
+    @property
+    def normals(self):
+        """
+        Unit face normals (M, 3), following the face winding.
+        """
+
+        if self._normals is None:
+            self._build_normals()
+        return self._normals
+
+    @property
+    def areas(self):
+        """
+        Face areas (M,).
+        """
+
+        if self._areas is None:
+            self._build_normals()
+        return self._areas
+
+    # ----------------------------
+    # Derived tables
+    # ----------------------------
+
+    def cached(self, key, build):
+        """
+        Per-mesh memo: build() on the first call for key, then the
+        stored result.
+        """
+
+        if key not in self._derived:
+            self._derived[key] = build()
+        return self._derived[key]
+
+
+class ScaledHull(HullMesh):
+    """
+    View of a HullMesh scaled along its axes: vertices
+    base.vertices * scale, faces base.faces.
+
+    Stores only the base mesh and three factors. The scaled vertex
+    array is built on first access to vertices (or unpacking) and then
+    kept.
+
+    Parameters
+    ----------
+    base : HullMesh or (vertices, faces)
+        A ScaledHull base is unwrapped (the factors multiply)
+    scale : array_like (3,)
+        Positive factors along x, y and z
+
+    Attributes
+    ----------
+    base : HullMesh
+    scale : ndarray (3,)
+    """
+
+    __slots__ = ("base", "scale", "_scaled")
+
+    def __init__(self, base, scale):
+        scale = np.array(scale, dtype=float)
+
+        positive = np.isfinite(scale) & (scale > 0.0)
+        if scale.shape != (3,) or not positive.all():
+            raise ValueError("scale must be three positive factors.")
+
+        if isinstance(base, ScaledHull):
+            base, scale = base.base, base.scale * scale
+        elif not isinstance(base, HullMesh):
+            base = HullMesh(*base)
+
+        scale.flags.writeable = False
+
+        self.base = base
+        self.scale = scale
+        self.faces = base.faces
+
+        self._scaled = None
+        self._edges = None
+        self._face_edges = None
+        self._normals = None
+        self._areas = None
+        self._derived = {}
+
+    def __repr__(self):
+        sx, sy, sz = self.scale
+        return f"ScaledHull({self.base!r}, scale=({sx:g}, {sy:g}, {sz:g}))"
+
+    @property
+    def vertices(self):
+        if self._scaled is None:
+            self._scaled = self.base.vertices * self.scale
+            self._scaled.flags.writeable = False
+        return self._scaled
+
+    @property
+    def n_vertices(self):
+        return self.base.n_vertices
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by the view itself (faces belong to the base mesh).
+        """
+
+        return self.scale.nbytes + (
+            0 if self._scaled is None else self._scaled.nbytes
+        )
+
+    @property
+    def edges(self):
+        return self.base.edges
+
+    @property
+    def face_edges(self):
+        return self.base.face_edges
+
+
+def mesh_scale(vertices, faces=None):
+    """
+    Vertex and face arrays with the axis scale still to be applied.
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    scale : ndarray (3,) or None
+        For a ScaledHull: its base arrays and factors (the mesh is
+        scale[None] * vertices). Otherwise mesh_arrays(vertices, faces)
+        and None.
+    """
+
+    if isinstance(vertices, ScaledHull):
+        return vertices.base.vertices, vertices.faces, vertices.scale
+
+    return mesh_arrays(vertices, faces) + (None,)
+
+
+def mesh_arrays(vertices, faces=None):
+    """
+    Vertex and face arrays of a HullMesh or of a (vertices, faces) pair.
+
+    Plain arrays are converted to float vertices; integer faces keep
+    their dtype.
+    """
+
+    if isinstance(vertices, HullMesh):
+        return vertices.vertices, vertices.faces
+
+    if faces is None:
+        raise ValueError("faces is required unless a HullMesh is given.")
+
+    return np.asarray(vertices, dtype=float), np.asarray(faces)
@@ -31,27 +31,23 @@ def triangulate_surface(X, Y, Z):
         Z.ravel()
     ])
 
-    faces = []
+    # --- Create triangles (two per grid cell) ---
+    i, j = np.meshgrid(np.arange(Nz - 1), np.arange(Nx - 1), indexing="ij")
 
-    def vid(i, j):
-        """Vertex index helper"""
-        return i * Nx + j
+    v0 = i * Nx + j
+    v1 = i * Nx + j + 1
+    v2 = (i + 1) * Nx + j + 1
+    v3 = (i + 1) * Nx + j
 
-    # --- Create triangles ---
-    for i in range(Nz - 1):
-        for j in range(Nx - 1):
-            v0 = vid(i, j)
-            v1 = vid(i, j + 1)
-            v2 = vid(i + 1, j + 1)
-            v3 = vid(i + 1, j)
+    # Triangle 1: (v0, v1, v2), Triangle 2: (v0, v2, v3)
+    faces = np.stack([
+        np.stack([v0, v1, v2], axis=-1),
+        np.stack([v0, v2, v3], axis=-1)
+    ], axis=2).reshape(-1, 3).astype(np.int64)
 
-            # Triangle 1
-            faces.append([v0, v1, v2])
+    return vertices, faces
 
-            # Triangle 2
-            faces.append([v0, v2, v3])
 
-    return np.array(vertices), np.array(faces)
 def mirror_mesh(vertices, faces):
     """
     Mirror a half-hull mesh about the centerplane (y = 0)
@@ -76,17 +72,11 @@ def mirror_mesh(vertices, faces):
     offset = len(vertices)
 
     # --- Reverse face orientation for mirrored side ---
-    faces_mirror = []
-    for f in faces:
-        faces_mirror.append([
-            f[0] + offset,
-            f[2] + offset,
-            f[1] + offset
-        ])
+    faces_mirror = faces[:, [0, 2, 1]] + offset
 
     # --- Combine ---
     vertices_full = np.vstack([vertices, vertices_mirror])
-    faces_full = np.vstack([faces, np.array(faces_mirror)])
+    faces_full = np.vstack([faces, faces_mirror])
 
     return vertices_full, faces_full
 
@@ -101,28 +91,44 @@ def close_deck(vertices, faces):
     # Find deck boundary vertices
     deck_indices = np.where(abs(vertices[:, 2]) < z_tol)[0]
 
-    # Sort deck vertices along x, then y
+    # Order the deck outline by angle around its centre
     deck_vertices = vertices[deck_indices]
-    order = np.lexsort((deck_vertices[:, 1], deck_vertices[:, 0]))
-    deck_indices = deck_indices[order]
-
-    # Create center point
     center = deck_vertices.mean(axis=0)
     center[2] = 0.0
 
+    angle = np.arctan2(
+        deck_vertices[:, 1] - center[1],
+        deck_vertices[:, 0] - center[0]
+    )
+    order = np.argsort(angle, kind="stable")
+    deck_indices = deck_indices[order]
+
+    # Orient the fan like the hull: with the apex on the deck plane the
+    # deck contributes no volume, so the sign of the hull's volume
+    # gives the orientation (outward normal of the deck is -z).
+    tri = vertices[faces] - center
+    hull_volume = np.einsum(
+        "ij,ij->i", tri[:, 0], np.cross(tri[:, 1], tri[:, 2])
+    ).sum()
+
+    outline = vertices[deck_indices] - center
+    area_z = np.sum(
+        outline[:, 0] * np.roll(outline[:, 1], -1)
+        - np.roll(outline[:, 0], -1) * outline[:, 1]
+    )
+    if (area_z > 0.0) == (hull_volume > 0.0):
+        deck_indices = deck_indices[::-1]
+
     center_index = len(vertices)
     vertices = np.vstack([vertices, center])
 
-    new_faces = []
-
-    for i in range(len(deck_indices) - 1):
-        new_faces.append([
-            deck_indices[i],
-            deck_indices[i + 1],
-            center_index
-        ])
+    new_faces = np.column_stack([
+        deck_indices,
+        np.roll(deck_indices, -1),
+        np.full(len(deck_indices), center_index)
+    ])
 
-    faces = np.vstack([faces, np.array(new_faces)])
+    faces = np.vstack([faces, new_faces])
     return vertices, faces
 
 def close_end(vertices, faces, x_value):
@@ -146,14 +152,115 @@ def close_end(vertices, faces, x_value):
     center_index = len(vertices)
     vertices = np.vstack([vertices, center])
 
-    new_faces = []
-
-    for i in range(len(end_indices) - 1):
-        new_faces.append([
-            end_indices[i],
-            center_index,
-            end_indices[i + 1]
-        ])
+    new_faces = np.column_stack([
+        end_indices[:-1],
+        np.full(len(end_indices) - 1, center_index),
+        end_indices[1:]
+    ])
 
-    faces = np.vstack([faces, np.array(new_faces)])
+    faces = np.vstack([faces, new_faces])
     return vertices, faces
+
+
+def loft_sections(x, z, Y):
+    """
+    Closed hull surface through half-breadths on a station / waterline
+    grid, watertight and with outward normals.
+
+    Every station is a closed section: starboard side from deck to
+    keel, the bottom across, port side back up and the deck across.
+    Port points on the centreplane (Y == 0) are the starboard points
+    themselves, so keel lines and stems close without seams. Adjacent
+    sections are joined by quads and the end sections are closed by
+    strips between port and starboard. Triangles that collapse onto
+    the centreplane are dropped.
+
+    Parameters
+    ----------
+    x : ndarray (NX,)
+        Increasing station positions
+    z : ndarray (NZ,)
+        Increasing waterline depths, deck (z[0]) to keel (z[-1])
+    Y : ndarray (NZ, NX)
+        Half-breadths (negative values are taken as 0)
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
+    Y = np.maximum(np.asarray(Y, dtype=float), 0.0)
+
+    NZ, NX = Y.shape
+    if NX < 2 or NZ < 2 or (len(x), len(z)) != (NX, NZ):
+        raise ValueError("Y must have shape (len(z), len(x)), both >= 2.")
+
+    X, Z = np.meshgrid(x, z)
+
+    # --- Vertices: starboard grid, then port points off the centreplane ---
+    off = Y > 0.0
+    star = np.arange(NZ * NX).reshape(NZ, NX)
+    port = star.copy()
+    port[off] = NZ * NX + np.arange(np.count_nonzero(off))
+
+    vertices = np.vstack([
+        np.column_stack([X.ravel(), Y.ravel(), Z.ravel()]),
+        np.column_stack([X[off], -Y[off], Z[off]])
+    ])
+
+    # --- Sides, bottom and deck: section rings joined by quads ---
+    ring = np.vstack([star, port[::-1]])            # (2 NZ, NX)
+    nxt = np.roll(ring, -1, axis=0)
+
+    a, b = ring[:, :-1], nxt[:, :-1]
+    c, d = nxt[:, 1:], ring[:, 1:]
+
+    # Port quads split along the mirror of the starboard diagonal, so
+    # both sides of a zero-thickness region coincide (and cancel below)
+    sb = slice(0, NZ)
+    ps = slice(NZ, 2 * NZ)
+    shell = [
+        np.column_stack([a[sb].ravel(), b[sb].ravel(), c[sb].ravel()]),
+        np.column_stack([a[sb].ravel(), c[sb].ravel(), d[sb].ravel()]),
+        np.column_stack([a[ps].ravel(), b[ps].ravel(), d[ps].ravel()]),
+        np.column_stack([b[ps].ravel(), c[ps].ravel(), d[ps].ravel()]),
+    ]
+
+    # --- End sections: strips between port and starboard ---
+    caps = []
+    for j, outward in ((0, False), (NX - 1, True)):
+        s0, s1 = star[:-1, j], star[1:, j]
+        p0, p1 = port[:-1, j], port[1:, j]
+        cap = np.vstack([
+            np.column_stack([s0, s1, p1]),
+            np.column_stack([s0, p1, p0])
+        ])
+        caps.append(cap if outward else cap[:, ::-1])
+
+    faces = np.vstack(shell + caps)
+
+    # --- Drop collapsed triangles ---
+    # Repeated corners: zero width on the centreplane
+    faces = faces[
+        (faces[:, 0] != faces[:, 1])
+        & (faces[:, 1] != faces[:, 2])
+        & (faces[:, 2] != faces[:, 0])
+    ]
+
+    # Coincident pairs of opposite orientation: starboard and port
+    # quads of a zero-thickness region (all corners on the centreplane)
+    on_plane = np.zeros(len(vertices), dtype=bool)
+    on_plane[:off.size] = ~off.ravel()
+
+    flat = np.flatnonzero(on_plane[faces].all(axis=1))
+    if len(flat):
+        _, inverse, counts = np.unique(
+            np.sort(faces[flat], axis=1), axis=0, return_inverse=True,
+            return_counts=True
+        )
+        faces = np.delete(faces, flat[counts[inverse.ravel()] > 1], axis=0)
+
+    return vertices, faces.astype(np.int64)
@@ -0,0 +1,311 @@
+"""
+Hull mesh import: binary / ASCII STL and Wavefront OBJ.
+
+Binary STL is read through np.memmap with a structured record dtype,
+so no per-triangle Python code runs. STL stores every triangle with
+its own corners; those are welded into an indexed mesh (vertices,
+faces) by a vectorized hash-and-sort, ready for clip_mesh_at_draft.
+
+Coordinates are returned as stored in the file. The solver expects
+z = 0 at the deck with z increasing towards the keel (submerged side
+z >= draft); hulls modelled with z up need to be flipped first.
+"""
+
+import os
+import re
+
+import numpy as np
+
+# 80-byte header + uint32 triangle count, then one record per triangle
+STL_HEADER_BYTES = 84
+STL_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attr", "<u2"),
+])
+
+# Odd 64-bit multipliers for the coordinate hash
+_HASH_MIX = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9],
+    dtype=np.uint64
+)
+
+
+# ----------------------------
+# Vertex welding
+# ----------------------------
+
+def weld_vertices(points, tol=0.0):
+    """
+    Merge coincident points.
+
+    Points are hashed to 64 bits and sorted together with their index
+    in one packed integer sort. Points that share a hash but differ are
+    detected and separated exactly, so the result never merges
+    distinct points.
+
+    Parameters
+    ----------
+    points : ndarray (K, 3)
+    tol : float
+        0: merge bit-identical coordinates (after folding -0.0 into
+        0.0). > 0: merge points falling in the same cell of a grid
+        with this spacing.
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+        Welded vertices, in order of first appearance
+    inverse : ndarray (K,)
+        Vertex index of every input point
+    """
+
+    points = np.asarray(points)
+    n = len(points)
+
+    if n == 0:
+        return np.empty((0, 3)), np.empty(0, dtype=np.intp)
+
+    if tol > 0.0:
+        keys = np.round(points / tol).astype(np.int64)
+        bits = keys.view(np.uint64)
+    else:
+        keys = np.ascontiguousarray(points) + 0.0
+        bits = keys.view(np.uint32 if keys.dtype.itemsize == 4 else np.uint64)
+
+    # Hash in the high bits, point index in the low bits, one plain sort
+    shift = np.uint64(max(int(n - 1).bit_length(), 1))
+
+    h = bits[:, 0] * _HASH_MIX[0]
+    h += bits[:, 1] * _HASH_MIX[1]
+    h += bits[:, 2] * _HASH_MIX[2]
+    h ^= h >> np.uint64(29)
+    h >>= shift
+    h <<= shift
+    h |= np.arange(n, dtype=np.uint64)
+    h.sort()
+
+    order = (h & ((np.uint64(1) << shift) - np.uint64(1))).astype(np.intp)
+    h >>= shift
+
+    new_group = np.empty(n, dtype=bool)
+    new_group[0] = True
+    np.not_equal(h[1:], h[:-1], out=new_group[1:])
+    del h
+
+    # Lowest index of every group is its representative; vertices are
+    # numbered in order of first appearance
+    rep = order[new_group]
+    first = np.argsort(rep)
+    rep = rep[first]
+
+    rank = np.empty(len(rep), dtype=np.intp)
+    rank[first] = np.arange(len(rep))
+
+    inverse = np.empty(n, dtype=np.intp)
+    inverse[order] = rank[np.cumsum(new_group) - 1]
+    del order, new_group
+
+    # Hash collisions: points that differ from their representative
+    ne = keys != np.take(np.take(keys, rep, axis=0), inverse, axis=0)
+    clash = np.flatnonzero(ne[:, 0] | ne[:, 1] | ne[:, 2])
+    del ne
+
+    if len(clash):
+        _, sub = np.unique(keys[clash], axis=0, return_inverse=True)
+        sub = sub.reshape(-1)
+
+        extra = np.full(sub.max() + 1, n, dtype=np.intp)
+        np.minimum.at(extra, sub, clash)
+
+        inverse[clash] = len(rep) + sub
+        rep = np.concatenate([rep, extra])
+
+        first = np.argsort(rep)
+        rep = rep[first]
+        rank = np.empty(len(rep), dtype=np.intp)
+        rank[first] = np.arange(len(rep))
+        inverse = rank[inverse]
+
+    vertices = np.take(points, rep, axis=0).astype(float)
+
+    return vertices, inverse
+
+
+def triangles_to_mesh(triangles, tol=0.0):
+    """
+    Indexed mesh from a triangle soup.
+
+    Parameters
+    ----------
+    triangles : ndarray (M, 3, 3)
+    tol : float
+        See weld_vertices
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    triangles = np.asarray(triangles)
+    vertices, inverse = weld_vertices(triangles.reshape(-1, 3), tol)
+
+    faces = inverse.reshape(-1, 3)
+
+    # Welding can collapse slivers; drop faces with repeated corners
+    ok = (
+        (faces[:, 0] != faces[:, 1])
+        & (faces[:, 1] != faces[:, 2])
+        & (faces[:, 2] != faces[:, 0])
+    )
+
+    return vertices, faces[ok]
+
+
+# ----------------------------
+# STL
+# ----------------------------
+
+def _is_binary_stl(path):
+    size = os.path.getsize(path)
+    if size < STL_HEADER_BYTES:
+        return False
+
+    with open(path, "rb") as fh:
+        header = fh.read(STL_HEADER_BYTES)
+
+    n = int(np.frombuffer(header, dtype="<u4", count=1, offset=80)[0])
+    return size == STL_HEADER_BYTES + n * STL_DTYPE.itemsize
+
+
+def read_stl_triangles(path):
+    """
+    Triangle corners of an STL file, shape (M, 3, 3).
+
+    Binary files are memory-mapped (float32, read-only view); ASCII
+    files are parsed with a single regular expression pass.
+    """
+
+    if _is_binary_stl(path):
+        n = (os.path.getsize(path) - STL_HEADER_BYTES) // STL_DTYPE.itemsize
+        if n == 0:
+            return np.empty((0, 3, 3), dtype=np.float32)
+
+        records = np.memmap(
+            path, dtype=STL_DTYPE, mode="r",
+            offset=STL_HEADER_BYTES, shape=(n,)
+        )
+        return records["vertices"]
+
+    with open(path, "r", errors="replace") as fh:
+        text = fh.read()
+
+    if not text.lstrip().startswith("solid"):
+        raise ValueError(f"{path}: not a binary or ASCII STL file.")
+
+    number = r"([-+0-9.eE]+)"
+    coords = re.findall(
+        r"vertex\s+" + r"\s+".join([number] * 3), text
+    )
+    if len(coords) % 3:
+        raise ValueError(f"{path}: vertex count is not a multiple of 3.")
+
+    return np.array(coords, dtype=float).reshape(-1, 3, 3)
+
+
+def write_stl(path, vertices, faces):
+    """
+    Write an indexed mesh as binary STL.
+    """
+
+    vertices = np.asarray(vertices, dtype=float)
+    faces = np.asarray(faces)
+
+    tri = vertices[faces]
+    normal = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    length = np.linalg.norm(normal, axis=1, keepdims=True)
+    normal = np.divide(normal, length, out=np.zeros_like(normal),
+                       where=length > 0.0)
+
+    records = np.zeros(len(faces), dtype=STL_DTYPE)
+    records["normal"] = normal
+    records["vertices"] = tri
+
+    with open(path, "wb") as fh:
+        fh.write(b"binary STL".ljust(80, b" "))
+        fh.write(np.array([len(faces)], dtype="<u4").tobytes())
+        fh.write(records.tobytes())
+
+
+# ----------------------------
+# OBJ
+# ----------------------------
+
+def read_obj(path):
+    """
+    Vertices and triangulated faces of a Wavefront OBJ file.
+
+    Only `v` and `f` records are used; polygons are fan-triangulated,
+    texture / normal indices and negative (relative) indices are
+    handled.
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    vertices = []
+    faces = []
+
+    with open(path, "r", errors="replace") as fh:
+        for line in fh:
+            if line.startswith("v "):
+                vertices.append(line.split()[1:4])
+            elif line.startswith("f "):
+                n_v = len(vertices)
+                ids = [int(tok.split("/")[0]) for tok in line.split()[1:]]
+                ids = [i - 1 if i > 0 else n_v + i for i in ids]
+                for k in range(1, len(ids) - 1):
+                    faces.append((ids[0], ids[k], ids[k + 1]))
+
+    vertices = np.array(vertices, dtype=float).reshape(-1, 3)
+    faces = np.array(faces, dtype=np.int64).reshape(-1, 3)
+
+    return vertices, faces
+
+
+# ----------------------------
+# Entry point
+# ----------------------------
+
+def load_mesh(path, tol=0.0):
+    """
+    Load a hull mesh from STL (binary or ASCII) or OBJ.
+
+    Parameters
+    ----------
+    path : str
+    tol : float
+        Vertex welding tolerance (see weld_vertices). OBJ files are
+        already indexed and are only re-welded when tol > 0.
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".stl":
+        return triangles_to_mesh(read_stl_triangles(path), tol)
+
+    if ext == ".obj":
+        vertices, faces = read_obj(path)
+        if tol > 0.0:
+            return triangles_to_mesh(vertices[faces], tol)
+        return vertices, faces
+
+    raise ValueError(f"Unsupported mesh format: {ext!r} (use .stl or .obj).")
@@ -0,0 +1,119 @@
+"""
+Hull lofted from an offset table.
+
+An offset table gives half-breadths at stations x and waterlines z
+(hull frame: z = 0 at the deck, increasing towards the keel; the first
+waterline is the deck). The surface is interpolated on a regular
+NX x NZ grid spanning the table with natural cubic splines, through
+the waterlines of every station and then along the length, and lofted
+with geometry.mesh.loft_sections. Zero half-breadths (stems, keel
+line) stay on the centreplane; spline undershoot below zero is
+clipped.
+
+Offset table file (CSV):
+    z,   x_1,  x_2,  ...        header: station positions
+    z_1, y_11, y_12, ...        one row per waterline
+"""
+
+import csv
+
+import numpy as np
+
+from geometry.mesh import loft_sections
+from geometry.spline import natural_spline
+
+
+def read_offset_table(path):
+    """
+    Read an offset table CSV file (see module docstring).
+
+    Returns
+    -------
+    table : dict
+        stations (S,), waterlines (W,) and half_breadths (W, S)
+    """
+
+    with open(path, newline="") as fh:
+        rows = [row for row in csv.reader(fh) if row]
+
+    try:
+        stations = [float(x) for x in rows[0][1:]]
+        waterlines = [float(row[0]) for row in rows[1:]]
+        half_breadths = [[float(y) for y in row[1:]] for row in rows[1:]]
+    except (IndexError, ValueError) as err:
+        raise ValueError(f"{path}: not an offset table ({err}).") from None
+
+    if any(len(row) != len(stations) for row in half_breadths):
+        raise ValueError(
+            f"{path}: every waterline needs one value per station."
+        )
+
+    return {
+        "stations": np.array(stations),
+        "waterlines": np.array(waterlines),
+        "half_breadths": np.array(half_breadths),
+    }
+
+
+def loft_offsets(stations, waterlines, half_breadths, NX, NZ):
+    """
+    Half-breadths of an offset table on a regular NX x NZ grid.
+
+    Parameters
+    ----------
+    stations : array_like (S,)
+        Increasing x positions
+    waterlines : array_like (W,)
+        Increasing z positions, deck first
+    half_breadths : array_like (W, S)
+    NX, NZ : int
+
+    Returns
+    -------
+    x : ndarray (NX,)
+    z : ndarray (NZ,)
+    Y : ndarray (NZ, NX)
+    """
+
+    stations = np.asarray(stations, dtype=float)
+    waterlines = np.asarray(waterlines, dtype=float)
+    half_breadths = np.asarray(half_breadths, dtype=float)
+
+    if half_breadths.shape != (len(waterlines), len(stations)):
+        raise ValueError(
+            "half_breadths must have shape (len(waterlines), len(stations))."
+        )
+    if np.any(half_breadths < 0.0):
+        raise ValueError("Half-breadths must be >= 0.")
+
+    x = np.linspace(stations[0], stations[-1], NX)
+    z = np.linspace(waterlines[0], waterlines[-1], NZ)
+
+    # Every station through its waterlines, then along the length
+    Y = natural_spline(waterlines, half_breadths, z, axis=0)
+    Y = natural_spline(stations, Y, x, axis=1)
+
+    return x, z, np.maximum(Y, 0.0)
+
+
+def build_offset_hull(stations, waterlines, half_breadths, NX=61, NZ=31):
+    """
+    Closed hull mesh lofted from an offset table (watertight, normals
+    outward).
+
+    Parameters
+    ----------
+    stations, waterlines, half_breadths : array_like
+        See loft_offsets
+    NX, NZ : int
+        Stations and waterlines of the lofted mesh
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    return loft_sections(
+        *loft_offsets(stations, waterlines, half_breadths, NX, NZ)
+    )
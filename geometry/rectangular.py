@@ -0,0 +1,35 @@
+"""
+Rectangular (box) hull.
+
+Coordinate system as for the Wigley hull: x from -L/2 to +L/2, y
+across, z from 0 (deck plane) to T (keel).
+"""
+
+import numpy as np
+
+from geometry.mesh import loft_sections
+
+
+def rectangular_hull_mesh(L, B, T, NX=2, NZ=2):
+    """
+    Closed box hull |x| <= L/2, |y| <= B/2, 0 <= z <= T (watertight,
+    normals outward).
+
+    Parameters
+    ----------
+    L, B, T : float
+        Length, breadth and depth
+    NX, NZ : int
+        Stations along the length and waterlines over the depth
+        (>= 2); the deck and the bottom are one strip across
+
+    Returns
+    -------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    """
+
+    x = np.linspace(-L / 2.0, L / 2.0, NX)
+    z = np.linspace(0.0, T, NZ)
+
+    return loft_sections(x, z, np.full((NZ, NX), B / 2.0))
@@ -0,0 +1,129 @@
+"""
+Hull form registry.
+
+Registered generators:
+
+    box       geometry.rectangular.rectangular_hull_mesh(L, B, T, NX, NZ)
+    wigley    geometry.hull.build_wigley_hull(L, B, T, NX, NZ)
+    offsets   geometry.offsets.build_offset_hull(stations, waterlines,
+              half_breadths, NX, NZ)
+
+All of them loft closed sections (geometry.mesh.loft_sections), so
+every mesh is watertight with outward normals.
+
+hull_mesh(name, **params) builds a hull through the mesh cache
+(geometry.cache) and returns a HullMesh, which the sweep, band and
+equilibrium code take in place of vertices:
+
+    mesh = hull_mesh("wigley", L=100.0, B=20.0, T=10.0)
+    KN, GZ = compute_KN_GZ(mesh, None, KG, draft, angles)
+
+register_hull adds a generator: any function returning (vertices,
+faces) or a HullMesh from JSON-serializable parameters (arrays are
+passed as nested lists).
+"""
+
+import inspect
+
+import numpy as np
+
+from geometry.cache import cached_mesh
+from geometry.hull import build_wigley_hull
+from geometry.hull_mesh import HullMesh
+from geometry.offsets import build_offset_hull
+from geometry.rectangular import rectangular_hull_mesh
+
+_registry = {}
+
+
+def register_hull(name, build):
+    """
+    Add a hull generator to the registry (replacing one of the same
+    name).
+    """
+
+    _registry[name] = build
+    return build
+
+
+def available_hulls():
+    """
+    Names of the registered hull generators.
+    """
+
+    return list(_registry)
+
+
+def _generator(name):
+    build = _registry.get(name)
+
+    if build is None:
+        raise ValueError(
+            f"Unknown hull {name!r} (registered: {', '.join(_registry)})."
+        )
+
+    return build
+
+
+def hull_parameters(name):
+    """
+    Parameter names of a hull generator.
+    """
+
+    return tuple(inspect.signature(_generator(name)).parameters)
+
+
+def _jsonable(value):
+    """
+    Parameter value in plain JSON types (arrays become nested lists).
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def hull_mesh(name, cache=True, **params):
+    """
+    Hull mesh of a registered generator, served from the mesh cache
+    when possible.
+
+    Parameters
+    ----------
+    name : str
+        Registered generator (see available_hulls)
+    cache : bool
+        Use geometry.cache (default); False always rebuilds
+    **params
+        Generator parameters; omitted ones take the generator defaults
+
+    Returns
+    -------
+    mesh : HullMesh
+        Unpacks as vertices, faces
+    """
+
+    build = _generator(name)
+
+    try:
+        bound = inspect.signature(build).bind(**params)
+    except TypeError as err:
+        raise ValueError(f"Hull {name!r}: {err}.") from None
+
+    bound.apply_defaults()
+    params = {key: _jsonable(v) for key, v in bound.arguments.items()}
+
+    if not cache:
+        built = build(**params)
+        return built if isinstance(built, HullMesh) else HullMesh(*built)
+
+    return cached_mesh(name, build, params)
+
+
+register_hull("box", rectangular_hull_mesh)
+register_hull("wigley", build_wigley_hull)
+register_hull("offsets", build_offset_hull)
@@ -0,0 +1,104 @@
+"""
+Natural cubic splines, vectorized over many curves.
+
+Used to loft hull surfaces from offset tables: every column of a
+(n, K) array is one curve through the same knots, and all K curves are
+solved and evaluated together (the tridiagonal solve loops over the
+knots only).
+"""
+
+import numpy as np
+
+
+def spline_moments(x, y):
+    """
+    Second derivatives at the knots of the natural cubic splines
+    through (x, y[:, k]).
+
+    Parameters
+    ----------
+    x : ndarray (n,)
+        Strictly increasing knots
+    y : ndarray (n, K)
+
+    Returns
+    -------
+    M : ndarray (n, K)
+        Zero at both ends
+    """
+
+    n = len(x)
+    M = np.zeros_like(y)
+
+    if n < 3:
+        return M
+
+    h = np.diff(x)
+    slope = np.diff(y, axis=0) / h[:, None]
+    rhs = 6.0 * np.diff(slope, axis=0)             # (n - 2, K)
+
+    # Thomas algorithm on the interior knots, all curves at once
+    diag = 2.0 * (h[:-1] + h[1:])
+    c = np.empty(n - 2)
+    d = np.empty_like(rhs)
+
+    c[0] = h[1] / diag[0]
+    d[0] = rhs[0] / diag[0]
+    for i in range(1, n - 2):
+        denom = diag[i] - h[i] * c[i - 1]
+        c[i] = h[i + 1] / denom
+        d[i] = (rhs[i] - h[i] * d[i - 1]) / denom
+
+    M[n - 2] = d[n - 3]
+    for i in range(n - 4, -1, -1):
+        M[i + 1] = d[i] - c[i] * M[i + 2]
+
+    return M
+
+
+def natural_spline(x, y, xi, axis=0):
+    """
+    Natural cubic spline interpolation of y along one axis.
+
+    Parameters
+    ----------
+    x : array_like (n,)
+        Strictly increasing knots (n >= 2; two knots interpolate
+        linearly)
+    y : array_like
+        Values, with length n along axis
+    xi : array_like (m,)
+        Evaluation points (outside the knots the end polynomials are
+        extended)
+    axis : int
+
+    Returns
+    -------
+    yi : ndarray
+        y with axis replaced by the m evaluation points. Values at
+        the knots are reproduced exactly.
+    """
+
+    x = np.asarray(x, dtype=float)
+    xi = np.asarray(xi, dtype=float)
+    y = np.moveaxis(np.asarray(y, dtype=float), axis, 0)
+
+    if x.ndim != 1 or len(x) < 2 or len(x) != len(y):
+        raise ValueError("Need at least 2 knots, one per value along axis.")
+    if np.any(np.diff(x) <= 0.0):
+        raise ValueError("Spline knots must be strictly increasing.")
+
+    shape = y.shape[1:]
+    y = y.reshape(len(x), -1)
+    M = spline_moments(x, y)
+
+    j = np.clip(np.searchsorted(x, xi, side="right") - 1, 0, len(x) - 2)
+    h = (x[j + 1] - x[j])[:, None]
+    t = ((xi - x[j]) / (x[j + 1] - x[j]))[:, None]
+    s = 1.0 - t
+
+    # Weights vanish exactly at the knots (t = 0 or s = 0)
+    yi = (s * y[j] + t * y[j + 1]
+          + h * h / 6.0 * ((s**3 - s) * M[j] + (t**3 - t) * M[j + 1]))
+
+    return np.moveaxis(yi.reshape((len(xi),) + shape), 0, axis)
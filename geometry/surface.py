@@ -36,14 +36,7 @@ def sample_wigley_surface(L, B, T, Nx, Nz):
     x_vals = np.linspace(-L / 2.0, L / 2.0, Nx)
     z_vals = np.linspace(0.0, T, Nz)
 
-    X = np.zeros((Nz, Nx))
-    Y = np.zeros((Nz, Nx))
-    Z = np.zeros((Nz, Nx))
-
-    for i, z in enumerate(z_vals):
-        for j, x in enumerate(x_vals):
-            X[i, j] = x
-            Z[i, j] = z
-            Y[i, j] = wigley_half_breadth(x, z, L, B, T)
+    X, Z = np.meshgrid(x_vals, z_vals)
+    Y = wigley_half_breadth(X, Z, L, B, T)
 
     return X, Y, Z
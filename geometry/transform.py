@@ -2,31 +2,103 @@
 Geometric transformations for hull meshes.
 """
 
+from time import perf_counter
+
 import numpy as np
 
+from utils import profiling
 
-def rotate_about_x(vertices, angle_rad):
+
+def heel_matrix(angle_rad):
     """
-    Rotate vertices about the x-axis by angle_rad.
+    Rotation matrix about the x-axis (heel).
 
     Parameters
     ----------
-    vertices : ndarray (N, 3)
-    angle_rad : float
+    angle_rad : float or ndarray (B,)
         Heel angle in radians (positive = starboard heel)
 
     Returns
     -------
-    vertices_rot : ndarray (N, 3)
+    R : ndarray (3, 3) or (B, 3, 3)
+        Body to earth frame; row 2 is the earth vertical (the
+        waterplane normal) in the body frame
     """
 
     c = np.cos(angle_rad)
     s = np.sin(angle_rad)
+    one = np.ones_like(c)
+    zero = np.zeros_like(c)
+
+    return np.stack([
+        np.stack([one,  zero, zero], axis=-1),
+        np.stack([zero,  c,   -s  ], axis=-1),
+        np.stack([zero,  s,    c  ], axis=-1)
+    ], axis=-2)
+
+
+def trim_matrix(angle_rad):
+    """
+    Rotation matrix about the y-axis (trim, positive raises the +x end).
+    """
 
-    R = np.array([
-        [1.0,  0.0,  0.0],
-        [0.0,   c,  -s ],
-        [0.0,   s,   c ]
+    c = np.cos(angle_rad)
+    s = np.sin(angle_rad)
+
+    return np.array([
+        [ c,   0.0,  s ],
+        [0.0,  1.0, 0.0],
+        [-s,   0.0,  c ]
     ])
 
-    return vertices @ R.T
+
+def rotate_about_x(vertices, angle_rad):
+    """
+    Rotate vertices about the x-axis by angle_rad.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    angle_rad : float or ndarray (B,)
+        Heel angle in radians (positive = starboard heel).
+        An array of angles gives one rotated copy per angle.
+
+    Returns
+    -------
+    vertices_rot : ndarray (N, 3) or (B, N, 3)
+    """
+
+    prof = profiling.active()
+    if prof:
+        t0 = perf_counter()
+
+    R = heel_matrix(angle_rad)
+
+    if np.ndim(angle_rad) > 0:
+        rotated = np.matmul(vertices[None], np.swapaxes(R, -1, -2))
+    else:
+        rotated = vertices @ R.T
+
+    if prof:
+        prof.lap("rotate", t0)
+        prof.count("bytes_allocated", rotated.nbytes)
+
+    return rotated
+
+
+def rotate_about_y(vertices, angle_rad):
+    """
+    Rotate vertices about the y-axis by angle_rad.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    angle_rad : float
+        Trim angle in radians (positive raises the +x end)
+
+    Returns
+    -------
+    vertices_rot : ndarray (N, 3)
+    """
+
+    return vertices @ trim_matrix(angle_rad).T
@@ -7,16 +7,21 @@ y : transverse (half-breadth), >= 0
 z : vertical, from 0 (deck plane) to T (keel)
 """
 
+import numpy as np
+
+
 def wigley_half_breadth(x, z, L, B, T):
     """
     Returns half-breadth y at longitudinal position x
     and vertical position z for a Wigley hull.
 
+    x and z may be arrays; they are broadcast against each other.
+
     Parameters
     ----------
-    x : float
+    x : float or ndarray
         Longitudinal position [-L/2, L/2]
-    z : float
+    z : float or ndarray
         Vertical position [0, T]
     L : float
         Length between perpendiculars
@@ -27,18 +32,22 @@ def wigley_half_breadth(x, z, L, B, T):
 
     Returns
     -------
-    y : float
+    y : float or ndarray
         Half-breadth (>= 0)
     """
 
-    # Outside hull domain
-    if abs(x) > L / 2 or z < 0 or z > T:
-        return 0.0
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
 
     x_term = 1.0 - (2.0 * x / L) ** 2
     z_term = 1.0 - (z / T) ** 2
 
     y = (B / 2.0) * x_term * z_term
 
+    # Outside hull domain
+    inside = (np.abs(x) <= L / 2) & (z >= 0) & (z <= T)
+
     # Numerical safety
-    return max(y, 0.0)
+    y = np.where(inside, np.maximum(y, 0.0), 0.0)
+
+    return float(y) if y.ndim == 0 else y
@@ -0,0 +1,301 @@
+"""
+Compute backend registry.
+
+A backend provides the three mesh kernels behind the hydrostatics:
+
+    signed_volume(vertices, faces)             -> float
+    volume_and_centroid(vertices, faces)       -> volume, centroid
+    buoyancy(vertices, faces, drafts, R)       -> volumes (B,), centroids (B, 3)
+
+buoyancy clips the hull rotated by R[b] (body to earth, (B, 3, 3)) at
+drafts[b] and returns positive volumes and earth-frame centroids. The
+axis scale of a ScaledHull is folded into R, on the base mesh.
+
+Registered backends:
+
+    python   the readable face-by-face reference loops (clip with
+             one cap triangle per waterline segment, volume_centroid,
+             utils.checks); slow, never auto-selected
+    numpy    the vectorized implementations and the fused chunked
+             clip (hydrostatics.fused)
+    numba    the reference loops compiled in parallel with numba,
+             cached on disk; only available when numba is installed
+
+Selection, first match wins: the name passed to get_backend, the one
+set with set_backend, $GZ_BACKEND, and "auto" (the fastest available:
+numba, else numpy).
+
+Parity of every available backend with the reference is checked by
+python -m benchmarks.parity.
+"""
+
+import importlib.util
+import os
+
+import numpy as np
+
+from geometry.hull_mesh import mesh_arrays, mesh_scale
+from hydrostatics.clip import clip_and_cap_reference
+from hydrostatics.volume_centroid import (
+    volume_and_centroid, volume_and_centroid_reference
+)
+from utils.checks import signed_volume, signed_volume_reference
+
+BACKEND_ENV = "GZ_BACKEND"
+
+# Preference order of "auto"
+AUTO_ORDER = ("numba", "numpy")
+
+
+class Backend:
+    """
+    Named set of mesh kernels (see module docstring).
+
+    Parameters
+    ----------
+    name : str
+    signed_volume, volume_and_centroid, buoyancy : callable
+    available : callable, optional
+        Returns True when the backend can run on this machine
+    """
+
+    __slots__ = (
+        "name", "signed_volume", "volume_and_centroid", "buoyancy",
+        "_available"
+    )
+
+    def __init__(self, name, signed_volume, volume_and_centroid, buoyancy,
+                 available=None):
+        self.name = name
+        self.signed_volume = signed_volume
+        self.volume_and_centroid = volume_and_centroid
+        self.buoyancy = buoyancy
+        self._available = available
+
+    def __repr__(self):
+        return f"Backend({self.name!r})"
+
+    @property
+    def available(self):
+        return self._available is None or bool(self._available())
+
+
+_registry = {}
+_selected = None
+
+
+def register_backend(backend):
+    """
+    Add a backend to the registry (replacing one of the same name).
+    """
+
+    _registry[backend.name] = backend
+    return backend
+
+
+def available_backends():
+    """
+    Names of the registered backends that can run here.
+    """
+
+    return [name for name, b in _registry.items() if b.available]
+
+
+def set_backend(name):
+    """
+    Select the default backend for this process (None: back to
+    $GZ_BACKEND / auto).
+    """
+
+    global _selected
+
+    if name is not None:
+        _resolve(name)
+    _selected = name
+
+
+def get_backend(name=None):
+    """
+    Backend by name, or the selected default.
+
+    Parameters
+    ----------
+    name : str or Backend, optional
+
+    Returns
+    -------
+    backend : Backend
+    """
+
+    if isinstance(name, Backend):
+        return name
+
+    if name is None:
+        name = _selected or os.environ.get(BACKEND_ENV) or "auto"
+
+    return _resolve(name)
+
+
+def _resolve(name):
+    if name == "auto":
+        for candidate in AUTO_ORDER:
+            backend = _registry.get(candidate)
+            if backend is not None and backend.available:
+                return backend
+        raise ValueError("No compute backend is available.")
+
+    backend = _registry.get(name)
+
+    if backend is None:
+        raise ValueError(
+            f"Unknown backend {name!r} (registered: {', '.join(_registry)})."
+        )
+    if not backend.available:
+        raise ValueError(f"Backend {name!r} is not available here.")
+
+    return backend
+
+
+def _cases(vertices, faces, drafts, R):
+    """
+    Mesh arrays, (B,) drafts and (B, 3, 3) rotations broadcast against
+    each other, with the scale of a ScaledHull folded into R.
+    """
+
+    vertices, faces, scale = mesh_scale(vertices, faces)
+
+    R = np.asarray(R, dtype=float)
+    if R.ndim == 2:
+        R = R[None]
+    if scale is not None:
+        R = R * scale
+
+    drafts = np.broadcast_to(np.asarray(drafts, dtype=float), (len(R),))
+
+    return vertices, faces, drafts, R
+
+
+# ----------------------------
+# python: reference loops
+# ----------------------------
+
+def _python_buoyancy(vertices, faces, drafts, R):
+    vertices, faces, drafts, R = _cases(vertices, faces, drafts, R)
+
+    volumes = np.empty(len(R))
+    centroids = np.empty((len(R), 3))
+
+    for b, (draft, Rb) in enumerate(zip(drafts, R)):
+        v_sub, f_sub = clip_and_cap_reference(vertices @ Rb.T, faces, draft)
+        volumes[b], centroids[b] = volume_and_centroid_reference(v_sub, f_sub)
+
+    return volumes, centroids
+
+
+def _python_volume_and_centroid(vertices, faces):
+    return volume_and_centroid_reference(*mesh_arrays(vertices, faces))
+
+
+def _python_signed_volume(vertices, faces):
+    return signed_volume_reference(*mesh_arrays(vertices, faces))
+
+
+# ----------------------------
+# numpy: vectorized
+# ----------------------------
+
+def _numpy_buoyancy(vertices, faces, drafts, R):
+    # Imported here: hydrostatics.fused builds on sweep, which uses
+    # this registry
+    from hydrostatics.fused import fused_moments
+
+    vertices, faces, drafts, R = _cases(vertices, faces, drafts, R)
+
+    V = np.empty(len(R))
+    C = np.empty((len(R), 3))
+
+    for b, (draft, Rb) in enumerate(zip(drafts, R)):
+        V[b], C[b], _ = fused_moments(vertices, faces, draft, Rb)
+
+    return _finish(V, C)
+
+
+def _numpy_volume_and_centroid(vertices, faces):
+    return volume_and_centroid(vertices, faces)
+
+
+def _numpy_signed_volume(vertices, faces):
+    return signed_volume(vertices, faces)
+
+
+# ----------------------------
+# numba: compiled loops
+# ----------------------------
+
+def _numba_available():
+    return importlib.util.find_spec("numba") is not None
+
+
+def _numba_arrays(vertices, faces):
+    vertices, faces = mesh_arrays(vertices, faces)
+    return (np.ascontiguousarray(vertices, dtype=np.float64),
+            np.ascontiguousarray(faces))
+
+
+def _numba_buoyancy(vertices, faces, drafts, R):
+    from hydrostatics import numba_kernels
+
+    vertices, faces, drafts, R = _cases(vertices, faces, drafts, R)
+    vertices, faces = _numba_arrays(vertices, faces)
+
+    out = numba_kernels.buoyancy_moments(
+        vertices, faces, np.ascontiguousarray(drafts), np.ascontiguousarray(R)
+    ).sum(axis=1)
+
+    return _finish(out[:, 0], out[:, 1:])
+
+
+def _numba_volume_and_centroid(vertices, faces):
+    from hydrostatics import numba_kernels
+
+    out = numba_kernels.volume_moments(
+        *_numba_arrays(vertices, faces)
+    ).sum(axis=0)
+
+    if abs(out[0]) < 1e-12:
+        raise ValueError("Computed volume is zero or very small.")
+
+    return abs(out[0]), out[1:] / out[0]
+
+
+def _numba_signed_volume(vertices, faces):
+    from hydrostatics import numba_kernels
+
+    out = numba_kernels.volume_moments(*_numba_arrays(vertices, faces))
+
+    return abs(out[:, 0].sum())
+
+
+def _finish(V, C):
+    """
+    Positive volumes and centroids from signed sums.
+    """
+
+    if np.any(np.abs(V) < 1e-12):
+        raise ValueError("Computed volume is zero or very small.")
+
+    return np.abs(V), C / V[:, None]
+
+
+register_backend(Backend(
+    "python", _python_signed_volume, _python_volume_and_centroid,
+    _python_buoyancy
+))
+register_backend(Backend(
+    "numpy", _numpy_signed_volume, _numpy_volume_and_centroid,
+    _numpy_buoyancy
+))
+register_backend(Backend(
+    "numba", _numba_signed_volume, _numba_volume_and_centroid,
+    _numba_buoyancy, available=_numba_available
+))
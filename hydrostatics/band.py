@@ -0,0 +1,246 @@
+"""
+Band-limited clipping for draft x heel grids.
+
+At a given heel only the faces straddling the waterplane need to be
+clipped. For every heel angle the faces are sorted once by the lowest
+point of their extent along the plane normal (heeled z, i.e.
+sin(heel) y + cos(heel) z in the body frame), and suffix sums of the
+per-face moment table are stored in that order. Then, for each draft:
+
+    lo >= draft                     fully submerged: one suffix-sum row
+    draft - span <= lo < draft      the band: classified and clipped
+    lo < draft - span               dry (hi <= lo + span < draft)
+
+where span bounds the face extents. Both bounds are binary searches,
+so the per-draft cost scales with the number of faces near the
+waterline instead of the whole hull. The few faces taller than span
+(deck and end closure fans) are checked explicitly.
+
+Building the index is not band-limited: every heel angle rotates all
+vertices, sorts all faces and sums the whole moment table, which costs
+more than a full heel sweep at one draft (the sort is the smaller
+part). Only the per-draft work scales with the waterline length, so
+the grid pays off with many drafts per heel angle: about 10 or more
+on 121x121 and 251x251 Wigley hulls (GRID_MIN_DRAFTS; cross curves,
+loading-condition sweeps). Heel sweeps at one or a few drafts are
+faster with hydrostatics.sweep.
+"""
+
+import numpy as np
+
+from geometry.transform import heel_matrix
+from hydrostatics.clip import _partial_corner_order
+from hydrostatics.sweep import (
+    mesh_table, full_face_moments, partial_face_moments, cap_moments
+)
+
+# Faces taller than this quantile of the extents (times 2) are kept
+# out of the band bound and checked explicitly
+SPAN_QUANTILE = 0.99
+
+# Rough bytes per band face in band_moments, for draft chunking
+_BYTES_PER_BAND_FACE = 400
+
+# Drafts per heel angle from which buoyancy_grid beats buoyancy_sweep
+# per draft (121x121 and 251x251 Wigley hulls, 31 heels)
+GRID_MIN_DRAFTS = 10
+
+
+def band_index(vertices, faces, table, theta):
+    """
+    Sorted face extents along the heeled vertical for one heel angle.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    table : ndarray (M, n)
+        Per-face table (see sweep.mesh_table)
+    theta : float
+        Heel angle in radians
+
+    Returns
+    -------
+    index : dict
+        R (body to earth rotation); h (heeled z of every vertex);
+        order, lo (faces sorted by lowest heeled z); span; tall (sorted
+        positions and highest z of the faces taller than span); suffix
+        ((M + 1, n), suffix[k] = sum of table rows order[k:])
+    """
+
+    R = heel_matrix(theta)
+    h = vertices @ R[2]
+
+    hf = h[faces]
+    lo = hf.min(axis=1)
+    hi = hf.max(axis=1)
+
+    order = np.argsort(lo)
+    lo = lo[order]
+    hi = hi[order]
+
+    extent = hi - lo
+    span = 2.0 * np.quantile(extent, SPAN_QUANTILE) if len(extent) else 0.0
+    tall = np.flatnonzero(extent > span)
+
+    suffix = np.zeros((len(order) + 1, table.shape[1]))
+    suffix[:-1] = np.cumsum(table[order][::-1], axis=0)[::-1]
+
+    return {
+        "R": R,
+        "h": h,
+        "order": order,
+        "lo": lo,
+        "span": span,
+        "tall": tall,
+        "tall_hi": hi[tall],
+        "suffix": suffix,
+    }
+
+
+def band_moments(vertices, faces, index, drafts, cap_free):
+    """
+    Signed volume, first moment and waterplane sums at every draft for
+    the heel angle of a band index.
+
+    Returns
+    -------
+    V : ndarray (D,)
+    C : ndarray (D, 3)
+        Earth-frame first moment
+    W : ndarray (D, 5)
+        Waterplane shoelace sums
+    """
+
+    n_batch = len(drafts)
+    R = index["R"]
+    lo = index["lo"]
+
+    # Fully submerged: the suffix from the first lo >= draft
+    i_full = np.searchsorted(lo, drafts, side="left")
+    V, C = full_face_moments(
+        index["suffix"][i_full], drafts,
+        np.broadcast_to(R, (n_batch, 3, 3)), cap_free
+    )
+
+    # Band: sorted positions [i_band, i_full) of every draft ...
+    i_band = np.searchsorted(lo, drafts - index["span"], side="left")
+    counts = i_full - i_band
+    b = np.repeat(np.arange(n_batch), counts)
+    pos = np.arange(counts.sum()) + np.repeat(i_band - np.cumsum(counts)
+                                              + counts, counts)
+
+    # ... plus the tall faces below the band that reach the waterplane
+    tall = index["tall"]
+    tb, tk = np.nonzero(
+        (tall[None, :] < i_band[:, None])
+        & (index["tall_hi"][None, :] >= drafts[:, None])
+    )
+    b = np.concatenate([b, tb])
+    pos = np.concatenate([pos, tall[tk]])
+
+    m = index["order"][pos]
+    h = index["h"]
+
+    S = h[faces[m]] >= drafts[b][:, None]
+    n_sub = S.sum(axis=1)
+    part = n_sub > 0
+
+    b, m, S, n_sub = b[part], m[part], S[part], n_sub[part]
+
+    if len(b) == 0:
+        return V, C, np.zeros((n_batch, 5))
+
+    # Heeled corners of the partial faces only
+    ids = np.take_along_axis(faces[m], _partial_corner_order(S, n_sub), axis=1)
+    P = vertices[ids] @ R.T
+    P[..., 2] = h[ids]
+
+    one = (n_sub == 1)[:, None]
+    V_p, C_p, W, start, end = partial_face_moments(
+        P, one, b, drafts, n_batch, cap_free
+    )
+    V += V_p
+    C += C_p
+
+    if not cap_free:
+        V_c, C_c = cap_moments(start, end, b, drafts, n_batch)
+        V += V_c
+        C += C_c
+
+    return V, C, W
+
+
+def _grid(vertices, faces, drafts, theta, memory_budget, cap_free):
+    """
+    V (D, A), C (D, A, 3) and W (D, A, 5) over a draft x heel grid.
+    """
+
+    vertices, faces, table = mesh_table(vertices, faces, cap_free)
+
+    n_d, n_a = len(drafts), len(theta)
+    V = np.empty((n_d, n_a))
+    C = np.empty((n_d, n_a, 3))
+    W = np.empty((n_d, n_a, 5))
+
+    for j, th in enumerate(theta):
+        index = band_index(vertices, faces, table, th)
+
+        # Chunk the drafts so the band faces fit the memory budget
+        lo = index["lo"]
+        n_band = (np.searchsorted(lo, drafts)
+                  - np.searchsorted(lo, drafts - index["span"]))
+        load = np.cumsum(n_band + len(index["tall"])) * _BYTES_PER_BAND_FACE
+
+        start = 0
+        while start < n_d:
+            base = load[start - 1] if start else 0
+            stop = max(start + 1, int(np.searchsorted(
+                load, base + memory_budget, side="right")))
+            chunk = slice(start, stop)
+            V[chunk, j], C[chunk, j], W[chunk, j] = band_moments(
+                vertices, faces, index, drafts[chunk], cap_free
+            )
+            start = stop
+
+    if np.any(np.abs(V) < 1e-12):
+        raise ValueError("Computed volume is zero or very small.")
+
+    return V, C, W
+
+
+def buoyancy_grid(vertices, faces, drafts, angles_deg,
+                  memory_budget=64 * 2**20, cap_free=False):
+    """
+    Submerged volume and buoyancy centroid over a draft x heel grid.
+
+    Same results as buoyancy_sweep per draft (up to rounding), with one
+    band index per heel angle shared by all drafts. Faster than
+    buoyancy_sweep per draft only with many drafts (see module
+    docstring).
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    drafts : array_like (D,)
+    angles_deg : array_like (A,)
+        Heel angles in degrees
+    memory_budget : int
+        Approximate working memory of the band clip, in bytes
+    cap_free : bool
+        See buoyancy_sweep
+
+    Returns
+    -------
+    volumes : ndarray (D, A)
+    centroids : ndarray (D, A, 3)
+        Buoyancy centroids in the heeled (earth) frame
+    """
+
+    drafts = np.atleast_1d(np.asarray(drafts, dtype=float))
+    theta = np.deg2rad(np.atleast_1d(np.asarray(angles_deg, dtype=float)))
+
+    V, C, _ = _grid(vertices, faces, drafts, theta, memory_budget, cap_free)
+
+    return np.abs(V), C / V[..., None]
@@ -4,34 +4,45 @@ Mesh clipping utilities for hydrostatics.
 # Waterplane closure via fan triangulation.
 # This introduces small centroid bias that converges with mesh refinement.
 # Acceptable for Phase 2 (research-grade hydrostatics).
+# Cap-free integration (close=False, reference point on the waterplane)
+# avoids the closure altogether.
+
+from time import perf_counter
 
 import numpy as np
 
+from geometry.hull_mesh import mesh_arrays
+from utils import profiling
+
 def is_submerged(vertex, draft):
     """
-    Check if a vertex is below the waterplane.
+    Check if a vertex (or an array of vertices) is below the waterplane.
     """
-    return vertex[2] >= draft
+    return vertex[..., 2] >= draft
 
 def intersect_edge_with_plane(v1, v2, draft):
     """
     Compute intersection point of an edge with horizontal plane z = draft.
 
     Assumes v1 and v2 lie on opposite sides of the plane.
+    Also accepts stacked edges, v1 and v2 of shape (K, 3).
     """
 
-    z1 = v1[2]
-    z2 = v2[2]
+    z1 = v1[..., 2]
+    z2 = v2[..., 2]
 
     # Linear interpolation factor
     t = (draft - z1) / (z2 - z1)
 
-    return v1 + t * (v2 - v1)
+    return v1 + t[..., None] * (v2 - v1)
 
-def clip_mesh_at_draft(vertices, faces, draft):
+def clip_mesh_at_draft_reference(vertices, faces, draft):
     """
     Clip a closed mesh at a given draft and return submerged mesh.
 
+    Readable face-by-face implementation, kept as the reference
+    for the vectorized clip_mesh_at_draft.
+
     Parameters
     ----------
     vertices : ndarray (N, 3)
@@ -84,7 +95,17 @@ def clip_mesh_at_draft(vertices, faces, draft):
             sub_ids = []
             dry_ids = []
 
-            for i in range(3):
+            # Walk the corners in cyclic order starting after the
+            # lone dry corner (two submerged) or at the lone submerged
+            # corner (one submerged), so new faces keep the orientation
+            # of the original face.
+            if n_sub == 1:
+                start = submerged.index(True)
+            else:
+                start = submerged.index(False) + 1
+
+            for k in range(3):
+                i = (start + k) % 3
                 if submerged[i]:
                     sub_ids.append(v_ids[i])
                 else:
@@ -130,7 +151,7 @@ def clip_mesh_at_draft(vertices, faces, draft):
                 new_faces.append([i_sub1, i_sub2, i_p2])
                 new_faces.append([i_sub1, i_p2, i_p1])
 
-                waterline_edges.append((i_p1, i_p2))
+                waterline_edges.append((i_p2, i_p1))
 
     # ===============================
     # Close the waterplane (z = draft)
@@ -165,11 +186,390 @@ def clip_mesh_at_draft(vertices, faces, draft):
         center_index = len(new_vertices)
         new_vertices.append(center)
 
+        # The fan runs counter-clockwise in x–y; the cap must run
+        # against the waterline edges (directed along the hull)
+        wl_area = 0.0
+        for i_a, i_b in waterline_edges:
+            a, b = new_vertices[i_a], new_vertices[i_b]
+            wl_area += a[0] * b[1] - b[0] * a[1]
+
         # Fan triangulation of waterplane
         for i in range(len(wl_indices)):
             i0 = wl_indices[i]
             i1 = wl_indices[(i + 1) % len(wl_indices)]
 
+            if wl_area > 0.0:
+                i0, i1 = i1, i0
+
             new_faces.append([i0, i1, center_index])
 
     return np.array(new_vertices), np.array(new_faces)
+
+
+def clip_and_cap_reference(vertices, faces, draft):
+    """
+    Clip a closed mesh at a given draft, closing the waterplane with one
+    cap triangle per waterline segment.
+
+    Readable face-by-face implementation of the closure used by the
+    sweep and the fused kernel: each waterline segment (start, end)
+    gets the cap triangle (end, start, (0, 0, draft)). Unlike the fan
+    of clip_mesh_at_draft_reference this is exact for any number and
+    shape of waterline loops. Reference for the python compute backend.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    draft : float
+
+    Returns
+    -------
+    vertices_sub : ndarray (3K, 3)
+        Corners of the K submerged and cap triangles (not shared)
+    faces_sub : ndarray (K, 3)
+    """
+
+    triangles = []
+    cap_center = np.array([0.0, 0.0, draft])
+
+    for f in faces:
+        verts = [vertices[i] for i in f]
+        submerged = [is_submerged(v, draft) for v in verts]
+
+        n_sub = sum(submerged)
+
+        if n_sub == 0:
+            continue
+
+        if n_sub == 3:
+            triangles.append(verts)
+            continue
+
+        # Cyclic corner order as in clip_mesh_at_draft_reference
+        if n_sub == 1:
+            start = submerged.index(True)
+        else:
+            start = submerged.index(False) + 1
+
+        a, b, c = [verts[(start + k) % 3] for k in range(3)]
+
+        if n_sub == 1:
+            # a submerged: (a, p1, p2), segment p1 -> p2
+            p1 = intersect_edge_with_plane(a, b, draft)
+            p2 = intersect_edge_with_plane(a, c, draft)
+            triangles.append([a, p1, p2])
+            seg_start, seg_end = p1, p2
+        else:
+            # c dry: (a, b, p2) + (a, p2, p1), segment p2 -> p1
+            p1 = intersect_edge_with_plane(a, c, draft)
+            p2 = intersect_edge_with_plane(b, c, draft)
+            triangles.append([a, b, p2])
+            triangles.append([a, p2, p1])
+            seg_start, seg_end = p2, p1
+
+        # Cap triangle against the segment
+        triangles.append([seg_end, seg_start, cap_center])
+
+    vertices_sub = np.array(triangles, dtype=float).reshape(-1, 3)
+    faces_sub = np.arange(len(vertices_sub)).reshape(-1, 3)
+
+    return vertices_sub, faces_sub
+
+
+def _partial_corner_order(sub, n_sub):
+    """
+    Corner permutation (M, 3) that lists submerged corners first and dry
+    corners last while keeping the cyclic order of each face, so clipped
+    triangles keep the original orientation. Identity for faces that
+    are not partial.
+    """
+
+    one = n_sub == 1
+    two = n_sub == 2
+
+    start = np.zeros(len(sub), dtype=np.int64)
+    start[one] = np.argmax(sub[one], axis=1)
+    start[two] = np.argmin(sub[two], axis=1) + 1
+
+    return (start[:, None] + np.arange(3)) % 3
+
+
+def _clip_faces(vertices, faces, draft):
+    """
+    Vectorized clip of the hull surface (no waterplane closure).
+
+    Vertices and faces are emitted in exactly the order the
+    face-by-face reference produces them: original vertices get a new
+    index at their first use, intersection points are always new.
+
+    Returns
+    -------
+    vertices_sub : ndarray (K, 3)
+    faces_sub : ndarray (F, 3)
+    waterline_edges : ndarray (E, 2)
+        Pairs of intersection point indices, one per partial face,
+        directed along the boundary of the submerged part of the face
+        (so they chain head to tail into closed waterline loops)
+    """
+
+    prof = profiling.active()
+    if prof:
+        t = perf_counter()
+
+    # --- classify every face at once ---
+    sub = is_submerged(vertices, draft)[faces]          # (M, 3)
+    n_sub = sub.sum(axis=1)
+
+    keep = n_sub > 0
+    n_faces_in = len(faces)
+    faces = faces[keep]
+    sub = sub[keep]
+    n_sub = n_sub[keep]
+
+    full = n_sub == 3
+    one = n_sub == 1
+    two = n_sub == 2
+
+    if prof:
+        t = prof.lap("clip.classify", t)
+        prof.count("faces_full", full.sum())
+        prof.count("faces_partial", len(faces) - full.sum())
+        prof.count("faces_dry", n_faces_in - len(faces))
+
+    # Submerged corners first, dry corners last, in cyclic order
+    P = np.take_along_axis(faces, _partial_corner_order(sub, n_sub), axis=1)
+
+    # --- edge–plane intersections for all partial faces ---
+    partial = ~full
+    Pp = P[partial]
+    one_p = one[partial]
+
+    # one submerged: p1 = (s, d1), p2 = (s, d2)
+    # two submerged: p1 = (s1, d),  p2 = (s2, d)
+    a1 = Pp[:, 0]
+    b1 = np.where(one_p, Pp[:, 1], Pp[:, 2])
+    a2 = np.where(one_p, Pp[:, 0], Pp[:, 1])
+    b2 = Pp[:, 2]
+
+    p1 = intersect_edge_with_plane(vertices[a1], vertices[b1], draft)
+    p2 = intersect_edge_with_plane(vertices[a2], vertices[b2], draft)
+
+    n_part = len(Pp)
+    points = np.empty((2 * n_part, 3))
+    points[0::2] = p1
+    points[1::2] = p2
+
+    if prof:
+        t = prof.lap("clip.intersect", t)
+        prof.count("intersection_points", 2 * n_part)
+
+    # --- slot stream: what each face contributes, in order ---
+    # full : [v0, v1, v2, -]
+    # one  : [s, p1, p2, -]
+    # two  : [s1, s2, p1, p2]
+    n_faces = len(faces)
+    slot_val = np.full((n_faces, 4), -1, dtype=np.int64)
+    slot_new = np.zeros((n_faces, 4), dtype=bool)
+
+    slot_val[full, :3] = faces[full]
+
+    point_id = np.arange(n_part, dtype=np.int64)
+    rows = np.flatnonzero(partial)
+    rows_one = rows[one_p]
+    rows_two = rows[~one_p]
+    pid_one = point_id[one_p]
+    pid_two = point_id[~one_p]
+
+    slot_val[rows_one, 0] = P[rows_one, 0]
+    slot_val[rows_one, 1] = 2 * pid_one
+    slot_val[rows_one, 2] = 2 * pid_one + 1
+    slot_new[rows_one, 1:3] = True
+
+    slot_val[rows_two, 0] = P[rows_two, 0]
+    slot_val[rows_two, 1] = P[rows_two, 1]
+    slot_val[rows_two, 2] = 2 * pid_two
+    slot_val[rows_two, 3] = 2 * pid_two + 1
+    slot_new[rows_two, 2:4] = True
+
+    valid = np.zeros((n_faces, 4), dtype=bool)
+    valid[:, :3] = True
+    valid[two, 3] = True
+
+    val = slot_val[valid]
+    is_new = slot_new[valid]
+    is_orig = ~is_new
+
+    # --- index arithmetic for new vertex numbering ---
+    orig_pos = np.flatnonzero(is_orig)
+    uniq, first, inverse = np.unique(
+        val[orig_pos], return_index=True, return_inverse=True
+    )
+
+    creates = is_new.copy()
+    creates[orig_pos[first]] = True
+
+    new_index = np.cumsum(creates) - 1
+    new_index[orig_pos] = new_index[orig_pos[first]][inverse]
+
+    create_pos = np.flatnonzero(creates)
+    create_new = is_new[create_pos]
+    create_val = val[create_pos]
+
+    vertices_sub = np.empty((len(create_pos), 3))
+    vertices_sub[~create_new] = vertices[create_val[~create_new]]
+    vertices_sub[create_new] = points[create_val[create_new]]
+
+    # --- faces from slot indices ---
+    slot_idx = np.full((n_faces, 4), -1, dtype=np.int64)
+    slot_idx[valid] = new_index
+
+    tri = np.empty((n_faces, 2, 3), dtype=np.int64)
+    tri[:, 0] = slot_idx[:, :3]
+    tri[two, 0] = slot_idx[two][:, [0, 1, 3]]
+    tri[two, 1] = slot_idx[two][:, [0, 3, 2]]
+
+    tri_valid = np.zeros((n_faces, 2), dtype=bool)
+    tri_valid[:, 0] = True
+    tri_valid[two, 1] = True
+
+    faces_sub = tri[tri_valid]
+
+    # --- waterline edges per partial face: one (p1, p2), two (p2, p1) ---
+    part_idx = slot_idx[partial]
+    waterline_edges = np.where(
+        one_p[:, None], part_idx[:, 1:3], part_idx[:, [3, 2]]
+    )
+
+    if prof:
+        prof.lap("clip.assemble", t)
+        prof.count("bytes_allocated", vertices_sub.nbytes + faces_sub.nbytes)
+
+    return vertices_sub, faces_sub, waterline_edges
+
+
+def _count_loops(prof, start, end):
+    """
+    Profiling only: number of waterline loops (chains the segments).
+    """
+
+    from hydrostatics.waterplane import waterline_loops
+
+    prof.count("waterline_loops", len(waterline_loops(start, end)))
+
+
+def _close_waterplane(vertices_sub, faces_sub, waterline_edges, draft):
+    """
+    Close the waterplane (z = draft) with a fan around the mean
+    waterline point, matching the reference closure.
+
+    The reference fans the waterline points in the order of a Python
+    set filled edge by edge; the same set (same insertion order) and
+    the same argsort give the same fan, also where angles tie.
+    """
+
+    if len(waterline_edges) == 0:
+        return vertices_sub, faces_sub
+
+    wl_indices = np.array(
+        list(set(waterline_edges.ravel().tolist())), dtype=np.int64
+    )
+    wl_vertices = vertices_sub[wl_indices]
+
+    # Sort vertices around perimeter using angle in x–y plane
+    xy = wl_vertices[:, :2]
+    center_xy = xy.mean(axis=0)
+
+    angles = np.arctan2(
+        xy[:, 1] - center_xy[1],
+        xy[:, 0] - center_xy[0]
+    )
+
+    wl_indices = wl_indices[np.argsort(angles)]
+
+    # Create center vertex on waterplane
+    center = wl_vertices.mean(axis=0)
+    center[2] = draft
+
+    center_index = len(vertices_sub)
+
+    # Counter-clockwise fan, reversed if the waterline edges (directed
+    # along the hull) run counter-clockwise too
+    a = vertices_sub[waterline_edges[:, 0]]
+    b = vertices_sub[waterline_edges[:, 1]]
+    if np.sum(a[:, 0] * b[:, 1] - b[:, 0] * a[:, 1]) > 0.0:
+        fan_a, fan_b = np.roll(wl_indices, -1), wl_indices
+    else:
+        fan_a, fan_b = wl_indices, np.roll(wl_indices, -1)
+
+    fan = np.column_stack([
+        fan_a,
+        fan_b,
+        np.full(len(wl_indices), center_index)
+    ])
+
+    vertices_sub = np.vstack([vertices_sub, center])
+    faces_sub = np.vstack([faces_sub, fan])
+
+    return vertices_sub, faces_sub
+
+
+def clip_mesh_at_draft(vertices, faces, draft, return_cap=False, close=True):
+    """
+    Clip a closed mesh at a given draft and return submerged mesh.
+
+    Vectorized over faces; produces the same mesh as
+    clip_mesh_at_draft_reference.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    draft : float
+    return_cap : bool
+        Also return the number of waterplane cap faces
+    close : bool
+        Close the waterplane. An open clip is enough for integration
+        about a point on the waterplane (volume_and_centroid with
+        reference=(0, 0, draft)), where the cap contributes nothing.
+
+    Returns
+    -------
+    vertices_sub : ndarray
+    faces_sub : ndarray
+    n_cap : int
+        Only if return_cap; the last n_cap faces close the waterplane
+    """
+
+    vertices, faces = mesh_arrays(vertices, faces)
+
+    vertices_sub, faces_sub, waterline_edges = _clip_faces(
+        vertices, faces, draft
+    )
+
+    n_body = len(faces_sub)
+
+    prof = profiling.active()
+    if prof:
+        _count_loops(prof, vertices_sub[waterline_edges[:, 0]],
+                     vertices_sub[waterline_edges[:, 1]])
+
+    if not close:
+        if return_cap:
+            return vertices_sub, faces_sub, 0
+        return vertices_sub, faces_sub
+
+    if prof:
+        t = perf_counter()
+
+    vertices_sub, faces_sub = _close_waterplane(
+        vertices_sub, faces_sub, waterline_edges, draft
+    )
+
+    if prof:
+        prof.lap("clip.waterplane", t)
+
+    if return_cap:
+        return vertices_sub, faces_sub, len(faces_sub) - n_body
+
+    return vertices_sub, faces_sub
@@ -0,0 +1,114 @@
+"""
+Mesh-resolution convergence control for KN.
+
+KN is evaluated on two or three nested Wigley meshes (grid spacing
+divided by `ratio` at each level), the discretization error is modelled
+as C h^p, and the finest result is improved by Richardson extrapolation.
+From the same model the coarsest resolution that meets a KN tolerance
+is predicted, so production runs need not over-mesh. Meshes come from
+the mesh cache, so repeated studies reuse every level.
+"""
+
+import numpy as np
+
+from geometry.hull import wigley_hull
+from hydrostatics.sweep import compute_KN_GZ
+
+# Order assumed when it cannot be observed (linear elements: h^2)
+DEFAULT_ORDER = 2.0
+
+
+def richardson(coarse, fine, ratio, order):
+    """
+    Richardson extrapolation of two solutions at spacing h and h / ratio.
+    """
+
+    return fine + (fine - coarse) / (ratio**order - 1.0)
+
+
+def observed_order(K1, K2, K3, ratio):
+    """
+    Observed convergence order from three nested levels (coarse first),
+    using the max-norm of the level differences. Falls back to
+    DEFAULT_ORDER when the differences do not shrink monotonically.
+    """
+
+    d12 = np.max(np.abs(K1 - K2))
+    d23 = np.max(np.abs(K2 - K3))
+
+    if d23 <= 0.0 or d12 <= d23:
+        return DEFAULT_ORDER
+
+    return float(np.clip(np.log(d12 / d23) / np.log(ratio), 0.5, 4.0))
+
+
+def kn_convergence(L, B, T, draft, angles_deg, tol, n_coarse=31, levels=3,
+                   ratio=2):
+    """
+    KN convergence study with Richardson extrapolation.
+
+    Parameters
+    ----------
+    L, B, T, draft : float
+    angles_deg : array_like (A,)
+    tol : float
+        Requested max KN error [m]
+    n_coarse : int
+        NX = NZ of the coarsest level
+    levels : int
+        2 (order assumed) or 3 (order observed)
+    ratio : int
+        Grid refinement ratio between levels
+
+    Returns
+    -------
+    study : dict
+        resolutions : list of (NX, NZ) evaluated
+        KN : ndarray (levels, A), KN at every level
+        KN_extrapolated : ndarray (A,)
+        order : convergence order used
+        errors : ndarray (levels,), estimated max KN error per level
+        recommended : (NX, NZ), coarsest resolution predicted to meet tol
+    """
+
+    if levels not in (2, 3):
+        raise ValueError("levels must be 2 or 3")
+
+    angles_deg = np.asarray(angles_deg, dtype=float)
+
+    resolutions = []
+    KN = []
+
+    for k in range(levels):
+        n = (n_coarse - 1) * ratio**k + 1
+        v, f = wigley_hull(L, B, T, n, n)
+        KN.append(compute_KN_GZ(v, f, 0.0, draft, angles_deg)[0])
+        resolutions.append((n, n))
+
+    KN = np.array(KN)
+
+    if levels == 3:
+        order = observed_order(KN[0], KN[1], KN[2], ratio)
+    else:
+        order = DEFAULT_ORDER
+
+    KN_ext = richardson(KN[-2], KN[-1], ratio, order)
+    errors = np.max(np.abs(KN - KN_ext), axis=1)
+
+    # err(h) = err_fine (h / h_fine)^p  ->  spacing that just meets tol
+    n_fine = resolutions[-1][0]
+    if errors[-1] > 0.0:
+        h_ratio = (tol / errors[-1]) ** (1.0 / order)
+        n_req = int(np.ceil((n_fine - 1) / h_ratio)) + 1
+    else:
+        n_req = n_coarse
+    n_req = max(n_req, 3)
+
+    return {
+        "resolutions": resolutions,
+        "KN": KN,
+        "KN_extrapolated": KN_ext,
+        "order": order,
+        "errors": errors,
+        "recommended": (n_req, n_req),
+    }
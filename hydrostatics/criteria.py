@@ -0,0 +1,409 @@
+"""
+Intact stability criteria over batches of GZ curves.
+
+All metrics are computed at once for K curves given as a (K, A) array
+over a shared (A,) or per-row (K, A) grid of increasing heel angles in
+degrees:
+
+    area_0_30, area_0_40, area_30_40    area under GZ (m rad)
+    GZ_max, angle_GZ_max                largest GZ and its heel (deg)
+    GZ_max_30                           largest GZ at heel >= 30 deg
+    GM0                                 initial slope of GZ (m / rad)
+    vanishing_angle                     first downcrossing of GZ (deg)
+    range                               of positive stability (deg)
+
+Areas use the cumulative trapezoid rule or, by default (method
+"simpson"), the averaged-quadratic rule: each interval integrates the
+mean of the quadratics through it and its left and right neighbours,
+so non-uniform grids and limits between grid angles are handled alike.
+On a uniform grid its weights are (-1, 13, 13, -1) h / 24 per interior
+interval, exact for cubics (not the composite Simpson rule, whose
+weights alternate between intervals). Areas from 0 deg need a grid
+that starts at or below 0 deg. Curves with a NaN anywhere get NaN for
+every metric, so they fail every criterion. The maximum is refined by
+a parabola through the largest sample and its neighbours, and the
+vanishing angle by Newton iterations on the same interpolant,
+bracketed by the sign change.
+
+evaluate_criteria compares the metrics with minimum values (default:
+IMO IS Code 2008, Part A, 2.2) and returns a pass/fail table.
+"""
+
+import numpy as np
+
+# metric: minimum value (areas m rad, GZ and GM m, angles deg)
+IS_CODE_2008 = {
+    "area_0_30": 0.055,
+    "area_0_40": 0.090,
+    "area_30_40": 0.030,
+    "GZ_max_30": 0.20,
+    "angle_GZ_max": 25.0,
+    "GM0": 0.15,
+}
+
+METRICS = (
+    "area_0_30", "area_0_40", "area_30_40", "GZ_max", "angle_GZ_max",
+    "GZ_max_30", "GM0", "vanishing_angle", "range",
+)
+
+# Newton steps for the vanishing angle
+_ROOT_ITERATIONS = 4
+
+
+def _grid(angles_deg, GZ):
+    """
+    (K, A) radians and GZ, with a per-row grid broadcast if shared.
+    """
+
+    GZ = np.atleast_2d(np.asarray(GZ, dtype=float))
+    x = np.deg2rad(np.asarray(angles_deg, dtype=float))
+
+    if x.ndim == 1:
+        x = np.broadcast_to(x, GZ.shape)
+
+    if x.shape != GZ.shape:
+        raise ValueError("angles_deg must have shape (A,) or that of GZ.")
+    if GZ.shape[1] < 3:
+        raise ValueError("At least 3 heel angles are needed.")
+    if np.any(np.diff(x, axis=1) <= 0.0):
+        raise ValueError("Heel angles must be increasing.")
+
+    return x, GZ
+
+
+def _quadratics(x, y, shift=0, i=None):
+    """
+    Newton form of the quadratic used on every interval [x_i, x_i+1]
+    (or only on interval i (K,) of every row): through nodes
+    i + shift .. i + shift + 2, kept inside the grid.
+
+    Returns
+    -------
+    x0, x1, y0, f01, f012 : ndarray (K, A - 1), or (K,) with i
+        p(t) = y0 + f01 (t - x0) + f012 (t - x0) (t - x1)
+    """
+
+    n = x.shape[1] - 1
+
+    # First node of the fit
+    if i is None:
+        rows, j = slice(None), np.clip(np.arange(n) + shift, 0, n - 2)
+    else:
+        rows, j = np.arange(len(x)), np.clip(i + shift, 0, n - 2)
+
+    x0, x1, x2 = x[rows, j], x[rows, j + 1], x[rows, j + 2]
+    y0, y1, y2 = y[rows, j], y[rows, j + 1], y[rows, j + 2]
+
+    f01 = (y1 - y0) / (x1 - x0)
+    f12 = (y2 - y1) / (x2 - x1)
+    f012 = (f12 - f01) / (x2 - x0)
+
+    return x0, x1, y0, f01, f012
+
+
+def _primitive(q, t):
+    """
+    Integral of the quadratics q from their x0 to t.
+    """
+
+    x0, x1, y0, f01, f012 = q
+    s = t - x0
+    h = x1 - x0
+
+    return y0 * s + f01 * s**2 / 2.0 + f012 * (s**3 / 3.0 - h * s**2 / 2.0)
+
+
+def _integral(qs, a, b):
+    """
+    Integral from a to b of the mean of the quadratics in qs.
+    """
+
+    return sum(_primitive(q, b) - _primitive(q, a) for q in qs) / len(qs)
+
+
+def _cumulative_area(x, y, method):
+    """
+    Area from the first angle to every grid angle, (K, A), and the
+    per-interval quadratics (None for the trapezoid rule).
+
+    "simpson": every interior interval averages the quadratics through
+    its left and right neighbours (weights (-1, 13, 13, -1) h / 24 on a
+    uniform grid, exact for cubics); the end intervals use the one
+    quadratic inside the grid.
+    """
+
+    if method == "trapezoid":
+        piece = 0.5 * (y[:, 1:] + y[:, :-1]) * np.diff(x, axis=1)
+        q = None
+    elif method == "simpson":
+        q = (_quadratics(x, y, 0), _quadratics(x, y, -1))
+        piece = _integral(q, x[:, :-1], x[:, 1:])
+    else:
+        raise ValueError(f"Unknown integration method: {method!r}")
+
+    area = np.zeros_like(y)
+    np.cumsum(piece, axis=1, out=area[:, 1:])
+
+    return area, q
+
+
+def _area_to(limit, x, y, area, q, x_end):
+    """
+    Area from the first angle to limit (K,) radians; NaN beyond the
+    grid (which ends at x_end).
+    """
+
+    rows = np.arange(len(x))
+    n = x.shape[1] - 1
+
+    i = np.clip((x < limit[:, None]).sum(axis=1) - 1, 0, n - 1)
+    xi, xj = x[rows, i], x[rows, i + 1]
+    yi, yj = y[rows, i], y[rows, i + 1]
+
+    if q is None:
+        # Trapezoid to the limit with linearly interpolated GZ
+        y_lim = yi + (yj - yi) * (limit - xi) / (xj - xi)
+        part = 0.5 * (yi + y_lim) * (limit - xi)
+    else:
+        qi = [tuple(c[rows, i] for c in qk) for qk in q]
+        part = _integral(qi, xi, limit)
+
+    out = area[rows, i] + part
+
+    return np.where((limit < x[:, 0]) | (limit > x_end), np.nan, out)
+
+
+def _maximum(x, y, lower=None):
+    """
+    Largest GZ and its angle, refined by the parabola through the
+    largest sample and its neighbours (only at heel >= lower).
+    """
+
+    rows = np.arange(len(x))
+    n = x.shape[1]
+
+    masked = y if lower is None else np.where(
+        x >= lower[:, None], y, -np.inf
+    )
+    k = np.argmax(masked, axis=1)
+    y_max = masked[rows, k]
+    x_max = x[rows, k]
+
+    # Parabola through k - 1, k, k + 1 (interior maxima only)
+    inner = (k > 0) & (k < n - 1)
+    if lower is not None:
+        inner &= x[rows, np.maximum(k - 1, 0)] >= lower
+    km, kp = np.maximum(k - 1, 0), np.minimum(k + 1, n - 1)
+
+    xa, xb, xc = x[rows, km], x_max, x[rows, kp]
+    ya, yb, yc = y[rows, km], y_max, y[rows, kp]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fab = (yb - ya) / (xb - xa)
+        fbc = (yc - yb) / (xc - xb)
+        curv = (fbc - fab) / (xc - xa)
+        x_top = 0.5 * (xa + xb) - fab / (2.0 * curv)
+        y_top = yb + (x_top - xb) * (fab + curv * (x_top - xa))
+
+    refine = inner & (curv < 0.0) & (x_top > xa) & (x_top < xc)
+    x_max = np.where(refine, x_top, x_max)
+    y_max = np.where(refine, y_top, y_max)
+
+    return np.where(np.isfinite(y_max), y_max, np.nan), x_max
+
+
+def _vanishing_angle(x, y):
+    """
+    First angle past the positive part of the curve where GZ turns
+    negative (radians, inf if it stays positive on the grid), and the
+    angle where GZ first becomes positive.
+    """
+
+    rows = np.arange(len(x))
+    n = x.shape[1]
+
+    positive = y > 0.0
+    has_pos = positive.any(axis=1)
+    first_pos = np.argmax(positive, axis=1)
+
+    # Downcrossing: node k - 1 positive, node k not, after first_pos
+    down = ~positive[:, 1:] & positive[:, :-1]
+    down &= np.arange(1, n)[None, :] > first_pos[:, None]
+    found = down.any(axis=1)
+    k = np.argmax(down, axis=1) + 1              # first non-positive node
+
+    i = k - 1                                    # bracketing interval
+    xa, xb = x[rows, i], x[rows, np.minimum(k, n - 1)]
+    ya, yb = y[rows, i], y[rows, np.minimum(k, n - 1)]
+
+    # Secant start, Newton on the interval interpolant, kept in bracket
+    qi = [_quadratics(x, y, shift, i) for shift in (0, -1)]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = xa - ya * (xb - xa) / (yb - ya)
+        for _ in range(_ROOT_ITERATIONS):
+            p = dp = 0.0
+            for x0, x1, y0, f01, f012 in qi:
+                p = p + y0 + (t - x0) * (f01 + f012 * (t - x1))
+                dp = dp + f01 + f012 * (2.0 * t - x0 - x1)
+            t_new = t - p / dp
+            t = np.where(np.isfinite(t_new) & (t_new >= xa) & (t_new <= xb),
+                         t_new, t)
+
+    vanish = np.where(found, t, np.inf)
+    vanish = np.where(has_pos, vanish, np.nan)
+
+    # Start of the positive range: 0 for a stable upright hull, else
+    # the upcrossing into the first positive sample (angle of loll)
+    j = np.maximum(first_pos - 1, 0)
+    xs, xp = x[rows, j], x[rows, first_pos]
+    ys, yp = y[rows, j], y[rows, first_pos]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        up = xs - ys * (xp - xs) / (yp - ys)
+    start = np.where(first_pos > 0, up, x[:, 0])
+
+    return vanish, start
+
+
+def stability_metrics(angles_deg, GZ, GM=None, flood_deg=None,
+                      method="simpson"):
+    """
+    Intact stability metrics of a batch of GZ curves.
+
+    Parameters
+    ----------
+    angles_deg : array_like (A,) or (K, A)
+        Increasing heel angles in degrees, shared or per curve; should
+        start at 0 and reach 40 for every area to be defined
+    GZ : array_like (K, A) or (A,)
+        Righting levers (m)
+    GM : array_like (K,), optional
+        Initial metacentric height (e.g. GM_T of hydrostatic_sweep);
+        default: slope of GZ at the first angle, per radian
+    flood_deg : float or array_like (K,), optional
+        Downflooding angle; caps the 40 deg limit of area_0_40 and
+        area_30_40 (which is NaN for a flooding angle below 30 deg)
+    method : {"simpson", "trapezoid"}
+        Area rule: averaged quadratics (see module docstring) or
+        trapezoids
+
+    Returns
+    -------
+    metrics : dict of ndarray (K,)
+        See METRICS; areas in m rad, angles in degrees. Metrics that
+        need angles outside the grid are NaN (area_0_30 and area_0_40
+        when the grid starts above 0 deg), and all metrics of a curve
+        with a NaN GZ; vanishing_angle and range are inf when GZ stays
+        positive to the last angle.
+    """
+
+    x, y = _grid(angles_deg, GZ)
+    K = len(y)
+
+    # Curves with missing values: computed on zeros, reported as NaN
+    bad = np.isnan(y).any(axis=1)
+    if bad.any():
+        y = np.where(bad[:, None], 0.0, y)
+
+    lim30 = np.full(K, np.deg2rad(30.0))
+    lim40 = np.full(K, np.deg2rad(40.0))
+    if flood_deg is not None:
+        lim40 = np.minimum(lim40, np.deg2rad(
+            np.broadcast_to(np.asarray(flood_deg, dtype=float), (K,))
+        ))
+
+    # Areas only need the grid up to the largest limit (plus one node,
+    # so its interval keeps both Simpson quadratics)
+    cols = int((x < lim40[:, None]).sum(axis=1).max()) + 2
+    cols = min(x.shape[1], max(3, cols))
+    xa, ya = x[:, :cols], y[:, :cols]
+    area, q = _cumulative_area(xa, ya, method)
+
+    # Areas from the first angle; the area to 0 deg is NaN when the
+    # grid starts above it
+    a0 = _area_to(np.zeros(K), xa, ya, area, q, x[:, -1])
+    a30 = _area_to(lim30, xa, ya, area, q, x[:, -1])
+    a40 = _area_to(lim40, xa, ya, area, q, x[:, -1])
+
+    GZ_max, x_max = _maximum(x, y)
+    GZ_max_30, _ = _maximum(x, y, lower=lim30)
+
+    if GM is None:
+        # Derivative of the first quadratic at the first angle
+        x0, x1, _, f01, f012 = _quadratics(x, y, i=np.zeros(K, dtype=int))
+        GM = f01 + f012 * (x0 - x1)
+    else:
+        GM = np.broadcast_to(np.asarray(GM, dtype=float), (K,))
+
+    vanish, start = _vanishing_angle(x, y)
+
+    metrics = {
+        "area_0_30": a30 - a0,
+        "area_0_40": a40 - a0,
+        "area_30_40": np.where(lim40 < lim30, np.nan, a40 - a30),
+        "GZ_max": GZ_max,
+        "angle_GZ_max": np.rad2deg(x_max),
+        "GZ_max_30": GZ_max_30,
+        "GM0": np.array(GM, dtype=float),
+        "vanishing_angle": np.rad2deg(vanish),
+        "range": np.rad2deg(vanish - start),
+    }
+
+    for m in METRICS:
+        metrics[m][bad] = np.nan
+
+    return metrics
+
+
+def criteria_dtype(criteria=IS_CODE_2008):
+    """
+    dtype of the table returned by evaluate_criteria: every metric,
+    pass_<metric> for every criterion, and passed (all of them).
+    """
+
+    return np.dtype(
+        [(m, float) for m in METRICS]
+        + [(f"pass_{c}", bool) for c in criteria]
+        + [("passed", bool)]
+    )
+
+
+def evaluate_criteria(angles_deg, GZ, criteria=IS_CODE_2008, GM=None,
+                      flood_deg=None, method="simpson"):
+    """
+    Pass/fail table of a batch of GZ curves.
+
+    Parameters
+    ----------
+    angles_deg, GZ, GM, flood_deg, method
+        See stability_metrics
+    criteria : dict
+        metric -> minimum value (see IS_CODE_2008); a metric that is
+        NaN fails
+
+    Returns
+    -------
+    table : structured ndarray (K,)
+        See criteria_dtype
+    """
+
+    unknown = set(criteria) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown criteria: {', '.join(sorted(unknown))}")
+
+    metrics = stability_metrics(angles_deg, GZ, GM, flood_deg, method)
+
+    table = np.empty(len(metrics["GZ_max"]), dtype=criteria_dtype(criteria))
+    passed = np.ones(len(table), dtype=bool)
+
+    for m in METRICS:
+        table[m] = metrics[m]
+
+    for c, minimum in criteria.items():
+        ok = metrics[c] >= minimum                # NaN compares False
+        table[f"pass_{c}"] = ok
+        passed &= ok
+
+    table["passed"] = passed
+
+    return table
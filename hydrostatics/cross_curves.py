@@ -0,0 +1,327 @@
+"""
+Cross curves of stability: precomputed KN tables over draft x heel.
+
+KN depends on the hull, draft and heel only, so it is computed once on
+a grid and every loading condition is answered from the table:
+GZ = KN - KG sin(heel). Queries use bicubic Hermite interpolation on
+the (possibly non-uniform) grid, with the corner derivatives estimated
+by finite differences when the table is built; a query is a handful of
+array gathers, vectorized over any number of conditions.
+
+On disk a table is a directory holding versioned coeffs-<v>.npy (KN
+and its derivatives, loaded memory-mapped) and meta-<v>.json (grid and
+hull description) files, and a pointer file, current, naming the
+version to read. save_kn_table writes a new version next to the old
+ones and then replaces the pointer atomically (os.replace, no symlinks
+needed). Tables written before the pointer existed (plain coeffs.npy
+and meta.json) are still read.
+"""
+
+import json
+import os
+import tempfile
+import uuid
+
+import numpy as np
+
+from hydrostatics.parallel import run_loading_sweep
+
+# Bump when the on-disk layout changes
+TABLE_FORMAT = 1
+
+# Pointer file naming the current version of a table directory
+_POINTER = "current"
+
+# Attempts of load_kn_table when a version is removed while reading
+_LOAD_ATTEMPTS = 3
+
+
+def _derivatives(KN, drafts, angles):
+    """
+    KN and its derivatives on the grid, shape (4, D, A):
+    KN, dKN/d draft, dKN/d heel, d2KN/d draft d heel.
+    """
+
+    def grad(F, x, axis):
+        if len(x) < 2:
+            return np.zeros_like(F)
+        edge = 2 if len(x) > 2 else 1
+        return np.gradient(F, x, axis=axis, edge_order=edge)
+
+    K_d = grad(KN, drafts, 0)
+    K_a = grad(KN, angles, 1)
+    K_da = grad(K_d, angles, 1)
+
+    return np.stack([KN, K_d, K_a, K_da])
+
+
+def build_kn_table(vertices, faces, drafts, angles_deg, path=None, meta=None,
+                   workers=1, memory_budget=64 * 2**20):
+    """
+    Compute KN over a draft x heel grid.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    drafts : array_like (D,)
+        Increasing drafts
+    angles_deg : array_like (A,)
+        Increasing heel angles in degrees
+    path : str, optional
+        Directory to save the table to (see save_kn_table)
+    meta : dict, optional
+        JSON-serializable hull description stored with the table
+    workers : int
+        Worker processes (see run_loading_sweep)
+    memory_budget : int
+
+    Returns
+    -------
+    table : dict
+        drafts, angles, coeffs (ndarray (4, D, A)), meta
+    """
+
+    drafts = np.atleast_1d(np.asarray(drafts, dtype=float))
+    angles = np.atleast_1d(np.asarray(angles_deg, dtype=float))
+
+    if np.any(np.diff(drafts) <= 0.0) or np.any(np.diff(angles) <= 0.0):
+        raise ValueError("Table drafts and angles must be increasing.")
+
+    res = run_loading_sweep(
+        vertices, faces, [0.0], drafts, angles,
+        workers=workers, memory_budget=memory_budget
+    )
+    KN = res["KN"].reshape(len(drafts), len(angles))
+
+    table = {
+        "drafts": drafts,
+        "angles": angles,
+        "coeffs": _derivatives(KN, drafts, angles),
+        "meta": dict(meta or {}),
+    }
+
+    if path is not None:
+        save_kn_table(path, table)
+
+    return table
+
+
+def _version_files(version):
+    """
+    File names (coeffs, meta) of a table version ("" for the plain
+    names of tables written before versioning).
+    """
+
+    if not version:
+        return "coeffs.npy", "meta.json"
+    return f"coeffs-{version}.npy", f"meta-{version}.json"
+
+
+def _current_version(path):
+    """
+    Version named by the pointer file of a table directory ("" if it
+    has none).
+    """
+
+    try:
+        with open(os.path.join(path, _POINTER)) as fh:
+            return fh.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def _remove_old_versions(path, keep):
+    """
+    Delete the files of every version not in keep. Files that cannot
+    be removed (e.g. still mapped on Windows) are left for a later
+    save.
+    """
+
+    kept = {name for v in keep for name in _version_files(v)}
+
+    for name in os.listdir(path):
+        versioned = (
+            (name.startswith("coeffs") and name.endswith(".npy"))
+            or (name.startswith("meta") and name.endswith(".json"))
+        )
+        if versioned and name not in kept:
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+
+
+def save_kn_table(path, table):
+    """
+    Write a table to the directory path (replaced atomically).
+
+    The new version is written under its own file names and published
+    by replacing the pointer file with os.replace, so readers see
+    either the old or the new table. The previous version is kept, so
+    a reader that has just read the old pointer can still open it;
+    older versions are deleted.
+    """
+
+    path = os.path.abspath(path)
+    os.makedirs(path, exist_ok=True)
+
+    previous = _current_version(path)
+    version = uuid.uuid4().hex
+    coeffs_name, meta_name = _version_files(version)
+
+    np.save(os.path.join(path, coeffs_name),
+            np.ascontiguousarray(table["coeffs"], dtype=float))
+    with open(os.path.join(path, meta_name), "w") as fh:
+        json.dump({
+            "format": TABLE_FORMAT,
+            "drafts": table["drafts"].tolist(),
+            "angles": table["angles"].tolist(),
+            "meta": table["meta"],
+        }, fh, indent=1, sort_keys=True)
+
+    fd, tmp = tempfile.mkstemp(prefix=".current-", dir=path)
+    with os.fdopen(fd, "w") as fh:
+        fh.write(version)
+    os.replace(tmp, os.path.join(path, _POINTER))
+
+    _remove_old_versions(path, keep=(version, previous))
+
+
+def load_kn_table(path):
+    """
+    Open a table written by save_kn_table (coefficients memory-mapped).
+    """
+
+    for attempt in range(_LOAD_ATTEMPTS):
+        coeffs_name, meta_name = _version_files(_current_version(path))
+
+        # A save may remove this version between reading the pointer
+        # and opening the files: read the pointer again
+        try:
+            with open(os.path.join(path, meta_name)) as fh:
+                info = json.load(fh)
+            coeffs = np.load(os.path.join(path, coeffs_name), mmap_mode="r")
+        except FileNotFoundError:
+            if attempt == _LOAD_ATTEMPTS - 1:
+                raise
+            continue
+
+        break
+
+    if info.get("format") != TABLE_FORMAT:
+        raise ValueError(
+            f"Unsupported KN table format {info.get('format')!r} in {path}."
+        )
+
+    return {
+        "drafts": np.asarray(info["drafts"], dtype=float),
+        "angles": np.asarray(info["angles"], dtype=float),
+        "coeffs": coeffs,
+        "meta": info["meta"],
+    }
+
+
+def _locate(grid, x, name):
+    """
+    Cell index and local coordinate in [0, 1] of every x.
+    """
+
+    if np.any(x < grid[0]) or np.any(x > grid[-1]):
+        raise ValueError(
+            f"{name} outside the table range [{grid[0]}, {grid[-1]}]."
+        )
+
+    if len(grid) < 2:
+        return np.zeros(x.shape, dtype=np.int64), np.zeros(x.shape), 1.0
+
+    i = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 2)
+    h = grid[i + 1] - grid[i]
+
+    return i, (x - grid[i]) / h, h
+
+
+def _hermite(t):
+    """
+    Cubic Hermite basis (value at 0, value at 1, slope at 0, slope at 1).
+    """
+
+    t2 = t * t
+    t3 = t2 * t
+
+    return (
+        2 * t3 - 3 * t2 + 1,
+        -2 * t3 + 3 * t2,
+        t3 - 2 * t2 + t,
+        t3 - t2
+    )
+
+
+def kn_query(table, draft, angles_deg):
+    """
+    KN at arbitrary (draft, heel) by bicubic interpolation.
+
+    Parameters
+    ----------
+    table : dict
+        From build_kn_table or load_kn_table
+    draft, angles_deg : array_like
+        Broadcast against each other
+
+    Returns
+    -------
+    KN : ndarray
+    """
+
+    draft, angles_deg = np.broadcast_arrays(
+        np.asarray(draft, dtype=float), np.asarray(angles_deg, dtype=float)
+    )
+
+    i, u, hu = _locate(table["drafts"], draft, "Draft")
+    j, v, hv = _locate(table["angles"], angles_deg, "Heel angle")
+
+    c = table["coeffs"]
+    i1 = np.minimum(i + 1, c.shape[1] - 1)
+    j1 = np.minimum(j + 1, c.shape[2] - 1)
+
+    hu0, hu1, su0, su1 = _hermite(u)
+    hv0, hv1, sv0, sv1 = _hermite(v)
+
+    # Basis weights per corner for value, d/d draft, d/d heel, cross
+    KN = 0.0
+    for ii, bu, du in ((i, hu0, su0), (i1, hu1, su1)):
+        for jj, bv, dv in ((j, hv0, sv0), (j1, hv1, sv1)):
+            KN = KN + (
+                c[0, ii, jj] * bu * bv
+                + c[1, ii, jj] * du * hu * bv
+                + c[2, ii, jj] * bu * dv * hv
+                + c[3, ii, jj] * du * hu * dv * hv
+            )
+
+    return KN
+
+
+def gz_query(table, KG, draft, angles_deg):
+    """
+    GZ = KN - KG sin(heel) for arbitrary loading conditions.
+
+    Parameters
+    ----------
+    table : dict
+    KG, draft, angles_deg : array_like
+        Broadcast against each other
+
+    Returns
+    -------
+    GZ : ndarray
+    """
+
+    KG, draft, angles_deg = np.broadcast_arrays(
+        np.asarray(KG, dtype=float),
+        np.asarray(draft, dtype=float),
+        np.asarray(angles_deg, dtype=float)
+    )
+
+    KN = kn_query(table, draft, angles_deg)
+
+    return KN - KG * np.sin(np.deg2rad(angles_deg))
@@ -0,0 +1,181 @@
+"""
+Free-floating equilibrium at heel (draft and optional trim).
+
+At every heel angle the draft is solved so that the displaced volume
+matches a target, by Newton iterations that use the waterplane area of
+the clipped mesh as the analytic derivative (dV/d draft = -A_w; the
+submerged side is z >= draft). With a centre of gravity given, trim is
+solved as well so that B and G lie on the same vertical, using the
+waterplane first and second moments about the y-axis.
+
+Angles are solved in order and each is warm-started from the drafts
+already converged at the previous angles, so most angles need only
+two or three clip evaluations.
+"""
+
+import numpy as np
+
+from geometry.hull_mesh import HullMesh
+from geometry.transform import heel_matrix
+from hydrostatics.plane import clip_and_integrate, heel_trim_frame
+
+
+def _floating_state(vertices, faces, theta, trim, draft):
+    """
+    Submerged volume, buoyancy centroid (earth frame) and waterplane
+    area, first and second moment in x of the hull heeled by theta and
+    trimmed by trim, clipped at draft.
+
+    The hull is clipped in its own frame against the inclined
+    waterplane (see hydrostatics.plane); only the centroid is rotated.
+    """
+
+    R = heel_trim_frame(theta, trim)
+
+    V, Bc, W = clip_and_integrate(vertices, faces, R[2], draft, x_axis=R[0])
+
+    # Loop orientation follows the hull; report positive area
+    W = W if W[0] >= 0.0 else -W
+
+    return V, R @ Bc, W[0], W[1], W[3]
+
+
+def solve_equilibrium(vertices, faces, volume, theta, draft0, trim0=0.0,
+                      G=None, tol=1e-9, max_iter=20):
+    """
+    Newton solve for draft (and trim, if G is given) at one heel angle.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    volume : float
+        Target displaced volume
+    theta : float
+        Heel angle in radians
+    draft0, trim0 : float
+        Starting draft and trim angle (radians)
+    G : ndarray (3,), optional
+        Centre of gravity in the hull frame; enables the trim solve
+    tol : float
+        Relative tolerance on volume (and on the trimming moment)
+    max_iter : int
+
+    Returns
+    -------
+    draft : float
+    trim : float
+        Trim angle in radians (trim0 if G is None)
+    Bc : ndarray (3,)
+        Buoyancy centroid in the heeled (earth) frame
+    n_eval : int
+        Number of clip evaluations used
+    """
+
+    if not isinstance(vertices, HullMesh):
+        vertices = HullMesh(vertices, faces)
+
+    draft = draft0
+    trim = trim0
+
+    # Keep drafts inside the hull so the clip is never empty
+    z = vertices.vertices @ heel_matrix(theta)[2]
+    z_lo, z_hi = z.min(), z.max()
+    margin = 1e-6 * (z_hi - z_lo)
+
+    length = np.ptp(vertices.vertices[:, 0])
+
+    for n_eval in range(1, max_iter + 1):
+        V, Bc, A, S, I = _floating_state(vertices, None, theta, trim, draft)
+
+        r1 = V - volume
+
+        if G is None:
+            if abs(r1) <= tol * volume:
+                return draft, trim, Bc, n_eval
+
+            draft = draft + r1 / A
+            draft = min(max(draft, z_lo + margin), z_hi - margin)
+            continue
+
+        G_e = heel_trim_frame(theta, trim) @ G
+        r2 = V * Bc[0] - volume * G_e[0]
+
+        if abs(r1) <= tol * volume and abs(r2) <= tol * volume * length:
+            return draft, trim, Bc, n_eval
+
+        J = np.array([
+            [-A, -S],
+            [-S, -I + V * Bc[2] - volume * G_e[2]]
+        ])
+        step = np.linalg.solve(J, -np.array([r1, r2]))
+
+        draft = draft + step[0]
+        trim = trim + step[1]
+
+    raise RuntimeError(
+        f"Equilibrium not converged at heel {np.rad2deg(theta):.2f} deg "
+        f"after {max_iter} iterations."
+    )
+
+
+def equilibrium_sweep(vertices, faces, volume, angles_deg, draft0,
+                      G=None, tol=1e-9, max_iter=20):
+    """
+    Free-floating equilibrium over a heel sweep with warm starts.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    volume : float
+        Target displaced volume
+    angles_deg : array_like (A,)
+        Heel angles in degrees, solved in the given order
+    draft0 : float
+        Starting draft for the first angle
+    G : ndarray (3,), optional
+        Centre of gravity in the hull frame; enables the trim solve
+    tol : float
+    max_iter : int
+
+    Returns
+    -------
+    drafts : ndarray (A,)
+    trims : ndarray (A,)
+        Trim angles in degrees
+    centroids : ndarray (A, 3)
+        Buoyancy centroids in the heeled (earth) frame
+    n_eval : ndarray (A,)
+        Clip evaluations per angle
+    """
+
+    if not isinstance(vertices, HullMesh):
+        vertices = HullMesh(vertices, faces)
+    theta = np.deg2rad(np.atleast_1d(np.asarray(angles_deg, dtype=float)))
+    if G is not None:
+        G = np.asarray(G, dtype=float)
+
+    n = len(theta)
+    drafts = np.empty(n)
+    trims = np.empty(n)
+    centroids = np.empty((n, 3))
+    n_eval = np.empty(n, dtype=int)
+
+    for k in range(n):
+        # Warm start: previous solution, linearly extrapolated in heel
+        if k == 0:
+            d0, t0 = draft0, 0.0
+        elif k == 1:
+            d0, t0 = drafts[0], trims[0]
+        else:
+            dt = theta[k - 1] - theta[k - 2]
+            w = (theta[k] - theta[k - 1]) / dt if dt != 0.0 else 0.0
+            d0 = drafts[k - 1] + w * (drafts[k - 1] - drafts[k - 2])
+            t0 = trims[k - 1] + w * (trims[k - 1] - trims[k - 2])
+
+        drafts[k], trims[k], centroids[k], n_eval[k] = solve_equilibrium(
+            vertices, None, volume, theta[k], d0, t0, G, tol, max_iter
+        )
+
+    return drafts, np.rad2deg(trims), centroids, n_eval
@@ -0,0 +1,149 @@
+"""
+Fused clip-and-integrate kernel.
+
+Submerged volume and buoyancy centroid without building the submerged
+mesh: faces are taken in fixed-size chunks, each chunk is rotated,
+classified and clipped, and its tetrahedron moments go straight into
+running sums. Working memory depends on the chunk size only, not on
+the hull size.
+
+clip_mesh_at_draft + volume_and_centroid remain the way to get the
+submerged mesh itself (visualization).
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from geometry.hull_mesh import mesh_scale
+from hydrostatics.clip import _partial_corner_order
+from hydrostatics.plane import heel_trim_frame
+from hydrostatics.sweep import partial_face_moments, cap_moments
+from hydrostatics.volume_centroid import tetra_moments
+from utils import profiling
+
+# Faces per chunk (roughly 0.5 kB of temporaries per face)
+CHUNK_FACES = 2**15
+
+
+def fused_moments(vertices, faces, draft, R, chunk_faces=CHUNK_FACES):
+    """
+    Signed submerged volume, first moment and waterplane sums of a
+    rotated hull, accumulated chunk by chunk.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    draft : float
+    R : ndarray (3, 3)
+        Body to earth rotation (any linear map works, e.g. a rotation
+        times the axis scale of a ScaledHull)
+    chunk_faces : int
+
+    Returns
+    -------
+    V : float
+    C : ndarray (3,)
+        Earth-frame first moment
+    W : ndarray (5,)
+        Waterplane shoelace sums
+    """
+
+    prof = profiling.active()
+    if prof:
+        t0 = perf_counter()
+
+    drafts = np.array([float(draft)])
+
+    V = 0.0
+    C = np.zeros(3)
+    W = np.zeros(5)
+
+    for start in range(0, len(faces), chunk_faces):
+        # Earth-frame corners of this chunk only (one 2-D product)
+        ids = faces[start:start + chunk_faces].ravel()
+        tri = (np.take(vertices, ids, axis=0) @ R.T).reshape(-1, 3, 3)
+
+        sub = tri[..., 2] >= draft
+        n_sub = sub.sum(axis=1)
+
+        # Fully submerged faces
+        full = (n_sub == 3).astype(float)
+        vol, mom = tetra_moments(tri[:, 0], tri[:, 1], tri[:, 2])
+        V += vol @ full
+        C += full @ mom
+
+        # Partial faces, closed per waterline segment
+        part = np.flatnonzero((n_sub > 0) & (n_sub < 3))
+
+        if prof:
+            n_full = int(full.sum())
+            prof.count("faces_full", n_full)
+            prof.count("faces_partial", len(part))
+            prof.count("faces_dry", len(tri) - n_full - len(part))
+
+        if len(part) == 0:
+            continue
+
+        order = _partial_corner_order(sub[part], n_sub[part])
+        P = np.take_along_axis(tri[part], order[..., None], axis=1)
+        one = (n_sub[part] == 1)[:, None]
+        b = np.zeros(len(part), dtype=np.int64)
+
+        V_p, C_p, W_p, seg_start, seg_end = partial_face_moments(
+            P, one, b, drafts, 1, False
+        )
+        V_c, C_c = cap_moments(seg_start, seg_end, b, drafts, 1)
+
+        V += V_p[0] + V_c[0]
+        C += C_p[0] + C_c[0]
+        W += W_p[0]
+
+    if prof:
+        prof.lap("fused", t0)
+
+    return V, C, W
+
+
+def submerged_volume_and_centroid(vertices, faces, draft, theta=0.0,
+                                  trim=0.0, chunk_faces=CHUNK_FACES):
+    """
+    Volume and buoyancy centroid of a closed hull heeled by theta and
+    trimmed by trim (radians), clipped at draft.
+
+    One pass in constant memory, with the waterplane closed per
+    waterline segment. clip_mesh_at_draft followed by
+    volume_and_centroid closes it with a fan instead, and agrees only
+    while the waterplane is star-shaped about its centroid (not past
+    deck-edge immersion, for instance).
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    draft : float
+    theta, trim : float
+        Heel and trim angles in radians
+    chunk_faces : int
+        Faces per chunk
+
+    Returns
+    -------
+    volume : float
+    centroid : ndarray (3,)
+        Buoyancy centroid in the heeled (earth) frame
+    """
+
+    vertices, faces, scale = mesh_scale(vertices, faces)
+
+    R = heel_trim_frame(theta, trim)
+    if scale is not None:
+        R = R * scale
+
+    V, C, _ = fused_moments(vertices, faces, draft, R, chunk_faces)
+
+    if abs(V) < 1e-12:
+        raise ValueError("Computed volume is zero or very small.")
+
+    return abs(V), C / V
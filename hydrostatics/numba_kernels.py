@@ -0,0 +1,166 @@
+"""
+Numba kernels for the "numba" compute backend.
+
+Face loops of the reference implementations (volume_centroid,
+clip, utils.checks), compiled with numba in nopython mode and run in
+parallel over blocks of faces (and over cases for the buoyancy
+kernel). Each block sums into its own row and the caller adds the
+rows, so the result does not depend on thread scheduling.
+
+Compiled code is cached on disk (numba's cache=True: __pycache__ next
+to this file, or $NUMBA_CACHE_DIR), so only the first run on a machine
+pays the compile time.
+
+Importing this module requires numba; hydrostatics.backends imports
+it only when the numba backend is used.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Faces per parallel block
+BLOCK_FACES = 4096
+
+
+@njit(cache=True, inline="always")
+def _add_tetra(acc, ax, ay, az, bx, by, bz, cx, cy, cz):
+    """
+    Add volume and first moment of the tetrahedron (a, b, c, origin)
+    to acc[0:4].
+    """
+
+    vol = (ax * (by * cz - bz * cy)
+           + ay * (bz * cx - bx * cz)
+           + az * (bx * cy - by * cx)) / 6.0
+
+    acc[0] += vol
+    acc[1] += vol * (ax + bx + cx) / 4.0
+    acc[2] += vol * (ay + by + cy) / 4.0
+    acc[3] += vol * (az + bz + cz) / 4.0
+
+
+@njit(cache=True)
+def _n_blocks(n_faces):
+    return max(1, (n_faces + BLOCK_FACES - 1) // BLOCK_FACES)
+
+
+@njit(cache=True, parallel=True)
+def volume_moments(vertices, faces):
+    """
+    Signed volume and first moment of a closed mesh, per face block
+    (n_blocks, 4).
+    """
+
+    n_faces = faces.shape[0]
+    n_blocks = _n_blocks(n_faces)
+    out = np.zeros((n_blocks, 4))
+
+    for k in prange(n_blocks):
+        acc = np.zeros(4)
+        for f in range(k * BLOCK_FACES, min(n_faces, (k + 1) * BLOCK_FACES)):
+            a = vertices[faces[f, 0]]
+            b = vertices[faces[f, 1]]
+            c = vertices[faces[f, 2]]
+            _add_tetra(acc, a[0], a[1], a[2], b[0], b[1], b[2],
+                       c[0], c[1], c[2])
+        out[k] = acc
+
+    return out
+
+
+@njit(cache=True, inline="always")
+def _cut(p, i, j, draft, q):
+    """
+    Point of the edge p[i] - p[j] on the plane z = draft, into q.
+    """
+
+    t = (draft - p[i, 2]) / (p[j, 2] - p[i, 2])
+    for k in range(3):
+        q[k] = p[i, k] + t * (p[j, k] - p[i, k])
+
+
+@njit(cache=True)
+def _clip_face(p, draft, acc, q1, q2):
+    """
+    Add the moments of the submerged part of triangle p (3, 3), and of
+    the cap triangle closing its waterline segment towards
+    (0, 0, draft), to acc.
+    """
+
+    s0 = p[0, 2] >= draft
+    s1 = p[1, 2] >= draft
+    s2 = p[2, 2] >= draft
+    n_sub = int(s0) + int(s1) + int(s2)
+
+    if n_sub == 0:
+        return
+
+    if n_sub == 3:
+        _add_tetra(acc, p[0, 0], p[0, 1], p[0, 2], p[1, 0], p[1, 1],
+                   p[1, 2], p[2, 0], p[2, 1], p[2, 2])
+        return
+
+    # Cyclic corner order: lone submerged corner first (one), or the
+    # corner after the lone dry corner first (two)
+    if n_sub == 1:
+        i0 = 0 if s0 else (1 if s1 else 2)
+    else:
+        i0 = 1 if not s0 else (2 if not s1 else 0)
+    i1 = (i0 + 1) % 3
+    i2 = (i0 + 2) % 3
+
+    if n_sub == 1:
+        # (s, p1, p2), segment p1 -> p2
+        _cut(p, i0, i1, draft, q1)
+        _cut(p, i0, i2, draft, q2)
+        _add_tetra(acc, p[i0, 0], p[i0, 1], p[i0, 2],
+                   q1[0], q1[1], q1[2], q2[0], q2[1], q2[2])
+        sx, sy, sz, ex, ey, ez = q1[0], q1[1], q1[2], q2[0], q2[1], q2[2]
+    else:
+        # (s1, s2, p2) + (s1, p2, p1), segment p2 -> p1
+        _cut(p, i0, i2, draft, q1)
+        _cut(p, i1, i2, draft, q2)
+        _add_tetra(acc, p[i0, 0], p[i0, 1], p[i0, 2],
+                   p[i1, 0], p[i1, 1], p[i1, 2], q2[0], q2[1], q2[2])
+        _add_tetra(acc, p[i0, 0], p[i0, 1], p[i0, 2],
+                   q2[0], q2[1], q2[2], q1[0], q1[1], q1[2])
+        sx, sy, sz, ex, ey, ez = q2[0], q2[1], q2[2], q1[0], q1[1], q1[2]
+
+    # Cap triangle (end, start, c), against the segment
+    _add_tetra(acc, ex, ey, ez, sx, sy, sz, 0.0, 0.0, draft)
+
+
+@njit(cache=True, parallel=True)
+def buoyancy_moments(vertices, faces, drafts, R):
+    """
+    Signed submerged volume and earth-frame first moment of a hull
+    rotated by R[b] (B, 3, 3) and clipped at drafts[b], per case and
+    face block (B, n_blocks, 4).
+    """
+
+    n_faces = faces.shape[0]
+    n_cases = R.shape[0]
+    n_blocks = _n_blocks(n_faces)
+    out = np.zeros((n_cases, n_blocks, 4))
+
+    for job in prange(n_cases * n_blocks):
+        b = job // n_blocks
+        k = job % n_blocks
+        draft = drafts[b]
+
+        acc = np.zeros(4)
+        p = np.empty((3, 3))
+        q1 = np.empty(3)
+        q2 = np.empty(3)
+
+        for f in range(k * BLOCK_FACES, min(n_faces, (k + 1) * BLOCK_FACES)):
+            for c in range(3):
+                v = vertices[faces[f, c]]
+                for i in range(3):
+                    p[c, i] = (R[b, i, 0] * v[0] + R[b, i, 1] * v[1]
+                               + R[b, i, 2] * v[2])
+            _clip_face(p, draft, acc, q1, q2)
+
+        out[b, k] = acc
+
+    return out
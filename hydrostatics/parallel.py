@@ -0,0 +1,221 @@
+"""
+Parallel loading-condition sweeps (KG x draft x heel).
+
+The hull is built once by the caller and published to a process pool
+through multiprocessing.shared_memory; workers map the arrays zero-copy
+instead of receiving a pickled copy per task.
+
+KN does not depend on KG, so work is split over drafts: each task
+computes the whole heel sweep for a chunk of drafts and GZ is formed
+for every KG afterwards. Chunks of at least band.GRID_MIN_DRAFTS
+drafts share one band index per heel angle (hydrostatics.band);
+smaller ones run buoyancy_sweep per draft, which is faster there.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from geometry.hull_mesh import HullMesh
+from hydrostatics.band import GRID_MIN_DRAFTS, buoyancy_grid
+from hydrostatics.sweep import buoyancy_sweep
+
+# dtype of the array returned by run_loading_sweep
+RESULT_DTYPE = np.dtype([
+    ("KG", float),
+    ("draft", float),
+    ("heel", float),
+    ("KN", float),
+    ("GZ", float),
+])
+
+
+def share_array(arr):
+    """
+    Copy an array into a new shared memory block.
+
+    Returns
+    -------
+    shm : SharedMemory
+        Owner handle (caller must close() and unlink())
+    spec : tuple
+        Picklable (name, shape, dtype) descriptor for attach_array
+    """
+
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def attach_array(spec):
+    """
+    Map a shared array published by share_array (read-only view).
+
+    Returns
+    -------
+    shm : SharedMemory
+        Handle that must stay alive as long as the view is used
+    arr : ndarray
+    """
+
+    name, shape, dtype = spec
+
+    # Workers descend from the owner and share its resource tracker,
+    # so attaching here does not hand over ownership of the block.
+    shm = shared_memory.SharedMemory(name=name)
+
+    arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    arr.flags.writeable = False
+
+    return shm, arr
+
+
+# Per-worker state, set once by _init_worker
+_worker_mesh = {}
+
+
+def _init_worker(vertex_spec, face_spec):
+    """
+    Process pool initializer: attach the shared hull once per worker.
+    """
+
+    v_shm, v = attach_array(vertex_spec)
+    f_shm, f = attach_array(face_spec)
+
+    _worker_mesh["handles"] = (v_shm, f_shm)
+    _worker_mesh["mesh"] = HullMesh(v, f)
+
+
+def _kn_for_drafts(drafts, angles_deg, memory_budget):
+    """
+    KN (n_drafts, n_angles) for a chunk of drafts, using the worker's
+    shared hull (its per-face table is built once per worker): the band
+    grid for GRID_MIN_DRAFTS drafts or more, else a sweep per draft.
+    """
+
+    mesh = _worker_mesh["mesh"]
+
+    if len(drafts) >= GRID_MIN_DRAFTS:
+        _, Bc = buoyancy_grid(mesh, None, drafts, angles_deg, memory_budget)
+        return np.abs(Bc[..., 1])
+
+    KN = np.empty((len(drafts), len(angles_deg)))
+
+    for i, draft in enumerate(drafts):
+        _, Bc = buoyancy_sweep(mesh, None, draft, angles_deg, memory_budget)
+        KN[i] = np.abs(Bc[:, 1])
+
+    return KN
+
+
+def run_loading_sweep(vertices, faces, KG_values, drafts, angles_deg,
+                      workers=None, chunk_size=None,
+                      memory_budget=64 * 2**20):
+    """
+    GZ over a KG x draft x heel grid, in parallel.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    KG_values : array_like (K,)
+    drafts : array_like (D,)
+    angles_deg : array_like (A,)
+        Heel angles in degrees
+    workers : int, optional
+        Number of worker processes (default: os.cpu_count()).
+        workers=1 runs serially in the calling process.
+    chunk_size : int, optional
+        Drafts per task (default: all drafts when serial, else spread
+        over about 4 tasks per worker, but at least GRID_MIN_DRAFTS
+        when every worker can get that many)
+    memory_budget : int
+        Per-worker memory budget for the band clip, in bytes
+
+    Returns
+    -------
+    results : structured ndarray (K * D * A,)
+        Fields KG, draft, heel, KN, GZ; ordered KG-major, then draft,
+        then heel. Empty when any of the three grids is empty.
+    """
+
+    KG_values = np.atleast_1d(np.asarray(KG_values, dtype=float))
+    drafts = np.atleast_1d(np.asarray(drafts, dtype=float))
+    angles_deg = np.atleast_1d(np.asarray(angles_deg, dtype=float))
+
+    # Nothing to compute (and no pool to start) for an empty grid
+    if min(len(KG_values), len(drafts), len(angles_deg)) == 0:
+        return np.empty(0, dtype=RESULT_DTYPE)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if chunk_size is None:
+        # Every task sets up its own clipping: serially one task,
+        # in parallel about 4 per worker for load balance
+        tasks = 1 if workers == 1 else 4 * workers
+        chunk_size = max(1, -(-len(drafts) // tasks))
+
+        # Chunks big enough for the band grid, if that still keeps
+        # every worker busy
+        if -(-len(drafts) // workers) >= GRID_MIN_DRAFTS:
+            chunk_size = max(chunk_size, GRID_MIN_DRAFTS)
+
+    chunks = [
+        drafts[i:i + chunk_size]
+        for i in range(0, len(drafts), chunk_size)
+    ]
+
+    if not isinstance(vertices, HullMesh):
+        vertices = HullMesh(vertices, faces)
+
+    if workers == 1:
+        _worker_mesh["mesh"] = vertices
+        try:
+            parts = [
+                _kn_for_drafts(c, angles_deg, memory_budget)
+                for c in chunks
+            ]
+        finally:
+            _worker_mesh.clear()
+    else:
+        v_shm, v_spec = share_array(vertices.vertices)
+        f_shm, f_spec = share_array(vertices.faces)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(v_spec, f_spec)
+            ) as pool:
+                parts = list(pool.map(
+                    _kn_for_drafts,
+                    chunks,
+                    [angles_deg] * len(chunks),
+                    [memory_budget] * len(chunks)
+                ))
+        finally:
+            for shm in (v_shm, f_shm):
+                shm.close()
+                shm.unlink()
+
+    KN = np.vstack(parts)                                  # (D, A)
+
+    # GZ = KN - KG sin(theta) for every KG
+    sin_t = np.sin(np.deg2rad(angles_deg))
+    GZ = KN[None] - KG_values[:, None, None] * sin_t       # (K, D, A)
+
+    shape = GZ.shape
+    results = np.empty(GZ.size, dtype=RESULT_DTYPE)
+    results["KG"] = np.broadcast_to(KG_values[:, None, None], shape).ravel()
+    results["draft"] = np.broadcast_to(drafts[None, :, None], shape).ravel()
+    results["heel"] = np.broadcast_to(angles_deg, shape).ravel()
+    results["KN"] = np.broadcast_to(KN[None], shape).ravel()
+    results["GZ"] = GZ.ravel()
+
+    return results
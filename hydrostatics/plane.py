@@ -0,0 +1,165 @@
+"""
+Rotation-free clip and integration against an inclined waterplane.
+
+Instead of rotating the hull into the earth frame and clipping at
+z = draft, the hull is clipped in its own frame against the plane
+n . x = offset (submerged side n . x >= offset). Signed distances are
+one matrix-vector product, only the corners of the faces cut by the
+plane are transformed, and only the resulting moments are rotated. The
+vertex array is never copied or written, so one mesh can be shared by
+threads working on different planes.
+
+For heel theta and trim phi the plane comes from heel_trim_frame:
+
+    R = heel_trim_frame(theta, phi)
+    V, B_body, W = clip_and_integrate(mesh, None, R[2], draft, x_axis=R[0])
+    B_earth = R @ B_body
+"""
+
+import numpy as np
+
+from geometry.transform import heel_matrix, trim_matrix
+from hydrostatics.clip import _partial_corner_order
+from geometry.hull_mesh import HullMesh, mesh_arrays
+from hydrostatics.sweep import (
+    _face_table, mesh_table, full_face_moments, partial_face_moments,
+    cap_moments
+)
+
+
+def heel_trim_frame(heel, trim=0.0):
+    """
+    Body to earth rotation for heel (about x) followed by trim
+    (about y), angles in radians. Row 2 is the waterplane normal in the
+    body frame, rows 0 and 1 the earth x and y axes.
+    """
+
+    return trim_matrix(trim) @ heel_matrix(heel)
+
+
+def plane_frame(normal, x_axis=None):
+    """
+    Orthonormal frame (rows e1, e2, n) of a plane with normal n.
+
+    Parameters
+    ----------
+    normal : array_like (3,)
+    x_axis : array_like (3,), optional
+        Direction of e1, projected on the plane (default: body x axis)
+
+    Returns
+    -------
+    R : ndarray (3, 3)
+        Rotation with R[2] = n / |n| and e1 x e2 = n
+    """
+
+    n = np.asarray(normal, dtype=float)
+    n = n / np.linalg.norm(n)
+
+    e1 = np.array([1.0, 0.0, 0.0]) if x_axis is None else np.asarray(
+        x_axis, dtype=float
+    )
+    e1 = e1 - (e1 @ n) * n
+    length = np.linalg.norm(e1)
+
+    if length < 1e-12:
+        raise ValueError("x_axis is parallel to the plane normal.")
+
+    e1 = e1 / length
+
+    return np.array([e1, np.cross(n, e1), n])
+
+
+def clip_and_integrate(vertices, faces, normal, offset, x_axis=None,
+                       cap_free=False):
+    """
+    Volume and centroid of the part of a closed hull on the submerged
+    side of the plane n . x >= offset, in the body frame.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+        A HullMesh keeps its per-face table between calls; plain
+        arrays tabulate only the fully submerged faces, on every call
+    faces : ndarray (M, 3), or None with a HullMesh
+    normal : array_like (3,)
+        Plane normal in the body frame, pointing into the water (the
+        earth z axis, which points down)
+    offset : float
+        Plane position: n . x = offset (the draft, for unit n)
+    x_axis : array_like (3,), optional
+        First waterplane axis (see plane_frame); only affects W
+    cap_free : bool
+        Integrate about a point on the plane instead of closing the
+        waterplane with a cap (see buoyancy_sweep)
+
+    Returns
+    -------
+    volume : float
+    centroid : ndarray (3,)
+        Body frame
+    W : ndarray (5,)
+        Waterplane shoelace sums in the plane frame (e1, e2), see
+        waterplane.waterplane_from_sums
+    """
+
+    if isinstance(vertices, HullMesh):
+        vertices, faces, table = mesh_table(vertices, faces, cap_free)
+    else:
+        vertices, faces = mesh_arrays(vertices, faces)
+        table = None
+
+    R = plane_frame(normal, x_axis)
+    offset = float(offset) / np.linalg.norm(normal)
+
+    # Signed distances: one matrix-vector product
+    h = vertices @ R[2]
+
+    S = h[faces] >= offset
+    n_sub = S.sum(axis=1)
+
+    drafts = np.array([offset])
+    frames = R[None]
+
+    full = n_sub == 3
+
+    if table is None:
+        F = _face_table(vertices, faces[full], cap_free).sum(axis=0)
+    else:
+        F = full.astype(float) @ table
+
+    V, C = full_face_moments(F[None], drafts, frames, cap_free)
+
+    m = np.flatnonzero((n_sub > 0) & (n_sub < 3))
+    W = np.zeros((1, 5))
+
+    if len(m):
+        ids = np.take_along_axis(
+            faces[m], _partial_corner_order(S[m], n_sub[m]), axis=1
+        )
+
+        # Plane-frame corners of the cut faces only
+        P = vertices[ids] @ R.T
+        P[..., 2] = h[ids]
+
+        one = (n_sub[m] == 1)[:, None]
+        b = np.zeros(len(m), dtype=np.int64)
+
+        V_p, C_p, W, start, end = partial_face_moments(
+            P, one, b, drafts, 1, cap_free
+        )
+        V += V_p
+        C += C_p
+
+        if not cap_free:
+            V_c, C_c = cap_moments(start, end, b, drafts, 1)
+            V += V_c
+            C += C_c
+
+    if abs(V[0]) < 1e-12:
+        raise ValueError("Computed volume is zero or very small.")
+
+    # Centroid back to the body frame
+    centroid = R.T @ (C[0] / V[0])
+
+    return abs(V[0]), centroid, W[0]
@@ -0,0 +1,571 @@
+"""
+Whole-sweep KN / GZ evaluation.
+
+All heel angles are classified, clipped and integrated together. The
+mesh is never rotated: the height of every vertex along the heeled
+vertical comes from one (n_angles, 3) x (3, N) matrix product, and
+only the corners of the faces cut by the waterplane are rotated into
+the earth frame. The angle axis is split into chunks that fit a memory
+budget.
+
+Only volume and first moment are accumulated; the submerged mesh is
+never assembled. Fully submerged faces reuse tetrahedron moments
+computed once in the body frame (rotation about the x-axis through the
+origin maps each tetrahedron onto its rotated copy), so per-angle work
+on them is a single matrix product. Partial faces are clipped the same
+way as clip_mesh_at_draft; the waterplane is closed per waterline
+segment (see cap_moments), which holds for any number and shape of
+waterline loops.
+
+With cap_free=True the tetrahedra share an apex on the waterplane
+instead of the origin: the cap then has zero volume and is not built
+at all. The apex shift is applied to
+the fully submerged faces in closed form, from per-face area vectors
+precomputed with the moments. This needs a closed hull surface.
+
+A ScaledHull is swept on its base mesh (shared face table) with the
+scale folded into the rotation.
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from geometry.hull_mesh import HullMesh, ScaledHull, mesh_arrays
+from geometry.transform import heel_matrix
+from hydrostatics.backends import get_backend
+from hydrostatics.clip import (
+    intersect_edge_with_plane, _partial_corner_order, _count_loops
+)
+from hydrostatics.waterplane import shoelace_terms, waterplane_from_sums
+from hydrostatics.volume_centroid import tetra_moments, face_moments
+from utils import profiling
+
+# Rough working-set estimate of one angle in the batched clip
+# (vertex heights, vertex and face classification).
+_BYTES_PER_VERTEX = 16
+_BYTES_PER_FACE = 32
+
+DEFAULT_MEMORY_BUDGET = 256 * 2**20  # bytes
+
+
+def angles_per_batch(n_vertices, n_faces, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Number of heel angles that can be processed together within
+    memory_budget bytes (at least 1).
+    """
+
+    per_angle = n_vertices * _BYTES_PER_VERTEX + n_faces * _BYTES_PER_FACE
+    return max(1, int(memory_budget // per_angle))
+
+
+def _face_table(vertices, faces, cap_free):
+    """
+    Per-face body-frame quantities whose sums over the fully submerged
+    faces give their contribution for any waterplane orientation (one
+    matrix product).
+
+    Columns: tetrahedron volume (1), first moment (3) and, for cap-free
+    integration, the face area vector N (3) and the products s N_x,
+    s N_y, s N_z (3 + 3 + 3) with s = a + b + c.
+    """
+
+    vol, mom = face_moments(vertices, faces)
+    columns = [vol[:, None], mom]
+
+    if cap_free:
+        tri = vertices[faces]
+        s = tri.sum(axis=1)
+        N = 0.5 * np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        columns += [N, s * N[:, 0:1], s * N[:, 1:2], s * N[:, 2:3]]
+
+    return np.hstack(columns)
+
+
+def mesh_table(vertices, faces, cap_free):
+    """
+    Vertex and face arrays and the per-face table (see _face_table).
+
+    The table is kept on a HullMesh, so later sweeps of the same mesh
+    (other drafts, other angles) reuse it.
+    """
+
+    if isinstance(vertices, HullMesh):
+        mesh = vertices
+        vertices, faces = mesh
+        table = mesh.cached(
+            ("sweep_table", cap_free),
+            lambda: _face_table(vertices, faces, cap_free)
+        )
+        return vertices, faces, table
+
+    vertices, faces = mesh_arrays(vertices, faces)
+
+    return vertices, faces, _face_table(vertices, faces, cap_free)
+
+
+def _scaled_mesh_table(vertices, faces, cap_free):
+    """
+    mesh_table of the base mesh of a ScaledHull, and its scale factors
+    (None for other meshes, and with cap_free, whose area-vector
+    columns do not scale with the volume).
+    """
+
+    if isinstance(vertices, ScaledHull) and not cap_free:
+        return mesh_table(vertices.base, None, cap_free) + (vertices.scale,)
+
+    return mesh_table(vertices, faces, cap_free) + (None,)
+
+
+def full_face_moments(F, draft, R, cap_free):
+    """
+    Signed volume and earth-frame first moment of fully submerged faces
+    from their summed table rows.
+
+    Parameters
+    ----------
+    F : ndarray (B, n)
+        Sums of _face_table rows, one row per case
+    draft : float or ndarray (B,)
+    R : ndarray (B, 3, 3)
+        Body to earth rotation of every case (row 2: waterplane normal)
+    cap_free : bool
+
+    Returns
+    -------
+    V : ndarray (B,)
+    C : ndarray (B, 3)
+    """
+
+    V = F[:, 0]
+    C = np.einsum("bij,bj->bi", R, F[:, 1:4])
+
+    if cap_free:
+        # Moving the apex from O to P = (0, 0, d) changes a face's
+        #   volume by -P.N / 3
+        #   moment by P vol_O / 4 - (P.N) s / 12 - (P.N) P / 12
+        n = R[:, 2]
+        d = np.broadcast_to(draft, V.shape)
+
+        PN = d * np.einsum("bj,bj->b", n, F[:, 4:7])
+        nN_s = np.einsum("bk,bkj->bj", n, F[:, 7:16].reshape(-1, 3, 3))
+        sPN = d[:, None] * np.einsum("bij,bj->bi", R, nN_s)
+
+        C = C - sPN / 12.0
+        C[:, 2] += d * (V - PN / 3.0) / 4.0
+        V = V - PN / 3.0
+
+    return V, C
+
+
+def partial_face_moments(P, one, b, draft, n_batch, cap_free):
+    """
+    Clip partial faces in the heeled frame and sum their moments.
+
+    Parameters
+    ----------
+    P : ndarray (K, 3, 3)
+        Heeled corners, submerged first (see _partial_corner_order)
+    one : ndarray (K, 1) of bool
+        Faces with a single submerged corner
+    b : ndarray (K,)
+        Case (row) of every face
+    draft : ndarray (B,)
+        Draft of every case
+    n_batch : int
+    cap_free : bool
+
+    Returns
+    -------
+    V : ndarray (B,)
+    C : ndarray (B, 3)
+    W : ndarray (B, 5)
+        Waterplane shoelace sums
+    start, end : ndarray (K, 3)
+        Waterline segment of every face, in face orientation
+    """
+
+    d = draft[b]
+
+    # one submerged: p1 = (s, d1), p2 = (s, d2)
+    # two submerged: p1 = (s1, d),  p2 = (s2, d)
+    p1 = intersect_edge_with_plane(
+        P[:, 0], np.where(one, P[:, 1], P[:, 2]), d
+    )
+    p2 = intersect_edge_with_plane(
+        np.where(one, P[:, 0], P[:, 1]), P[:, 2], d
+    )
+
+    # Waterline segments along the submerged boundary of each face
+    start = np.where(one, p1, p2)
+    end = np.where(one, p2, p1)
+    W = _group_sum(b, shoelace_terms(start, end), n_batch)
+
+    apex = np.zeros((len(b), 3))
+    if cap_free:
+        apex[:, 2] = d
+
+    # one: (s, p1, p2)     two: (s1, s2, p2) + (s1, p2, p1)
+    q0 = P[:, 0] - apex
+    q1 = np.where(one, p1, P[:, 1]) - apex
+    q1b = p1 - apex
+    q2 = p2 - apex
+
+    vol_a, mom_a = tetra_moments(q0, q1, q2)
+    vol_b, mom_b = tetra_moments(q0, q2, q1b)
+    vol_b = np.where(one[:, 0], 0.0, vol_b)
+    mom_b = np.where(one, 0.0, mom_b)
+
+    vol_p = vol_a + vol_b
+    mom_p = mom_a + mom_b + vol_p[:, None] * apex
+
+    V = np.bincount(b, weights=vol_p, minlength=n_batch)
+    C = _group_sum(b, mom_p, n_batch)
+
+    return V, C, W, start, end
+
+
+def cap_moments(start, end, b, draft, n_batch):
+    """
+    Moments of the waterplane cap closing every case (origin apex;
+    not needed cap-free).
+
+    Each waterline segment is closed by the triangle (end, start, c)
+    with c = (0, 0, draft) on the waterplane. The segments form closed
+    loops, so the sum is the cap for any loop shape or count, and the
+    segments can be processed in any order or chunking.
+
+    Parameters
+    ----------
+    start, end : ndarray (K, 3)
+        Heeled waterline segments (see partial_face_moments)
+    b : ndarray (K,)
+        Case of every segment
+    draft : ndarray (B,)
+    n_batch : int
+
+    Returns
+    -------
+    V : ndarray (B,)
+    C : ndarray (B, 3)
+    """
+
+    center = np.zeros((len(b), 3))
+    center[:, 2] = draft[b]
+
+    # The cap runs against the waterline segments
+    vol_c, mom_c = tetra_moments(end, start, center)
+
+    V = np.bincount(b, weights=vol_c, minlength=n_batch)
+    C = _group_sum(b, mom_c, n_batch)
+
+    return V, C
+
+
+def _sweep_moments(vertices, faces, table, draft, theta, cap_free,
+                   scale=None):
+    """
+    Signed submerged volume and first moment for a chunk of heel angles.
+
+    With cap_free the tetrahedra use the apex P = (0, 0, draft) on the
+    waterplane instead of the origin. Cap triangles then have zero
+    volume, so the waterplane is never closed.
+
+    With scale (3,) the hull is scale[None] * vertices: the factors go
+    into the rotation (R diag(scale)) and into the volume of the table
+    sums, so the scaled vertices are never formed.
+
+    Returns
+    -------
+    V : ndarray (B,)
+    C : ndarray (B, 3)
+        First moment in the heeled (earth) frame
+    W : ndarray (B, 5)
+        Waterplane shoelace sums (see waterplane.shoelace_terms)
+    """
+
+    n_batch = len(theta)
+
+    prof = profiling.active()
+    if prof:
+        t = perf_counter()
+
+    # Heeled z of every vertex: the mesh itself is never rotated
+    R = heel_matrix(theta)                           # (B, 3, 3)
+    if scale is not None:
+        R = R * scale                                # R diag(scale)
+    H = R[:, 2] @ vertices.T                         # (B, N)
+
+    if prof:
+        t = prof.lap("sweep.heights", t)
+        prof.count("bytes_allocated", H.nbytes)
+
+    # Submerged side z >= draft, as in clip.is_submerged
+    S = (H >= draft)[:, faces]                       # (B, M, 3)
+    n_sub = S.sum(axis=2)
+
+    if prof:
+        t = prof.lap("sweep.classify", t)
+        n_full = int((n_sub == 3).sum())
+        n_dry = int((n_sub == 0).sum())
+        prof.count("faces_full", n_full)
+        prof.count("faces_dry", n_dry)
+        prof.count("faces_partial", n_sub.size - n_full - n_dry)
+        prof.count("bytes_allocated", S.nbytes + n_sub.nbytes)
+
+    # --- fully submerged faces: body-frame sums, rotated ---
+    full = (n_sub == 3).astype(float)
+    F = full @ table
+    if scale is not None:
+        # Tetrahedron volume and body moment scale by det diag(scale);
+        # R diag(scale) maps the moment
+        F *= np.prod(scale)
+    V, C = full_face_moments(F, draft, R, cap_free)
+
+    if prof:
+        t = prof.lap("sweep.full_faces", t)
+        prof.count("bytes_allocated", full.nbytes)
+
+    # --- partial faces: clip in the heeled frame ---
+    b, m = np.nonzero((n_sub > 0) & (n_sub < 3))
+
+    if len(b) == 0:
+        return V, C, np.zeros((n_batch, 5))
+
+    n_part = n_sub[b, m]
+    order = _partial_corner_order(S[b, m], n_part)
+    ids = np.take_along_axis(faces[m], order, axis=1)
+
+    # Heeled corners of the partial faces only
+    P = np.einsum("kij,kcj->kci", R[b], vertices[ids])
+    P[..., 2] = H[b[:, None], ids]
+    one = (n_part == 1)[:, None]
+
+    drafts = np.full(n_batch, float(draft))
+    V_p, C_p, W, start, end = partial_face_moments(
+        P, one, b, drafts, n_batch, cap_free
+    )
+    V += V_p
+    C += C_p
+
+    if prof:
+        t = prof.lap("sweep.partial_faces", t)
+        prof.count("intersection_points", 2 * len(b))
+        prof.count("bytes_allocated", P.nbytes + start.nbytes + end.nbytes)
+
+        # Loop count (chaining is done for the count only)
+        bounds = np.flatnonzero(np.diff(b)) + 1
+        for s_k, e_k in zip(np.split(start, bounds), np.split(end, bounds)):
+            _count_loops(prof, s_k, e_k)
+
+        t = perf_counter()
+
+    if cap_free:
+        return V, C, W
+
+    # --- waterplane cap closure, per segment ---
+    V_c, C_c = cap_moments(start, end, b, drafts, n_batch)
+    V += V_c
+    C += C_c
+
+    if prof:
+        prof.lap("sweep.waterplane_cap", t)
+
+    return V, C, W
+
+
+def _group_sum(group, values, n_groups):
+    """
+    Sum rows of values (K, n) by group label.
+    """
+
+    return np.column_stack([
+        np.bincount(group, weights=values[:, k], minlength=n_groups)
+        for k in range(values.shape[1])
+    ])
+
+
+def _sweep(vertices, faces, draft, theta, memory_budget, cap_free):
+    """
+    Signed volume, first moment and waterplane sums over all angles,
+    chunked to the memory budget.
+    """
+
+    vertices, faces, table, scale = _scaled_mesh_table(
+        vertices, faces, cap_free
+    )
+
+    step = angles_per_batch(len(vertices), len(faces), memory_budget)
+
+    V = np.empty(len(theta))
+    C = np.empty((len(theta), 3))
+    W = np.empty((len(theta), 5))
+
+    for start in range(0, len(theta), step):
+        chunk = slice(start, start + step)
+        V[chunk], C[chunk], W[chunk] = _sweep_moments(
+            vertices, faces, table, draft, theta[chunk], cap_free, scale
+        )
+
+    if np.any(np.abs(V) < 1e-12):
+        raise ValueError("Computed volume is zero or very small.")
+
+    return V, C, W
+
+
+def buoyancy_sweep(vertices, faces, draft, angles_deg,
+                   memory_budget=DEFAULT_MEMORY_BUDGET, cap_free=False,
+                   backend=None):
+    """
+    Submerged volume and buoyancy centroid for every heel angle.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    draft : float
+    angles_deg : array_like (A,)
+        Heel angles in degrees
+    memory_budget : int
+        Approximate peak working memory in bytes
+    cap_free : bool
+        Integrate with the tetrahedron apex on the waterplane instead
+        of closing it with a cap (needs a closed hull surface; numpy
+        backend only)
+    backend : str, optional
+        Compute backend (see hydrostatics.backends; default: the
+        selected one). numpy runs the batched sweep of this module,
+        the others their buoyancy kernel per angle.
+
+    Returns
+    -------
+    volumes : ndarray (A,)
+    centroids : ndarray (A, 3)
+        Buoyancy centroids in the heeled (earth) frame
+    """
+
+    theta = np.deg2rad(np.atleast_1d(np.asarray(angles_deg, dtype=float)))
+
+    backend = get_backend(backend)
+
+    if backend.name != "numpy":
+        if cap_free:
+            raise ValueError("cap_free needs the numpy backend.")
+        return backend.buoyancy(vertices, faces, draft, heel_matrix(theta))
+
+    V, C, _ = _sweep(vertices, faces, draft, theta, memory_budget, cap_free)
+
+    # Use absolute volume (orientation independent)
+    return np.abs(V), C / V[:, None]
+
+
+def compute_KN_GZ(vertices, faces, KG, draft, angles_deg,
+                  memory_budget=DEFAULT_MEMORY_BUDGET, cap_free=False,
+                  backend=None):
+    """
+    KN and GZ over a heel sweep at fixed draft.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    KG : float
+    draft : float
+    angles_deg : array_like (A,)
+    memory_budget : int
+    cap_free : bool
+        See buoyancy_sweep
+    backend : str, optional
+        See buoyancy_sweep
+
+    Returns
+    -------
+    KN : ndarray (A,)
+    GZ : ndarray (A,)
+    """
+
+    angles_deg = np.asarray(angles_deg, dtype=float)
+
+    _, Bc = buoyancy_sweep(
+        vertices, faces, draft, angles_deg, memory_budget, cap_free, backend
+    )
+
+    KN = np.abs(Bc[:, 1])
+    GZ = KN - KG * np.sin(np.deg2rad(angles_deg))
+
+    return KN, GZ
+
+
+def hydrostatic_sweep(vertices, faces, draft, angles_deg, KG=None,
+                      memory_budget=DEFAULT_MEMORY_BUDGET, cap_free=False):
+    """
+    Buoyancy, waterplane and metacentric properties for every heel
+    angle, in one pass.
+
+    The waterplane comes from the waterline segments of the clip (no
+    extra clipping). BM = I / V about the waterplane centroid. KM and
+    GM are measured like KN and GZ (KN = |y_B| about the heel axis
+    through the origin, GZ = KN - KG sin(heel)), so that KM_T and GM_T
+    are the slopes of KN and GZ with heel at constant displacement:
+
+        KM_T = sign(y_B) (BM_T - z_B),    GM_T = KM_T - KG cos(heel)
+
+    with y_B, z_B the earth-frame buoyancy centroid (upright, the sign
+    is that of the first heeled step).
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+    draft : float
+    angles_deg : array_like (A,)
+    KG : float, optional
+        Adds GM_T to the result
+    memory_budget : int
+    cap_free : bool
+        See buoyancy_sweep. Both closures handle any number of
+        waterline loops (multi-hulls, split waterplanes).
+
+    Returns
+    -------
+    hydro : dict of ndarray (A,) (centroid: (A, 3))
+        volume, centroid, waterplane_area, LCF, TCF, I_T, I_L, BM_T,
+        BM_L, KN, KM_T and, with KG, GZ and GM_T
+    """
+
+    angles_deg = np.atleast_1d(np.asarray(angles_deg, dtype=float))
+    theta = np.deg2rad(angles_deg)
+
+    V, C, W = _sweep(vertices, faces, draft, theta, memory_budget, cap_free)
+
+    V_abs = np.abs(V)
+    Bc = C / V[:, None]
+    A, x_F, y_F, I_T, I_L = waterplane_from_sums(W)
+
+    BM_T = I_T / V_abs
+
+    # KN = |y_B|, and d y_B / d heel = BM_T - z_B
+    slope = BM_T - Bc[:, 2]
+    upright = np.abs(Bc[:, 1]) <= 1e-9 * np.abs(Bc).max(axis=1)
+    side = np.where(upright, np.sign(slope), np.sign(Bc[:, 1]))
+    KM_T = side * slope
+
+    hydro = {
+        "volume": V_abs,
+        "centroid": Bc,
+        "waterplane_area": A,
+        "LCF": x_F,
+        "TCF": y_F,
+        "I_T": I_T,
+        "I_L": I_L,
+        "BM_T": BM_T,
+        "BM_L": I_L / V_abs,
+        "KN": np.abs(Bc[:, 1]),
+        "KM_T": KM_T,
+    }
+
+    if KG is not None:
+        hydro["GZ"] = hydro["KN"] - KG * np.sin(theta)
+        hydro["GM_T"] = KM_T - KG * np.cos(theta)
+
+    return hydro
@@ -2,13 +2,204 @@
 Volume and centroid computation for closed triangular meshes.
 """
 
+from time import perf_counter
+
 import numpy as np
 
+from geometry.hull_mesh import HullMesh
+from utils import profiling
+
+
+def tetra_moments(v0, v1, v2):
+    """
+    Signed volume and first moment of the tetrahedra (v0, v1, v2, origin).
+
+    Parameters
+    ----------
+    v0, v1, v2 : ndarray (M, 3)
+        Triangle corners
+
+    Returns
+    -------
+    vol : ndarray (M,)
+        Signed tetrahedron volumes
+    mom : ndarray (M, 3)
+        Signed volume times tetrahedron centroid
+    """
+
+    vol = np.einsum("ij,ij->i", v0, np.cross(v1, v2)) / 6.0
+    mom = np.einsum("i,ij->ij", vol, v0 + v1 + v2) / 4.0
+
+    return vol, mom
+
 
-def volume_and_centroid(vertices, faces):
+def face_moments(vertices, faces):
+    """
+    tetra_moments of every face of a mesh.
+
+    Gathers vertices[faces] once and reduces with einsum.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+
+    Returns
+    -------
+    vol : ndarray (M,)
+    mom : ndarray (M, 3)
+    """
+
+    tri = np.asarray(vertices, dtype=float)[faces]
+
+    return tetra_moments(tri[:, 0], tri[:, 1], tri[:, 2])
+
+
+def stack_meshes(meshes):
+    """
+    Concatenate a list of (vertices, faces) meshes into one ragged batch.
+
+    Parameters
+    ----------
+    meshes : sequence of (vertices, faces)
+
+    Returns
+    -------
+    vertices : ndarray (sum N, 3)
+    faces : ndarray (sum M, 3)
+        Indices into the concatenated vertex array
+    face_offsets : ndarray (B + 1,)
+        Faces of mesh b are faces[face_offsets[b]:face_offsets[b + 1]]
+    """
+
+    n_verts = [len(v) for v, _ in meshes]
+    n_faces = [len(f) for _, f in meshes]
+
+    vertex_start = np.concatenate([[0], np.cumsum(n_verts)[:-1]])
+
+    vertices = np.vstack([np.reshape(v, (-1, 3)) for v, _ in meshes])
+    faces = np.vstack([
+        np.reshape(f, (-1, 3)) + s
+        for (_, f), s in zip(meshes, vertex_start)
+    ]).astype(np.int64)
+
+    face_offsets = np.concatenate([[0], np.cumsum(n_faces)])
+
+    return vertices, faces, face_offsets
+
+
+def _batch_moments(vertices, faces, face_offsets):
+    """
+    Per-mesh signed volume and first moment of a ragged or padded batch.
+    """
+
+    if face_offsets is not None:
+        # Ragged: faces index into one concatenated vertex array
+        face_offsets = np.asarray(face_offsets)
+        n_batch = len(face_offsets) - 1
+
+        vol, mom = face_moments(vertices, faces)
+
+        seg = np.repeat(np.arange(n_batch), np.diff(face_offsets))
+
+        V = np.bincount(seg, weights=vol, minlength=n_batch)
+        C = np.column_stack([
+            np.bincount(seg, weights=mom[:, k], minlength=n_batch)
+            for k in range(3)
+        ])
+        return V, C
+
+    # Padded: vertices (B, N, 3), faces (B, M, 3), unused faces are -1
+    vertices = np.asarray(vertices, dtype=float)
+    faces = np.asarray(faces)
+    n_batch, n_verts = vertices.shape[:2]
+
+    pad = (faces < 0).any(axis=2)
+    flat = np.where(pad[..., None], 0, faces)
+    flat = flat + (np.arange(n_batch) * n_verts)[:, None, None]
+
+    vol, mom = face_moments(vertices.reshape(-1, 3), flat.reshape(-1, 3))
+    vol = np.where(pad.ravel(), 0.0, vol).reshape(n_batch, -1)
+    mom = np.where(pad.ravel()[:, None], 0.0, mom).reshape(n_batch, -1, 3)
+
+    return vol.sum(axis=1), mom.sum(axis=1)
+
+
+def volume_and_centroid(vertices, faces, face_offsets=None, reference=None):
+    """
+    Compute volume and centroid of a closed triangular mesh.
+
+    Also accepts a batch of meshes, either ragged (concatenated arrays
+    plus face_offsets, see stack_meshes) or padded (vertices of shape
+    (B, N, 3) and faces of shape (B, M, 3) with unused rows set to -1).
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or (B, N, 3), or HullMesh
+    faces : ndarray (M, 3) or (B, M, 3), or None with a HullMesh
+    face_offsets : ndarray (B + 1,), optional
+        Face ranges of a ragged batch
+    reference : array_like (3,), optional
+        Common apex of the tetrahedra (default: origin). Faces lying in
+        a plane through the reference contribute nothing, so a mesh
+        clipped at z = draft may be left open when the reference is
+        (0, 0, draft).
+
+    Returns
+    -------
+    volume : float or ndarray (B,)
+        Volume of the solid (positive)
+    centroid : ndarray (3,) or (B, 3)
+        Centroid of the solid
+    """
+
+    prof = profiling.active()
+    if prof:
+        t0 = perf_counter()
+
+    if isinstance(vertices, HullMesh):
+        vertices, faces = vertices
+
+    batched = face_offsets is not None or np.ndim(vertices) == 3
+
+    if reference is not None:
+        reference = np.asarray(reference, dtype=float)
+        vertices = np.asarray(vertices, dtype=float) - reference
+
+    if batched:
+        V, C = _batch_moments(vertices, faces, face_offsets)
+    else:
+        vol, mom = face_moments(vertices, faces)
+        V = vol.sum()
+        C = mom.sum(axis=0)
+
+    # Use absolute volume (orientation independent)
+    V_abs = np.abs(V)
+
+    if np.any(V_abs < 1e-12):
+        raise ValueError("Computed volume is zero or very small.")
+
+    if batched:
+        centroid = C / V[:, None]
+    else:
+        centroid = C / V
+
+    if reference is not None:
+        centroid = centroid + reference
+
+    if prof:
+        prof.lap("integrate", t0)
+
+    return V_abs, centroid
+
+
+def volume_and_centroid_reference(vertices, faces):
     """
     Compute volume and centroid of a closed triangular mesh.
 
+    Readable tetrahedron-by-tetrahedron implementation, kept as the
+    reference for volume_and_centroid.
+
     Parameters
     ----------
     vertices : ndarray (N, 3)
@@ -0,0 +1,209 @@
+"""
+Waterplane properties from the waterline of the clipped hull.
+
+Every partial face contributes one directed waterline segment (along
+the boundary of its submerged part). Chained head to tail they form
+the closed waterline loops, one per separate piece of waterplane.
+Area, centroid (LCF, TCF) and second moments are shoelace sums over
+the segments; the sums do not depend on the order of the segments, so
+the batched sweep accumulates them without chaining.
+
+Transverse and longitudinal second moments are taken about axes
+through the waterplane centroid, parallel to x and y respectively.
+"""
+
+import numpy as np
+
+from hydrostatics.clip import _clip_faces
+
+
+def shoelace_terms(p, q):
+    """
+    Per-segment contributions to the waterplane integrals.
+
+    Parameters
+    ----------
+    p, q : ndarray (K, 2) or (K, 3)
+        Start and end points of directed waterline segments
+
+    Returns
+    -------
+    terms : ndarray (K, 5)
+        Contributions to int dA, int x dA, int y dA, int x^2 dA and
+        int y^2 dA (signed by loop orientation)
+    """
+
+    xp, yp = p[:, 0], p[:, 1]
+    xq, yq = q[:, 0], q[:, 1]
+
+    cross = xp * yq - xq * yp
+
+    return np.column_stack([
+        cross / 2.0,
+        (xp + xq) * cross / 6.0,
+        (yp + yq) * cross / 6.0,
+        (xp**2 + xp * xq + xq**2) * cross / 12.0,
+        (yp**2 + yp * yq + yq**2) * cross / 12.0
+    ])
+
+
+def waterplane_from_sums(W):
+    """
+    Waterplane properties from summed shoelace terms.
+
+    Parameters
+    ----------
+    W : ndarray (5,) or (B, 5)
+        Sums of shoelace_terms over all waterline segments
+
+    Returns
+    -------
+    area, x_F, y_F, I_T, I_L : float or ndarray (B,)
+        Area, centroid (LCF, TCF) and second moments about the
+        centroidal axes parallel to x (I_T) and y (I_L). All zero
+        where there is no waterplane.
+    """
+
+    W = np.asarray(W, dtype=float)
+
+    # Loop orientation follows the hull; report positive area
+    W = W * np.where(W[..., :1] < 0.0, -1.0, 1.0)
+
+    A = W[..., 0]
+    safe = np.where(A > 0.0, A, 1.0)
+
+    x_F = np.where(A > 0.0, W[..., 1] / safe, 0.0)
+    y_F = np.where(A > 0.0, W[..., 2] / safe, 0.0)
+
+    I_L = W[..., 3] - A * x_F**2
+    I_T = W[..., 4] - A * y_F**2
+
+    return A, x_F, y_F, I_T, I_L
+
+
+def waterline_loops(start, end, tol=1e-9):
+    """
+    Chain directed segments head to tail into waterline loops.
+
+    Endpoints are matched on a grid of tol times the waterline extent
+    (the clipper computes a crossing on a shared mesh edge identically
+    from both faces, up to duplicated mesh vertices), through a hash
+    map from start point to segment, so chaining is linear in the
+    number of segments. Zero-length segments are dropped.
+
+    Parameters
+    ----------
+    start, end : ndarray (K, 2) or (K, 3)
+    tol : float
+        Relative matching tolerance
+
+    Returns
+    -------
+    loops : list of ndarray
+        Segment indices of every loop, in order (an open chain if the
+        waterline is not closed)
+
+    Raises
+    ------
+    ValueError
+        If a waterline point starts or ends more than one segment
+        (loops touching or crossing there cannot be chained
+        unambiguously)
+    """
+
+    pts = np.concatenate([start, end])[:, :2]
+    scale = tol * max(np.ptp(pts, axis=0).max(), 1.0) if len(pts) else 1.0
+    grid = np.round(pts / scale).astype(np.int64)
+
+    n = len(start)
+    keep = np.flatnonzero(np.any(grid[:n] != grid[n:], axis=1))
+    if len(keep) == 0:
+        return []
+
+    heads = list(map(tuple, grid[keep].tolist()))
+    tails = list(map(tuple, grid[n + keep].tolist()))
+
+    # Start point -> segment; every point starts at most one segment
+    leaving = {}
+    for i, key in enumerate(heads):
+        if leaving.setdefault(key, i) != i:
+            raise ValueError(
+                f"Waterline point {np.asarray(key) * scale} starts more "
+                f"than one segment."
+            )
+
+    # Successor: the segment leaving the end point; every point ends
+    # at most one segment
+    n = len(keep)
+    nxt = np.full(n, -1)
+    has_prev = np.zeros(n, dtype=bool)
+
+    for i, key in enumerate(tails):
+        j = leaving.get(key, -1)
+        if j >= 0:
+            if has_prev[j]:
+                raise ValueError(
+                    f"Waterline point {np.asarray(key) * scale} ends more "
+                    f"than one segment."
+                )
+            has_prev[j] = True
+            nxt[i] = j
+
+    # Walk open chains from their first segment, then the cycles
+    first = np.concatenate([np.flatnonzero(~has_prev), np.arange(n)])
+
+    seen = np.zeros(n, dtype=bool)
+    loops = []
+
+    for i in first:
+        if seen[i]:
+            continue
+
+        loop = []
+        j = i
+        while j >= 0 and not seen[j]:
+            seen[j] = True
+            loop.append(j)
+            j = nxt[j]
+
+        loops.append(keep[loop])
+
+    return loops
+
+
+def waterplane_properties(vertices, faces, draft):
+    """
+    Waterplane of a (heeled) hull mesh at a given draft.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3)
+    faces : ndarray (M, 3)
+    draft : float
+
+    Returns
+    -------
+    wp : dict
+        area, LCF, TCF, I_T, I_L (see waterplane_from_sums) and
+        loops, the waterline loops as ordered (n, 3) point arrays
+    """
+
+    v_sub, _, edges = _clip_faces(vertices, faces, draft)
+
+    start = v_sub[edges[:, 0]]
+    end = v_sub[edges[:, 1]]
+
+    A, x_F, y_F, I_T, I_L = waterplane_from_sums(
+        shoelace_terms(start, end).sum(axis=0)
+    )
+
+    loops = [start[idx] for idx in waterline_loops(start, end)]
+
+    return {
+        "area": float(A),
+        "LCF": float(x_F),
+        "TCF": float(y_F),
+        "I_T": float(I_T),
+        "I_L": float(I_L),
+        "loops": loops,
+    }
@@ -0,0 +1,262 @@
+"""
+Mesh-free hydrostatics for the Wigley hull family.
+
+Coordinate system as in geometry.wigley (z = 0 deck, z = T keel),
+submerged side z >= draft, heel by rotation about the x-axis as in
+geometry.transform.rotate_about_x.
+
+Upright quantities are closed-form. Heeled buoyancy is integrated
+section by section: each transverse section is the parabolic region
+|y| <= a(x) (1 - (z/T)^2) clipped by the inclined waterplane, integrated
+exactly in z (piecewise Gauss between the points where the waterline
+meets the section boundary), then summed along x by Gauss-Legendre
+quadrature.
+
+Also serves as an accuracy oracle for the mesh path.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from geometry.hull import wigley_hull
+from hydrostatics.sweep import buoyancy_sweep
+
+# 3-point Gauss is exact for the (degree <= 5) section integrands
+_Z_NODES, _Z_WEIGHTS = np.polynomial.legendre.leggauss(3)
+
+
+@lru_cache(maxsize=None)
+def _gauss_legendre(n):
+    """
+    Gauss-Legendre nodes and weights on [-1, 1] (cached).
+    """
+    return np.polynomial.legendre.leggauss(n)
+
+
+def wigley_upright_hydrostatics(L, B, T, draft):
+    """
+    Closed-form upright hydrostatics of a Wigley hull.
+
+    Parameters
+    ----------
+    L, B, T : float
+        Hull length, breadth and depth (as in wigley_half_breadth)
+    draft : float
+        Waterplane position, 0 <= draft < T (submerged: z >= draft)
+
+    Returns
+    -------
+    hydro : dict
+        volume, centroid (ndarray (3,)), waterplane_area,
+        I_T / I_L (transverse / longitudinal waterplane second moments
+        about the centreline and midship), BM_T, BM_L
+    """
+
+    d = draft
+    zeta = 1.0 - (d / T) ** 2
+
+    # int (1 - (z/T)^2) dz and int z (1 - (z/T)^2) dz over [d, T]
+    Iz0 = (T - d) - (T**3 - d**3) / (3.0 * T**2)
+    Iz1 = (T**2 - d**2) / 2.0 - (T**4 - d**4) / (4.0 * T**2)
+
+    # int (1 - (2x/L)^2) dx = 2L/3
+    volume = B * (2.0 * L / 3.0) * Iz0
+    z_B = Iz1 / Iz0
+
+    # Waterplane half-breadth: (B/2) (1 - (2x/L)^2) zeta
+    waterplane_area = B * zeta * (2.0 * L / 3.0)
+    I_T = (2.0 / 3.0) * (B / 2.0) ** 3 * zeta**3 * (16.0 * L / 35.0)
+    I_L = B * zeta * L**3 / 30.0
+
+    return {
+        "volume": volume,
+        "centroid": np.array([0.0, 0.0, z_B]),
+        "waterplane_area": waterplane_area,
+        "I_T": I_T,
+        "I_L": I_L,
+        "BM_T": I_T / volume,
+        "BM_L": I_L / volume,
+    }
+
+
+def _quadratic_roots(A2, A1, A0):
+    """
+    Real roots of A2 z^2 + A1 z + A0 (linear when A2 == 0); missing
+    roots are nan. Returns an array of shape (..., 2).
+    """
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = A1**2 - 4.0 * A2 * A0
+        sq = np.sqrt(np.where(disc >= 0.0, disc, np.nan))
+        q = -0.5 * (A1 + np.where(A1 >= 0.0, sq, -sq))
+
+        r1 = np.where(A2 != 0.0, q / A2, -A0 / A1)
+        r2 = np.where(A2 != 0.0, A0 / q, np.nan)
+
+    return np.stack([r1, r2], axis=-1)
+
+
+def _section_moments(a, T, draft, c, s):
+    """
+    Area and first moments (body frame) of Wigley sections
+    |y| <= a (1 - (z/T)^2), 0 <= z <= T, clipped to s y + c z >= draft.
+
+    All inputs broadcast to a common shape (K,).
+
+    Returns
+    -------
+    area, m_y, m_z : ndarray (K,)
+    """
+
+    a, c, s = np.broadcast_arrays(a, c, s)
+
+    # Breakpoints: where the waterline meets y = +w(z) and y = -w(z)
+    roots = [
+        _quadratic_roots(-sign * s * a / T**2, c, sign * s * a - draft)
+        for sign in (1.0, -1.0)
+    ]
+    roots = np.concatenate(roots, axis=-1)
+    roots = np.where((roots > 0.0) & (roots < T), roots, 0.0)
+
+    zb = np.concatenate([
+        np.zeros(a.shape + (1,)),
+        roots,
+        np.full(a.shape + (1,), T)
+    ], axis=-1)
+    zb.sort(axis=-1)
+
+    # Gauss points on every sub-interval, shape (K, 5, 3)
+    z0 = zb[..., :-1, None]
+    h = (zb[..., 1:] - zb[..., :-1])[..., None] / 2.0
+    z = z0 + h * (_Z_NODES + 1.0)
+    wq = h * _Z_WEIGHTS
+
+    a_ = a[..., None, None]
+    c_ = c[..., None, None]
+    s_ = s[..., None, None]
+
+    w = a_ * (1.0 - (z / T) ** 2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bound = (draft - c_ * z) / s_
+
+    lo = np.where(s_ > 0.0, np.maximum(-w, bound), -w)
+    hi = np.where(s_ < 0.0, np.minimum(w, bound), w)
+    hi = np.where((s_ == 0.0) & (c_ * z < draft), -w, hi)
+
+    wet = hi > lo
+    lo = np.where(wet, lo, 0.0)
+    hi = np.where(wet, hi, 0.0)
+
+    chord = hi - lo
+
+    area = (wq * chord).sum(axis=(-2, -1))
+    m_y = (wq * (hi**2 - lo**2) / 2.0).sum(axis=(-2, -1))
+    m_z = (wq * z * chord).sum(axis=(-2, -1))
+
+    return area, m_y, m_z
+
+
+def wigley_heeled_buoyancy(L, B, T, draft, angles_deg, n_x=64):
+    """
+    Submerged volume and buoyancy centroid of a Wigley hull at heel,
+    without a mesh.
+
+    Parameters
+    ----------
+    L, B, T : float
+    draft : float
+    angles_deg : array_like (A,)
+        Heel angles in degrees
+    n_x : int
+        Gauss-Legendre points along the length
+
+    Returns
+    -------
+    volumes : ndarray (A,)
+    centroids : ndarray (A, 3)
+        Buoyancy centroids in the heeled (earth) frame, as returned by
+        hydrostatics.sweep.buoyancy_sweep
+    """
+
+    theta = np.deg2rad(np.atleast_1d(np.asarray(angles_deg, dtype=float)))
+    c = np.cos(theta)[:, None]
+    s = np.sin(theta)[:, None]
+
+    xi, wx = _gauss_legendre(n_x)
+    x = xi * L / 2.0
+    wx = wx * L / 2.0
+    a = (B / 2.0) * (1.0 - xi**2)
+
+    area, m_y, m_z = _section_moments(a[None, :], T, draft, c, s)
+
+    V = area @ wx
+    Mx = area @ (wx * x)
+    My = m_y @ wx
+    Mz = m_z @ wx
+
+    if np.any(V < 1e-12):
+        raise ValueError("Computed volume is zero or very small.")
+
+    yB = My / V
+    zB = Mz / V
+
+    c = c[:, 0]
+    s = s[:, 0]
+
+    centroids = np.column_stack([
+        Mx / V,
+        c * yB - s * zB,
+        s * yB + c * zB
+    ])
+
+    return V, centroids
+
+
+def wigley_KN(L, B, T, draft, angles_deg, n_x=64):
+    """
+    KN = |y_B| over a heel sweep, mesh-free.
+    """
+
+    _, Bc = wigley_heeled_buoyancy(L, B, T, draft, angles_deg, n_x)
+    return np.abs(Bc[:, 1])
+
+
+def coarsest_wigley_resolution(L, B, T, draft, angles_deg, tol,
+                               resolutions=((21, 21), (31, 31), (41, 41),
+                                            (61, 61), (81, 81),
+                                            (121, 121))):
+    """
+    Coarsest (NX, NZ) whose mesh KN matches the mesh-free KN within tol.
+
+    Parameters
+    ----------
+    L, B, T, draft : float
+    angles_deg : array_like (A,)
+    tol : float
+        Allowed max |KN_mesh - KN_exact| over the sweep [m]
+    resolutions : sequence of (NX, NZ)
+        Candidates, tried in order (coarsest first)
+
+    Returns
+    -------
+    (NX, NZ) : tuple or None
+        None if no candidate meets the tolerance
+    errors : list of float
+        Max KN error of every candidate tried
+    """
+
+    KN_exact = wigley_KN(L, B, T, draft, angles_deg)
+    errors = []
+
+    for NX, NZ in resolutions:
+        v, f = wigley_hull(L, B, T, NX, NZ)
+        _, Bc = buoyancy_sweep(v, f, draft, angles_deg)
+        err = np.max(np.abs(np.abs(Bc[:, 1]) - KN_exact))
+        errors.append(err)
+
+        if err <= tol:
+            return (NX, NZ), errors
+
+    return None, errors
@@ -1,11 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-from geometry.surface import sample_wigley_surface
-from geometry.mesh import triangulate_surface, mirror_mesh, close_deck, close_end
-from geometry.transform import rotate_about_x
-from hydrostatics.clip import clip_mesh_at_draft
-from hydrostatics.volume_centroid import volume_and_centroid
+from geometry.hull import wigley_hull
+from hydrostatics.sweep import compute_KN_GZ
 
 # ----------------------------
 # Hull & loading parameters
@@ -22,13 +19,7 @@ KG = 2
 NX = 61
 NZ = 61
 
-X, Y, Z = sample_wigley_surface(L, B, T, NX, NZ)
-
-v, f = triangulate_surface(X, Y, Z)
-v, f = mirror_mesh(v, f)
-v, f = close_deck(v, f)
-v, f = close_end(v, f, -L/2)
-v, f = close_end(v, f, +L/2)
+v, f = wigley_hull(L, B, T, NX, NZ)
 
 # ----------------------------
 # KN computation
@@ -41,24 +32,8 @@ v, f = close_end(v, f, +L/2)
 # Finer heel angle sampling (1 degree steps)
 angles = np.linspace(0, 30, 31)
 
-KN_vals = []
-
-for a in angles:
-    theta = np.deg2rad(a)
-    v_rot = rotate_about_x(v, theta)
-    v_sub, f_sub = clip_mesh_at_draft(v_rot, f, draft)
-    _, Bc = volume_and_centroid(v_sub, f_sub)
-    KN_vals.append(abs(Bc[1]))
-
-# ----------------------------
-# GZ computation
-# ----------------------------
-GZ_vals = []
-
-for a, kn in zip(angles, KN_vals):
-    theta = np.deg2rad(a)
-    gz = kn - KG * np.sin(theta)
-    GZ_vals.append(gz)
+# All angles rotated, clipped and integrated as one batch
+KN_vals, GZ_vals = compute_KN_GZ(v, f, KG, draft, angles)
 
 # ----------------------------
 # Print results
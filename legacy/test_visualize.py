@@ -1,7 +1,6 @@
 import numpy as np
 
-from geometry.surface import sample_wigley_surface
-from geometry.mesh import triangulate_surface, mirror_mesh, close_deck, close_end
+from geometry.hull import wigley_hull
 from geometry.transform import rotate_about_x
 from hydrostatics.clip import clip_mesh_at_draft
 from hydrostatics.volume_centroid import volume_and_centroid
@@ -14,12 +13,7 @@ theta_deg = 10.0
 theta = np.deg2rad(theta_deg)
 
 # Build hull
-X, Y, Z = sample_wigley_surface(L, B, T, 31, 31)
-v, f = triangulate_surface(X, Y, Z)
-v, f = mirror_mesh(v, f)
-v, f = close_deck(v, f)
-v, f = close_end(v, f, -L/2)
-v, f = close_end(v, f, +L/2)
+v, f = wigley_hull(L, B, T, 31, 31)
 
 # Rotate + clip
 v_rot = rotate_about_x(v, theta)
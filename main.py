@@ -6,53 +6,106 @@ Author: Samruddhi Goud
 Purpose: Research-grade 3D hydrostatics (NOT certification level)
 """
 
-import numpy as np
-import matplotlib.pyplot as plt
+from time import perf_counter
 
-from geometry.transform import rotate_about_x
-from hydrostatics.clip import clip_mesh_at_draft
-from hydrostatics.volume_centroid import volume_and_centroid
+import numpy as np
 
+from hydrostatics.criteria import IS_CODE_2008, evaluate_criteria
+from hydrostatics.sweep import compute_KN_GZ, buoyancy_sweep
+from hydrostatics.equilibrium import equilibrium_sweep
+from utils import profiling
+
+
+def compute_GZ_curve(KG, draft, mode="fixed", trim=False, LCG=0.0,
+                     hull="box"):
+    """
+    GZ curve of the hull at the given loading.
+
+    Parameters
+    ----------
+    KG : float
+    draft : float
+    mode : {"fixed", "free"}
+        "fixed": constant draft at every heel (Phase 2 assumption).
+        "free": draft re-solved at every heel so the displaced volume
+        stays that of the upright hull at `draft`.
+    trim : bool
+        In "free" mode, also solve trim against LCG.
+    LCG : float
+        Longitudinal position of G (hull frame), used when trim=True.
+    hull : str
+        Hull form of geometry.registry ("box", "wigley"), built with
+        L, B, T below.
+
+    Returns
+    -------
+    angles, KN_vals, GZ_vals : ndarray
+    info : dict
+        Per-angle "draft", "trim" (deg) and "iterations" (clip
+        evaluations). In "fixed" mode the draft is the given one, the
+        trim zero and every angle takes one clip.
+    """
+
+    prof = profiling.active()
+    if prof:
+        t0 = perf_counter()
 
-def compute_GZ_curve(KG, draft):
-  
     # ----------------------------
-    # Build full hull once
+    # Build full hull once (mesh cache)
     # ----------------------------
-    from geometry.rectangular import rectangular_hull_mesh
+    from geometry.registry import hull_mesh
 
     # ----------------------------
-    # Rectangular hull parameters
+    # Hull parameters
     # ----------------------------
     L, B, T = 100.0, 20.0, 10.0
 
-    v, f = rectangular_hull_mesh(L, B, T)
+    v, f = hull_mesh(hull, L=L, B=B, T=T)
 
     # ----------------------------
     # Heel angles
     # ----------------------------
     angles = np.linspace(0, 30, 31)  # degrees
-    KN_vals = []
-    GZ_vals = []
+
+    if mode == "fixed":
+        # ----------------------------
+        # Hydrostatics (all angles at once)
+        # ----------------------------
+        KN_vals, GZ_vals = compute_KN_GZ(v, f, KG, draft, angles)
+
+        info = {
+            "draft": np.full(len(angles), float(draft)),
+            "trim": np.zeros(len(angles)),
+            "iterations": np.ones(len(angles), dtype=int),
+        }
+
+        if prof:
+            prof.lap("compute_GZ_curve", t0)
+
+        return angles, KN_vals, GZ_vals, info
+
+    if mode != "free":
+        raise ValueError(f"Unknown mode: {mode!r}")
 
     # ----------------------------
-    # Hydrostatics loop
+    # Free-floating equilibrium
     # ----------------------------
-    for a in angles:
-        theta = np.deg2rad(a)
+    V0, _ = buoyancy_sweep(v, f, draft, [0.0])
+    G = np.array([LCG, 0.0, T - KG]) if trim else None
 
-        v_rot = rotate_about_x(v, theta)
-        v_sub, f_sub = clip_mesh_at_draft(v_rot, f, draft)
+    drafts, trims, Bc, n_eval = equilibrium_sweep(
+        v, f, V0[0], angles, draft, G=G
+    )
 
-        _, Bc = volume_and_centroid(v_sub, f_sub)
-        KN = abs(Bc[1])
+    KN_vals = np.abs(Bc[:, 1])
+    GZ_vals = KN_vals - KG * np.sin(np.deg2rad(angles))
 
-        GZ = KN - KG * np.sin(theta)
+    info = {"draft": drafts, "trim": trims, "iterations": n_eval}
 
-        KN_vals.append(KN)
-        GZ_vals.append(GZ)
+    if prof:
+        prof.lap("compute_GZ_curve", t0)
 
-    return angles, KN_vals, GZ_vals
+    return angles, KN_vals, GZ_vals, info
 
 
 def main():
@@ -61,15 +114,28 @@ def main():
     KG = float(input("Enter KG (m): "))
     draft = float(input("Enter draft (m): "))
 
-    angles, KN_vals, GZ_vals = compute_GZ_curve(KG, draft)
+    angles, KN_vals, GZ_vals, _ = compute_GZ_curve(KG, draft)
 
     print("\nAngle (deg)   KN (m)     GZ (m)")
     for a, kn, gz in zip(angles, KN_vals, GZ_vals):
         print(f"{a:6.1f}     {kn:7.4f}   {gz:7.4f}")
 
+    # ----------------------------
+    # Intact stability criteria
+    # ----------------------------
+    # nan: outside the computed heel range
+    table = evaluate_criteria(angles, GZ_vals)
+
+    print("\nCriterion         value   minimum")
+    for c, minimum in IS_CODE_2008.items():
+        status = "pass" if table[f"pass_{c}"][0] else "FAIL"
+        print(f"{c:14s} {table[c][0]:8.4f}  {minimum:8.4f}   {status}")
+
     # ----------------------------
     # Plot GZ curve
     # ----------------------------
+    import matplotlib.pyplot as plt
+
     plt.figure()
     plt.plot(angles, GZ_vals, marker='o')
     plt.axhline(0, color='k', linestyle='--')
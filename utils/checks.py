@@ -4,11 +4,74 @@ Geometry validation utilities.
 
 import numpy as np
 
+from geometry.hull_mesh import HullMesh
 
-def signed_volume(vertices, faces):
+
+def signed_volume(vertices, faces, face_offsets=None):
+    """
+    Compute signed volume of a closed triangular mesh.
+
+    Vectorized with einsum. Also accepts a ragged batch of meshes
+    (concatenated arrays plus face_offsets) or a padded batch
+    (vertices (B, N, 3), faces (B, M, 3), unused faces set to -1).
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or (B, N, 3), or HullMesh
+    faces : ndarray (M, 3) or (B, M, 3), or None with a HullMesh
+    face_offsets : ndarray (B + 1,), optional
+
+    Returns
+    -------
+    volume : float or ndarray (B,)
+        Signed volume
+    """
+
+    if isinstance(vertices, HullMesh):
+        # v0 . (v1 x v2) = 2 v0 . N with N the face area vector
+        mesh = vertices
+        v0 = mesh.vertices[mesh.faces[:, 0]]
+        vol = mesh.areas * np.einsum("ij,ij->i", v0, mesh.normals)
+        return abs(vol.sum() / 3.0)
+
+    vertices = np.asarray(vertices, dtype=float)
+    faces = np.asarray(faces)
+
+    if face_offsets is None and vertices.ndim == 3:
+        # Padded batch -> flat indices, padding rows contribute nothing
+        n_batch, n_verts = vertices.shape[:2]
+        pad = (faces < 0).any(axis=2)
+        faces = np.where(pad[..., None], 0, faces)
+        faces = faces + (np.arange(n_batch) * n_verts)[:, None, None]
+        tri = vertices.reshape(-1, 3)[faces]
+        vol = np.einsum(
+            "bij,bij->bi", tri[:, :, 0], np.cross(tri[:, :, 1], tri[:, :, 2])
+        )
+        vol = np.where(pad, 0.0, vol).sum(axis=1)
+        return np.abs(vol / 6.0)
+
+    tri = vertices[faces]
+    vol = np.einsum(
+        "ij,ij->i", tri[:, 0], np.cross(tri[:, 1], tri[:, 2])
+    )
+
+    if face_offsets is not None:
+        face_offsets = np.asarray(face_offsets)
+        n_batch = len(face_offsets) - 1
+        seg = np.repeat(np.arange(n_batch), np.diff(face_offsets))
+        vol = np.bincount(seg, weights=vol, minlength=n_batch)
+        return np.abs(vol / 6.0)
+
+    return abs(vol.sum() / 6.0)
+
+
+def signed_volume_reference(vertices, faces):
     """
     Compute signed volume of a closed triangular mesh.
 
+    Readable face-by-face implementation, kept as the reference
+    for signed_volume.
+
     Parameters
     ----------
     vertices : ndarray (N, 3)
@@ -31,3 +94,35 @@ def signed_volume(vertices, faces):
 
     return abs(vol / 6.0)
 
+
+def open_edges(vertices, faces):
+    """
+    Edges that keep a mesh from being closed and consistently oriented.
+
+    On a closed, consistently oriented surface every edge is shared by
+    exactly two faces that traverse it in opposite directions.
+
+    Parameters
+    ----------
+    vertices : ndarray (N, 3) or HullMesh
+    faces : ndarray (M, 3), or None with a HullMesh
+
+    Returns
+    -------
+    edges : ndarray (K, 2)
+        Vertex pairs of the edges used once, more than twice, or twice
+        in the same direction (empty for a watertight mesh)
+    """
+
+    mesh = vertices if isinstance(vertices, HullMesh) else HullMesh(vertices, faces)
+
+    f = mesh.faces
+    forward = f < np.roll(f, -1, axis=1)
+
+    e = mesh.face_edges.ravel()
+    uses = np.bincount(e, minlength=len(mesh.edges))
+    fwd = np.bincount(e, weights=forward.ravel(), minlength=len(mesh.edges))
+
+    bad = (uses != 2) | (fwd != 1)
+
+    return mesh.edges[bad]
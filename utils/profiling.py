@@ -0,0 +1,120 @@
+"""
+Opt-in profiling of the hydrostatics pipeline.
+
+Instrumented functions ask for the active profile once per call and do
+nothing more when there is none, so the cost with profiling off is a
+global lookup and a test. Inside a `profiling()` block they record wall
+time per stage and counters (faces by class, intersection points,
+waterline loops, bytes of the main arrays allocated):
+
+    from utils.profiling import profiling
+
+    with profiling() as prof:
+        compute_KN_GZ(v, f, KG, draft, angles)
+
+    print(prof.summary())
+    prof.to_json("profile.json")
+
+Only the calling process is profiled (not process-pool workers).
+"""
+
+import json
+from contextlib import contextmanager
+from time import perf_counter
+
+_active = None
+
+
+class Profile:
+    """
+    Stage times and counters collected in one profiling() block.
+
+    stages : dict
+        name -> [calls, seconds]
+    counters : dict
+        name -> total
+    """
+
+    __slots__ = ("stages", "counters")
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+
+    def lap(self, name, t0):
+        """
+        Add the time since t0 to a stage; returns the current time so
+        consecutive stages can chain: t = prof.lap("a", t).
+        """
+
+        t = perf_counter()
+        entry = self.stages.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += t - t0
+        return t
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def as_dict(self):
+        return {
+            "stages": {
+                name: {"calls": calls, "seconds": seconds}
+                for name, (calls, seconds) in self.stages.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, path=None):
+        """
+        JSON text of the profile; also written to path if given.
+        """
+
+        text = json.dumps(self.as_dict(), indent=1, sort_keys=True)
+        if path is not None:
+            with open(path, "w") as fh:
+                fh.write(text)
+        return text
+
+    def summary(self):
+        """
+        Flat table: stages by total time, then counters.
+        """
+
+        lines = [f"{'stage':32s} {'calls':>8s} {'total ms':>11s} "
+                 f"{'per call ms':>12s}"]
+        for name, (calls, seconds) in sorted(
+                self.stages.items(), key=lambda kv: -kv[1][1]):
+            lines.append(f"{name:32s} {calls:8d} {seconds * 1e3:11.3f} "
+                         f"{seconds * 1e3 / calls:12.4f}")
+
+        lines.append("")
+        lines.append(f"{'counter':32s} {'total':>8s}")
+        for name in sorted(self.counters):
+            lines.append(f"{name:32s} {self.counters[name]:8d}")
+
+        return "\n".join(lines)
+
+
+def active():
+    """
+    The profile being recorded, or None when profiling is off.
+    """
+
+    return _active
+
+
+@contextmanager
+def profiling():
+    """
+    Record a profile of everything run inside the block.
+    """
+
+    global _active
+
+    previous = _active
+    _active = Profile()
+    try:
+        yield _active
+    finally:
+        _active = previous
@@ -12,8 +12,7 @@ NOT a stability solver.
 
 import numpy as np
 
-from geometry.surface import sample_wigley_surface
-from geometry.mesh import triangulate_surface, mirror_mesh, close_deck, close_end
+from geometry.hull import wigley_hull
 from geometry.transform import rotate_about_x
 from hydrostatics.clip import clip_mesh_at_draft
 from hydrostatics.volume_centroid import volume_and_centroid
@@ -33,14 +32,9 @@ def main():
     NX, NZ = 61, 61
 
     # ----------------------------
-    # Build full hull
+    # Build full hull (cached)
     # ----------------------------
-    X, Y, Z = sample_wigley_surface(L, B, T, NX, NZ)
-    v, f = triangulate_surface(X, Y, Z)
-    v, f = mirror_mesh(v, f)
-    v, f = close_deck(v, f)
-    v, f = close_end(v, f, -L / 2)
-    v, f = close_end(v, f, +L / 2)
+    v, f = wigley_hull(L, B, T, NX, NZ)
 
     # ----------------------------
     # Rotate + clip